@@ -19,10 +19,26 @@ import argparse
 import random
 import time
 import csv
+import sqlite3
+import threading
+import heapq
+import itertools
+import contextlib
 from urllib.parse import urlparse, quote, urlencode
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Iterable, Callable
 from statistics import mean, median
+from collections import Counter
 from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from functools import lru_cache
+
+# Optional faster JSON parser; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ============================================================================
 # CONFIGURATION
@@ -53,32 +69,157 @@ EBAY_FEE_PCT = 0.1325  # 13.25% eBay final value fee
 PAYMENT_FEE_PCT = 0.03  # 3% payment processing fee
 SHIPPING_FLAT = 9.99  # Flat shipping cost assumption
 MIN_DELAY_SEC = 10.0
+EBAY_DAILY_CALL_LIMIT = 5000  # Browse API calls per UTC day, shared across runs (override with EBAY_DAILY_CALL_LIMIT)
+EBAY_BUDGET_DB_FILE = os.path.join('data', 'ebay_budget.sqlite')  # Per-day call counts for EBAY_DAILY_CALL_LIMIT (kept out of cache/ so clearing the cache doesn't reset it)
 RETRY_DELAYS = [30, 90]  # seconds for rate limit retries
 CACHE_TTL_SECONDS = 24 * 3600  # 24 hours (legacy, use get_cache_ttl() for status-based TTLs)
 CACHE_DIR = 'cache'
-CACHE_FILE = os.path.join(CACHE_DIR, 'ebay_cache.json')
+CACHE_DB_FILE = os.path.join(CACHE_DIR, 'ebay_cache.sqlite')
+CACHE_FILE = os.path.join(CACHE_DIR, 'ebay_cache.json')  # Legacy JSON cache, imported into CACHE_DB_FILE on first use
 CACHE_VERSION = 2  # Increment to invalidate old cache entries
+DEALS_DB_FILE = os.path.join('data', 'deals.sqlite')  # Saved scan results (legacy data/deals.json is imported on first use)
 
 # Filter thresholds
 MIN_PROFIT = 20
 MIN_ROI = 0.25
 MIN_SOLD_COUNT = 5
 
+# Per-mode scan thresholds: (min net profit, min net ROI, min sold comps)
+MODE_THRESHOLDS = {
+    'conservative': (MIN_PROFIT, MIN_ROI, 12),
+    'active': (10.0, 0.20, 8),
+    'highticket': (12.0, 0.10, 6),
+}
+
+# Low-confidence queries below this buy price are skipped before eBay analysis
+LOW_CONFIDENCE_PRICE_THRESHOLD = 30.0
+
+# Console section rulers
+RULE_EQ = "=" * 80
+RULE_DASH = "-" * 80
+
+# Warnings printed by report/upload when the run analyzed 0 items, followed by
+# EMPTY_WARN_EXIT or (with --allow-empty) EMPTY_WARN_CONTINUE
+EMPTY_WARN_REPORT = "\n".join([
+    RULE_EQ,
+    "⚠️  WARNING: Scan analyzed 0 items!",
+    RULE_EQ,
+    "",
+    "The report may contain data from previous runs, not from this scan.",
+    "This usually means:",
+    "  - The Woot feed returned no items matching your filters",
+    "  - All items were filtered out (denylist, brand filter, etc.)",
+    "  - The feed is empty or unavailable",
+    "",
+    ""
+])
+EMPTY_WARN_UPLOAD = "\n".join([
+    RULE_EQ,
+    "⚠️  WARNING: Analysis processed 0 items!",
+    RULE_EQ,
+    "",
+    ""
+])
+EMPTY_WARN_EXIT = "\n".join([
+    "Exiting with error code. Use --allow-empty to generate report anyway.",
+    RULE_EQ,
+    ""
+])
+EMPTY_WARN_CONTINUE = "\n".join([
+    "Continuing because --allow-empty flag was set.",
+    RULE_EQ,
+    "",
+    ""
+])
+
+# Sort key for results; every result that reaches a summary sort carries net_roi
+_net_roi_key = itemgetter('net_roi')
+
+# Stream-mode row for an analyzed item (matches the header printed by process_woot_mode)
+STREAM_ROW_FORMAT = "{symbol} {title:<60} | ${price:>7.2f} | ${profit:>10.2f} | {roi:>7.1%} | comps: {comps} | {status:<6} | {reason}"
+STREAM_FLUSH_LINES = 20  # Stream-mode rows written per chunk when stdout is not a terminal
+
+# Result field templates for items without usable eBay data (see _base_result)
+# No eBay data yet: skipped before lookup, throttled or out of budget
+EMPTY_EBAY_FIELDS = {
+    'ebay_sold_count': None,
+    'ebay_avg_sold_price': None,
+    'ebay_median_sold_price': None,
+    'ebay_trimmed_count': None,
+    'ebay_expected_sale_price': None,
+    'ebay_min_price': None,
+    'ebay_max_price': None,
+    'ebay_p25_price': None,
+    'ebay_p75_price': None,
+    'ebay_sample_items': None,
+    'ebay_last_sold_date': None,
+    'net_sale': 0,
+    'profit': 0,
+    'roi': 0
+}
+# Lookup finished without comps (NO_SOLD_COMPS / API_FAIL); callers pass a fresh ebay_sample_items list
+NO_COMPS_EBAY_FIELDS = {
+    'ebay_sold_count': 0,
+    'ebay_avg_sold_price': 0,
+    'ebay_median_sold_price': 0,
+    'ebay_min_price': None,
+    'ebay_max_price': None,
+    'ebay_p25_price': None,
+    'ebay_p75_price': None,
+    'ebay_last_sold_date': None,
+    'net_sale': 0,
+    'profit': 0,
+    'roi': 0
+}
+
+# Result fields shared by every failed watchlist item (see _watchlist_fail_result)
+WATCHLIST_FAIL_FIELDS = {
+    'ebay_sold_count': 0,
+    'ebay_avg_sold_price': 0,
+    'net_sale': 0,
+    'profit': 0,
+    'roi': 0,
+    'net_roi': 0,
+    'passed': False
+}
+
+# Watchlist fail_reason for each eBay lookup status that ends an item early
+STATUS_FAIL_REASONS = {
+    'NO_SOLD_COMPS': 'No sold comps found (valid search)',
+    'EBAY_THROTTLED': 'eBay throttled; try again in a few minutes',
+    'BUDGET_EXHAUSTED': 'eBay budget exhausted; run again later',
+    'API_FAIL': 'eBay API lookup failed'
+}
+
+# Accepted CSV header names for upload mode, in priority order per field
+CSV_FIELD_ALIASES = {
+    'title': ('title', 'name', 'item', 'product', 'item_name'),
+    'price': ('price', 'cost', 'buy_price', 'sale_price', 'purchase_price', 'woot_price'),
+    'url': ('url', 'link', 'source_url', 'woot_url', 'product_url'),
+    'category': ('category', 'categories', 'cat'),
+    'store': ('store', 'merchant', 'seller', 'retailer'),
+    'sku': ('sku',),
+    'image_url': ('image_url', 'image', 'imageurl', 'img_url', 'picture_url'),
+}
+
 # Keyword denylist (items with these keywords are skipped before eBay analysis)
 # Note: Multi-word phrases should come before single words that are part of them
 # (e.g., 'air filter' before 'filter')
-DENYLIST_KEYWORDS = [
+# Stored as a tuple: order matters for reporting the matched keyword, and matching is
+# substring-based on purpose (e.g. 'filter' must also catch 'filters')
+DENYLIST_KEYWORDS = (
     # Clothing/baby items
     'baby', 'kids', 'toddler', 'infant', 'socks', 'clothing', 'shirt', 'bodysuit', 'underwear',
     # Size/variant-heavy items (phrases first, then single words)
     'air filter', 'storage bin', 'wall mount', 'led strip', 'cabinet pull',
-    'filter', 'merv', 'hvac', 'organizer', 'bins', 'tote', 
+    'filter', 'merv', 'hvac', 'organizer', 'bins', 'tote',
     'shelf', 'rack', 'holder', 'curtain', 'lights'
-]
+)
 
 # Allowlist for /feed/all category (only items matching these keywords will be analyzed)
 # Used to prevent budget waste on non-flip-friendly items (beauty, supplements, seasonal, etc.)
-ALL_FEED_ALLOWLIST = [
+# Substring-based like the denylist ('tool' should still match 'tools')
+ALL_FEED_ALLOWLIST = (
     # Brands
     'milwaukee', 'dewalt', 'makita', 'ryobi', 'bosch', 'ridgid', 'kobalt', 'craftsman',
     'ego', 'greenworks', 'husky', 'klein', 'fluke', 'dremel',
@@ -86,7 +227,13 @@ ALL_FEED_ALLOWLIST = [
     'wobble', 'impact', 'drill', 'saw', 'grinder', 'ratchet', 'socket',
     'wrench', 'tool', 'battery', 'charger', 'vacuum', 'blower', 'pressure washer',
     'compressor', 'generator', 'router', 'sander', 'multimeter', 'tester', 'laser', 'level'
-]
+)
+
+# Word tokenizer for whole-word matching against titles (used by the --brands filter)
+TITLE_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Strips currency symbol and thousands separators from price strings in one pass
+PRICE_STRIP_TABLE = str.maketrans('', '', '$,')
 
 # HTTP settings
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
@@ -102,6 +249,80 @@ def log_debug(message: str):
     if DEBUG:
         print(f"[DEBUG] {message}")
 
+def json_loads(raw):
+    """Parse JSON from str/bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which json.dump can write; retry with json
+            pass
+    return json.loads(raw)
+
+def json_dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS keeps parity with json.dumps, which stringifies int/float dict keys
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+class StreamRowBuffer:
+    """
+    Collects stream-mode result rows and writes them to stdout chunk_lines at a time,
+    so a piped scan (PYTHONUNBUFFERED=1 in docker-compose) doesn't pay one write per row.
+    On a terminal every row is written as soon as it is added.
+    """
+    
+    def __init__(self, chunk_lines: int = STREAM_FLUSH_LINES):
+        self._rows = []
+        self._chunk_lines = 1 if sys.stdout.isatty() else chunk_lines
+    
+    def add(self, row: str):
+        self._rows.append(row)
+        if len(self._rows) >= self._chunk_lines:
+            self.flush()
+    
+    def flush(self):
+        """Write the collected rows to stdout."""
+        if self._rows:
+            sys.stdout.write('\n'.join(self._rows) + '\n')
+            self._rows.clear()
+            sys.stdout.flush()
+
+class ThreadCapturedStdout:
+    """
+    Stdout proxy that lets worker threads capture their own output while other
+    threads keep writing straight through to the real stdout.
+    """
+    
+    def __init__(self, target):
+        self._target = target
+        self._local = threading.local()
+    
+    def write(self, text: str) -> int:
+        captured = getattr(self._local, 'captured', None)
+        if captured is not None:
+            captured.append(text)
+        else:
+            self._target.write(text)
+        return len(text)
+    
+    def flush(self):
+        if getattr(self._local, 'captured', None) is None:
+            self._target.flush()
+    
+    @contextlib.contextmanager
+    def capture(self):
+        """Collect this thread's writes into a list for the duration of the block."""
+        self._local.captured = []
+        try:
+            yield self._local.captured
+        finally:
+            self._local.captured = None
+    
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
 def save_debug_html(store: str, index: int, html: str):
     """Save raw HTML to debug folder for inspection."""
     if not DEBUG:
@@ -318,20 +539,24 @@ def normalize_query(query: str) -> str:
     
     return normalized
 
+# Common fluff words/phrases stripped from titles before an eBay search (applied in order)
+TITLE_FLUFF_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\bnew\b', r'\bfree shipping\b', r'\bfast shipping\b',
+    r'\bfree returns\b', r'\bprime\b', r'\bamazon\b', r'\bwalmart\b',
+    r'\bofficial\b', r'\bauthentic\b', r'\bgenuine\b',
+    r'\bwith\s+\w+\s+gift\b', r'\bbundle\b'
+))
+WHITESPACE_RE = re.compile(r'\s+')
+
+@lru_cache(maxsize=8192)
 def clean_title_for_ebay(title: str) -> str:
-    """Clean product title for eBay search by removing common fluff."""
+    """Clean product title for eBay search by removing common fluff. Memoized (titles repeat across variants and reruns)."""
     # Remove common fluff words/phrases
-    fluff_patterns = [
-        r'\bnew\b', r'\bfree shipping\b', r'\bfast shipping\b',
-        r'\bfree returns\b', r'\bprime\b', r'\bamazon\b', r'\bwalmart\b',
-        r'\bofficial\b', r'\bauthentic\b', r'\bgenuine\b',
-        r'\bwith\s+\w+\s+gift\b', r'\bbundle\b'
-    ]
     cleaned = title.lower()
-    for pattern in fluff_patterns:
-        cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+    for pattern in TITLE_FLUFF_PATTERNS:
+        cleaned = pattern.sub('', cleaned)
     # Remove extra spaces and trim
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    cleaned = WHITESPACE_RE.sub(' ', cleaned).strip()
     # Limit length for eBay search
     return cleaned[:100]
 
@@ -356,6 +581,21 @@ def is_excluded_listing(title: str, price_text: str = "") -> bool:
     
     return False
 
+def split_brand_filter(brand_list: List[str]) -> Tuple[frozenset, Tuple[str, ...]]:
+    """
+    Split a --brands list into whole-word brands (matched by token set lookup)
+    and phrase brands like 'black+decker' (matched by substring).
+    """
+    brand_set = frozenset(b for b in brand_list if TITLE_TOKEN_RE.fullmatch(b))
+    brand_phrases = tuple(b for b in brand_list if b not in brand_set)
+    return brand_set, brand_phrases
+
+def title_matches_brand(title_lower: str, brand_set: frozenset, brand_phrases: Tuple[str, ...]) -> bool:
+    """Check if a lowercased title contains any of the requested brands."""
+    if brand_set and not brand_set.isdisjoint(TITLE_TOKEN_RE.findall(title_lower)):
+        return True
+    return any(phrase in title_lower for phrase in brand_phrases)
+
 # ============================================================================
 # PRODUCT PARSING
 # ============================================================================
@@ -523,7 +763,7 @@ def parse_walmart_json(json_data: dict) -> Optional[Tuple[str, float]]:
             price = float(price_candidates)
         elif isinstance(price_candidates, str):
             # Strip $ and extract numeric value
-            price_str = price_candidates.replace('$', '').replace(',', '').strip()
+            price_str = price_candidates.translate(PRICE_STRIP_TABLE).strip()
             try:
                 price = float(price_str)
             except ValueError:
@@ -542,7 +782,7 @@ def parse_walmart_json(json_data: dict) -> Optional[Tuple[str, float]]:
                     pass
             # Try priceString field
             if not price and 'priceString' in price_candidates:
-                price_str = str(price_candidates['priceString']).replace('$', '').replace(',', '').strip()
+                price_str = str(price_candidates['priceString']).translate(PRICE_STRIP_TABLE).strip()
                 try:
                     price = float(price_str)
                 except ValueError:
@@ -561,7 +801,7 @@ def parse_walmart_json(json_data: dict) -> Optional[Tuple[str, float]]:
                         except (ValueError, TypeError):
                             pass
                     if not price and 'priceString' in current_price:
-                        price_str = str(current_price['priceString']).replace('$', '').replace(',', '').strip()
+                        price_str = str(current_price['priceString']).translate(PRICE_STRIP_TABLE).strip()
                         try:
                             price = float(price_str)
                         except ValueError:
@@ -806,8 +1046,14 @@ def fetch_json_endpoint_simple(url: str) -> Optional[dict]:
         log_debug(f"Error fetching {url}: {e}")
         return None
 
-def fetch_woot_deals(category: str = 'All', limit: int = 100) -> List[Dict]:
-    """Fetch Woot deals from official Developer API. Returns list of deal dicts."""
+def fetch_woot_deals(category: str = 'All', limit: int = 100, log_lines: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Fetch Woot deals from official Developer API. Returns list of deal dicts.
+    If log_lines is given, progress messages are appended to it instead of printed
+    (used when fetching several categories concurrently).
+    """
+    emit = print if log_lines is None else log_lines.append
+    
     # Check for API key
     api_key = os.environ.get('WOOT_API_KEY', '').strip()
     if not api_key:
@@ -818,7 +1064,7 @@ def fetch_woot_deals(category: str = 'All', limit: int = 100) -> List[Dict]:
     endpoint = f"https://developer.woot.com/feed/{category}"
     
     # Print endpoint being called
-    print(f"  Calling endpoint: {endpoint}")
+    emit(f"  Calling endpoint: {endpoint}")
     
     try:
         headers = {
@@ -829,19 +1075,19 @@ def fetch_woot_deals(category: str = 'All', limit: int = 100) -> List[Dict]:
         response = requests.get(endpoint, headers=headers, timeout=TIMEOUT, allow_redirects=True)
         
         # Print HTTP status
-        print(f"  HTTP Status: {response.status_code}")
+        emit(f"  HTTP Status: {response.status_code}")
         
         if response.status_code != 200:
             # Debug: print first 200 chars of response on non-200
             error_preview = response.text[:200] if response.text else "(empty response)"
-            print(f"  Error response (first 200 chars): {error_preview}")
+            emit(f"  Error response (first 200 chars): {error_preview}")
             return []
         
         # Parse JSON response
         try:
             json_data = response.json()
         except json.JSONDecodeError as e:
-            print(f"  JSON decode error: {e}")
+            emit(f"  JSON decode error: {e}")
             return []
         
         # Extract Items list from response
@@ -851,22 +1097,22 @@ def fetch_woot_deals(category: str = 'All', limit: int = 100) -> List[Dict]:
         elif isinstance(json_data, list):
             deals = json_data
         else:
-            print(f"  Unexpected JSON structure: {type(json_data)}")
+            emit(f"  Unexpected JSON structure: {type(json_data)}")
             if DEBUG:
-                print(f"  JSON keys: {list(json_data.keys()) if isinstance(json_data, dict) else 'N/A'}")
+                emit(f"  JSON keys: {list(json_data.keys()) if isinstance(json_data, dict) else 'N/A'}")
             return []
         
         if DEBUG:
-            print(f"  Successfully fetched {len(deals)} items from API")
+            emit(f"  Successfully fetched {len(deals)} items from API")
         
         # Apply limit
         return deals[:limit]
         
     except requests.exceptions.RequestException as e:
-        print(f"  Request error: {e}")
+        emit(f"  Request error: {e}")
         return []
     except Exception as e:
-        print(f"  Unexpected error: {e}")
+        emit(f"  Unexpected error: {e}")
         return []
 
 def parse_woot_item(item: dict) -> Optional[Dict]:
@@ -941,26 +1187,26 @@ def parse_woot_item(item: dict) -> Optional[Dict]:
         log_debug(f"Error parsing Woot item: {e}")
         return None
 
-def is_non_flippable(title: str, condition: Optional[str] = None, category: Optional[str] = None) -> bool:
-    """Check if item should be filtered out (non-flippable)."""
-    title_lower = title.lower()
-    condition_lower = (condition or '').lower()
-    category_lower = (category or '').lower()
-    
-    # Filter terms
-    filter_terms = [
-        'refurbished', 'refurb', 'open box', 'open-box', 'parts only', 'for parts',
-        'parts/repair', 'broken', 'damaged', 'not working', 'accessories only',
-        'accessory', 'bundle', 'lot of', 'multi pack', 'pack of', 'set of'
-    ]
-    
-    combined_text = f"{title_lower} {condition_lower} {category_lower}"
+# Terms that mark an item as non-flippable (checked against title, condition and category)
+NONFLIPPABLE_TERMS = (
+    'refurbished', 'refurb', 'open box', 'open-box', 'parts only', 'for parts',
+    'parts/repair', 'broken', 'damaged', 'not working', 'accessories only',
+    'accessory', 'bundle', 'lot of', 'multi pack', 'pack of', 'set of'
+)
+
+def find_non_flippable_term(title: str, condition: Optional[str] = None, category: Optional[str] = None) -> Optional[str]:
+    """Return the first non-flippable term found in the item, or None."""
+    combined_text = f"{title} {condition or ''} {category or ''}".lower()
     
-    for term in filter_terms:
+    for term in NONFLIPPABLE_TERMS:
         if term in combined_text:
-            return True
+            return term
     
-    return False
+    return None
+
+def is_non_flippable(title: str, condition: Optional[str] = None, category: Optional[str] = None) -> bool:
+    """Check if item should be filtered out (non-flippable)."""
+    return find_non_flippable_term(title, condition, category) is not None
 
 # ============================================================================
 # EBAY OAUTH
@@ -976,6 +1222,28 @@ EBAY_CALLS_MADE = 0  # Track API calls made in this run
 _cache_hit_count = 0  # Track cache hits in this run
 _cache_miss_count = 0  # Track cache misses in this run
 
+# Locks so eBay lookups can run from worker threads:
+# _ebay_state_lock guards the call/cache counters and the cache database connection,
+# _ebay_pace_lock queues callers so MIN_DELAY_SEC still holds between requests,
+# _ebay_token_lock avoids several threads fetching an OAuth token at once
+_ebay_state_lock = threading.Lock()
+_ebay_pace_lock = threading.Lock()
+_ebay_token_lock = threading.Lock()
+
+# Connection to the sqlite eBay cache (opened on first use, shared by all threads under _ebay_state_lock)
+_ebay_cache_db = None
+
+# Connection to the sqlite daily eBay call counter (same sharing rules as _ebay_cache_db)
+_ebay_budget_db = None
+
+# Shared HTTP session for eBay calls (keeps the TLS connection alive between searches).
+# Created at import so lookup worker threads never race to create it
+_ebay_session = requests.Session()
+
+def get_ebay_session() -> requests.Session:
+    """Get the shared requests session used for eBay OAuth and Browse API calls."""
+    return _ebay_session
+
 def ebay_env() -> str:
     """
     Normalize EBAY_ENV environment variable to "SBX" or "PRD".
@@ -995,29 +1263,143 @@ def ebay_env() -> str:
     # Default to SBX for unrecognized values
     return "SBX"
 
-def load_ebay_cache() -> Dict[str, Dict]:
-    """Load eBay cache from disk."""
-    if not os.path.exists(CACHE_FILE):
-        return {}
+def _import_legacy_ebay_cache(conn: sqlite3.Connection):
+    """Copy entries from the old JSON cache file into a freshly created sqlite cache."""
+    try:
+        with open(CACHE_FILE, 'rb') as f:
+            legacy = json_loads(f.read())
+    except FileNotFoundError:
+        return
+    except (json.JSONDecodeError, ValueError, IOError) as e:
+        log_debug(f"Error loading legacy cache {CACHE_FILE}: {e}")
+        return
     
+    with conn:
+        conn.executemany(
+            'INSERT OR IGNORE INTO ebay_cache (qkey, entry) VALUES (?, ?)',
+            ((qkey, json_dumps(entry)) for qkey, entry in legacy.items() if isinstance(entry, dict))
+        )
+    log_debug(f"Imported {len(legacy)} entries from {CACHE_FILE} into {CACHE_DB_FILE}")
+
+def get_ebay_cache_db() -> sqlite3.Connection:
+    """
+    Get the sqlite eBay cache connection, creating the database on first use
+    (and again if the cache file was deleted to clear the cache).
+    WAL mode lets a scan and the API server read the cache while the other writes.
+    Callers must hold _ebay_state_lock.
+    """
+    global _ebay_cache_db
+    if _ebay_cache_db is not None and not os.path.exists(CACHE_DB_FILE):
+        _ebay_cache_db.close()
+        _ebay_cache_db = None
+    if _ebay_cache_db is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        conn = sqlite3.connect(CACHE_DB_FILE, timeout=30, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS ebay_cache (qkey TEXT PRIMARY KEY, entry BLOB NOT NULL)')
+        if conn.execute('SELECT 1 FROM ebay_cache LIMIT 1').fetchone() is None:
+            _import_legacy_ebay_cache(conn)
+        _ebay_cache_db = conn
+    return _ebay_cache_db
+
+def get_ebay_cache_entry(qkey: str) -> Optional[Dict]:
+    """Look up one eBay cache entry by query key. Returns None if absent or unreadable."""
+    try:
+        with _ebay_state_lock:
+            row = get_ebay_cache_db().execute('SELECT entry FROM ebay_cache WHERE qkey = ?', (qkey,)).fetchone()
+    except sqlite3.Error as e:
+        log_debug(f"Error reading cache: {e}")
+        return None
+    if row is None:
+        return None
     try:
-        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
-        log_debug(f"Error loading cache: {e}")
-        return {}
+        return json_loads(row[0])
+    except (json.JSONDecodeError, ValueError) as e:
+        log_debug(f"Error decoding cache entry {qkey}: {e}")
+        return None
 
-def save_ebay_cache(cache: Dict[str, Dict]):
-    """Save eBay cache to disk."""
-    # Create cache directory if it doesn't exist
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    
+def put_ebay_cache_entry(qkey: str, entry: Dict):
+    """Store (insert or replace) one entry in the eBay cache."""
     try:
-        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2)
-    except IOError as e:
+        with _ebay_state_lock:
+            conn = get_ebay_cache_db()
+            with conn:
+                conn.execute('INSERT OR REPLACE INTO ebay_cache (qkey, entry) VALUES (?, ?)', (qkey, json_dumps(entry)))
+    except sqlite3.Error as e:
         log_debug(f"Error saving cache: {e}")
 
+def _utc_day() -> str:
+    """Return the current UTC date as YYYY-MM-DD (the key for the daily eBay call count)."""
+    return time.strftime('%Y-%m-%d', time.gmtime())
+
+def get_ebay_budget_db() -> sqlite3.Connection:
+    """
+    Get the sqlite connection holding per-day eBay call counts, creating the database
+    on first use. Counts from earlier days are dropped when it is opened.
+    Callers must hold _ebay_state_lock.
+    """
+    global _ebay_budget_db
+    if _ebay_budget_db is not None and not os.path.exists(EBAY_BUDGET_DB_FILE):
+        _ebay_budget_db.close()
+        _ebay_budget_db = None
+    if _ebay_budget_db is None:
+        os.makedirs(os.path.dirname(EBAY_BUDGET_DB_FILE), exist_ok=True)
+        conn = sqlite3.connect(EBAY_BUDGET_DB_FILE, timeout=30, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS ebay_daily_calls (day TEXT PRIMARY KEY, calls INTEGER NOT NULL)')
+        with conn:
+            conn.execute('DELETE FROM ebay_daily_calls WHERE day < ?', (_utc_day(),))
+        _ebay_budget_db = conn
+    return _ebay_budget_db
+
+def _daily_ebay_call_limit() -> int:
+    """Return the daily eBay call limit from EBAY_DAILY_CALL_LIMIT (falls back to the default)."""
+    raw = os.environ.get('EBAY_DAILY_CALL_LIMIT')
+    if not raw:
+        return EBAY_DAILY_CALL_LIMIT
+    try:
+        limit = int(raw)
+    except ValueError:
+        limit = -1
+    if limit < 0:
+        log_debug(f"Invalid EBAY_DAILY_CALL_LIMIT={raw!r}; using {EBAY_DAILY_CALL_LIMIT}")
+        return EBAY_DAILY_CALL_LIMIT
+    return limit
+
+def reserve_daily_ebay_call() -> bool:
+    """
+    Count one eBay call against the daily quota. Returns False (nothing counted) if
+    today's calls have already reached the limit. The check and increment are a single
+    sqlite statement, so successive or parallel runs share the quota without losing counts.
+    Callers must hold _ebay_state_lock.
+    """
+    daily_limit = _daily_ebay_call_limit()
+    if daily_limit <= 0:
+        return False
+    try:
+        conn = get_ebay_budget_db()
+        with conn:
+            cursor = conn.execute(
+                'INSERT INTO ebay_daily_calls (day, calls) VALUES (?, 1) '
+                'ON CONFLICT(day) DO UPDATE SET calls = calls + 1 WHERE calls < ?',
+                (_utc_day(), daily_limit)
+            )
+    except sqlite3.Error as e:
+        # Don't block the scan on a counter error; the per-run EBAY_MAX_CALLS cap still applies
+        log_debug(f"Error updating {EBAY_BUDGET_DB_FILE}: {e}")
+        return True
+    return cursor.rowcount > 0
+
+def release_daily_ebay_call():
+    """Give back a call reserved with reserve_daily_ebay_call that was never sent. Callers must hold _ebay_state_lock."""
+    try:
+        conn = get_ebay_budget_db()
+        with conn:
+            conn.execute('UPDATE ebay_daily_calls SET calls = calls - 1 WHERE day = ? AND calls > 0', (_utc_day(),))
+    except sqlite3.Error as e:
+        log_debug(f"Error updating {EBAY_BUDGET_DB_FILE}: {e}")
+
 def get_cache_ttl(status: str) -> int:
     """
     Get cache TTL in seconds based on status.
@@ -1057,9 +1439,9 @@ def print_ebay_diagnostics():
             return value  # Too short to redact
         return f"{value[:keep_start]}...{value[-keep_end:]}"
     
-    print("=" * 80)
+    print(RULE_EQ)
     print("eBay API Diagnostics")
-    print("=" * 80)
+    print(RULE_EQ)
     print()
     
     # EBAY_ENV
@@ -1122,7 +1504,7 @@ def print_ebay_diagnostics():
     else:
         print("OAuth Token: Not loaded")
     print()
-    print("=" * 80)
+    print(RULE_EQ)
     print()
 
 def get_ebay_app_token() -> Optional[str]:
@@ -1164,7 +1546,7 @@ def get_ebay_app_token() -> Optional[str]:
     
     try:
         # Use HTTP Basic Auth: requests automatically encodes client_id:client_secret
-        response = requests.post(
+        response = get_ebay_session().post(
             token_url,
             data=urlencode(data),
             headers=headers,
@@ -1232,18 +1614,41 @@ def search_ebay_sold_browse(query: str, no_retry: bool = False, original_title:
             'status': 'API_FAIL'
         }
     
+    def _ret_budget_exhausted():
+        result = {
+            'sold_count': 0,
+            'avg_price': 0.0,
+            'median_price': 0.0,
+            'min_price': 0.0,
+            'max_price': 0.0,
+            'p25_price': 0.0,
+            'p75_price': 0.0,
+            'sample_items': [],
+            'last_sold_date': None,
+            'status': 'BUDGET_EXHAUSTED'
+        }
+        # Save to cache with current timestamp
+        if not no_cache:
+            put_ebay_cache_entry(qkey, {
+                'ts': time.time(),
+                'sold_count': 0,
+                'avg': 0.0,
+                'median': 0.0,
+                'status': 'BUDGET_EXHAUSTED'
+            })
+        return result
+    
     # Normalize query key for caching (include version to invalidate old cache)
     qkey = f"v{CACHE_VERSION}:{normalize_query(query)}"
     
     # Check disk cache first (unless no_cache is True)
     if no_cache:
         print("[CACHE] bypassed (no-cache enabled)")
-        cache = {}
+        cache_entry = None
     else:
-        cache = load_ebay_cache()
+        cache_entry = get_ebay_cache_entry(qkey)
     cache_hit = False
-    if not no_cache and qkey in cache:
-        cache_entry = cache[qkey]
+    if cache_entry is not None:
         cache_ts = cache_entry.get('ts', 0)
         current_ts = time.time()
         age = current_ts - cache_ts
@@ -1260,7 +1665,8 @@ def search_ebay_sold_browse(query: str, no_retry: bool = False, original_title:
             if cache_status in valid_cache_statuses:
                 # Cache hit - return cached values
                 print("[CACHE] hit")
-                _cache_hit_count += 1
+                with _ebay_state_lock:
+                    _cache_hit_count += 1
                 status_map = {
                     'OK': 'SUCCESS',
                     'NO_SOLD_COMPS': 'NO_SOLD_COMPS',
@@ -1303,41 +1709,35 @@ def search_ebay_sold_browse(query: str, no_retry: bool = False, original_title:
             else:
                 # Cache contains stale/invalid status - treat as miss and retry
                 print(f"[CACHE] stale/invalid (status: {cache_status})")
-                _cache_miss_count += 1
+                with _ebay_state_lock:
+                    _cache_miss_count += 1
                 # Fall through to network call path
     else:
-        _cache_miss_count += 1
+        with _ebay_state_lock:
+            _cache_miss_count += 1
     
     # Check budget
     max_calls = int(os.environ.get('EBAY_MAX_CALLS', '8'))
-    if EBAY_CALLS_MADE >= max_calls:
-        result = {
-            'sold_count': 0,
-            'avg_price': 0.0,
-            'median_price': 0.0,
-            'min_price': 0.0,
-            'max_price': 0.0,
-            'p25_price': 0.0,
-            'p75_price': 0.0,
-            'sample_items': [],
-            'last_sold_date': None,
-            'status': 'BUDGET_EXHAUSTED'
-        }
-        # Save to cache with current timestamp
-        if not no_cache:
-            cache[qkey] = {
-                'ts': time.time(),
-                'sold_count': 0,
-                'avg': 0.0,
-                'median': 0.0,
-                'status': 'BUDGET_EXHAUSTED'
-            }
-            save_ebay_cache(cache)
-        return result
+    with _ebay_state_lock:
+        budget_exhausted = EBAY_CALLS_MADE >= max_calls
+        if not budget_exhausted:
+            # Reserve this call in the run and daily budgets now so concurrent lookups can't overshoot them
+            if reserve_daily_ebay_call():
+                EBAY_CALLS_MADE += 1
+            else:
+                log_debug("Daily eBay call limit reached")
+                budget_exhausted = True
+    if budget_exhausted:
+        return _ret_budget_exhausted()
     
     # Get OAuth token
-    token = get_ebay_app_token()
+    with _ebay_token_lock:
+        token = get_ebay_app_token()
     if not token:
+        # No request will be sent - give the reserved call back to the budgets
+        with _ebay_state_lock:
+            EBAY_CALLS_MADE -= 1
+            release_daily_ebay_call()
         return _ret_api_error("OAuth token fetch failed")
     
     # Normalize environment and get base URLs
@@ -1381,53 +1781,51 @@ def search_ebay_sold_browse(query: str, no_retry: bool = False, original_title:
         'X-EBAY-C-MARKETPLACE-ID': marketplace_id
     }
     
-    # Increment call counter before making request
-    EBAY_CALLS_MADE += 1
-    
     # Retry logic for rate limiting (2 retries)
     max_retries = 2
     resp = None
     
     for attempt in range(max_retries + 1):  # initial attempt + 2 retries = 3 total
-        # Enforce delay before request (only for actual network calls, not cache hits)
-        # Only enforce on first attempt to avoid delaying retries
-        if attempt == 0:
-            current_time = time.time()
-            elapsed = current_time - LAST_EBAY_CALL_TS
-            
-            # In --one mode (no_retry=True), use EBAY_MIN_DELAY_SEC if set, otherwise use MIN_DELAY_SEC
-            min_delay_to_use = MIN_DELAY_SEC
-            if no_retry:
-                ebay_min_delay_str = os.getenv("EBAY_MIN_DELAY_SEC", "15")
-                try:
-                    min_delay_to_use = float(ebay_min_delay_str)
-                except (ValueError, TypeError):
-                    min_delay_to_use = 15.0  # fallback to default
+        # Hold the pacing lock while waiting so concurrent callers take turns
+        with _ebay_pace_lock:
+            # Enforce delay before request (only for actual network calls, not cache hits)
+            # Only enforce on first attempt to avoid delaying retries
+            if attempt == 0:
+                current_time = time.time()
+                elapsed = current_time - LAST_EBAY_CALL_TS
+                
+                # In --one mode (no_retry=True), use EBAY_MIN_DELAY_SEC if set, otherwise use MIN_DELAY_SEC
+                min_delay_to_use = MIN_DELAY_SEC
+                if no_retry:
+                    ebay_min_delay_str = os.getenv("EBAY_MIN_DELAY_SEC", "15")
+                    try:
+                        min_delay_to_use = float(ebay_min_delay_str)
+                    except (ValueError, TypeError):
+                        min_delay_to_use = 15.0  # fallback to default
+                
+                if elapsed < min_delay_to_use:
+                    sleep_time = min_delay_to_use - elapsed
+                    delay_source = "EBAY_MIN_DELAY_SEC" if no_retry else "MIN_DELAY_SEC"
+                    print(f"eBay: sleeping {sleep_time:.1f}s before request ({delay_source})")
+                    time.sleep(sleep_time)
             
-            if elapsed < min_delay_to_use:
-                sleep_time = min_delay_to_use - elapsed
-                delay_source = "EBAY_MIN_DELAY_SEC" if no_retry else "MIN_DELAY_SEC"
-                print(f"eBay: sleeping {sleep_time:.1f}s before request ({delay_source})")
-                time.sleep(sleep_time)
-        
-        # Update timestamp right before sending request
-        LAST_EBAY_CALL_TS = time.time()
+            # Update timestamp right before sending request
+            LAST_EBAY_CALL_TS = time.time()
         
         try:
-            resp = requests.get(api_url, params=params, headers=headers, timeout=30)
+            resp = get_ebay_session().get(api_url, params=params, headers=headers, timeout=30)
         except Exception as e:
             print(f"[EBAY_API_ERROR] EXCEPTION: {type(e).__name__}: {e}")
             result = _ret_api_error(f"request exception: {e}")
             # Save API_FAIL to cache
             if not no_cache:
-                cache[qkey] = {
+                put_ebay_cache_entry(qkey, {
                     'ts': time.time(),
                     'sold_count': 0,
                     'avg': 0.0,
                     'median': 0.0,
                     'status': 'API_FAIL'
-                }
-                save_ebay_cache(cache)
+                })
             return result
         
         # Check for rate limit errors (HTTP 429 or body indicates rate limit)
@@ -1467,6 +1865,12 @@ def search_ebay_sold_browse(query: str, no_retry: bool = False, original_title:
                 backoff = RETRY_DELAYS[attempt]
                 print(f"[EBAY_THROTTLED] backing off {backoff}s (attempt {attempt + 1}/{max_retries + 1})")
                 time.sleep(backoff)
+                # The retry is another Browse request, so it counts against the daily quota too
+                with _ebay_state_lock:
+                    retry_reserved = reserve_daily_ebay_call()
+                if not retry_reserved:
+                    log_debug("Daily eBay call limit reached before retry")
+                    return _ret_budget_exhausted()
                 continue
             else:
                 # Final attempt failed - save throttled status to cache
@@ -1483,14 +1887,13 @@ def search_ebay_sold_browse(query: str, no_retry: bool = False, original_title:
                     'status': 'EBAY_THROTTLED'
                 }
                 if not no_cache:
-                    cache[qkey] = {
+                    put_ebay_cache_entry(qkey, {
                         'ts': time.time(),
                         'sold_count': 0,
                         'avg': 0.0,
                         'median': 0.0,
                         'status': 'EBAY_THROTTLED'
-                    }
-                    save_ebay_cache(cache)
+                    })
                 return result
         
         # If not rate limited, check for other HTTP errors
@@ -1501,14 +1904,13 @@ def search_ebay_sold_browse(query: str, no_retry: bool = False, original_title:
             result = _ret_api_error(f"HTTP {resp.status_code}")
             # Save API_FAIL to cache
             if not no_cache:
-                cache[qkey] = {
+                put_ebay_cache_entry(qkey, {
                     'ts': time.time(),
                     'sold_count': 0,
                     'avg': 0.0,
                     'median': 0.0,
                     'status': 'API_FAIL'
-                }
-                save_ebay_cache(cache)
+                })
             return result
         
         # If we get here, response is valid (not rate limited, HTTP 200) - break out of retry loop
@@ -1537,14 +1939,13 @@ def search_ebay_sold_browse(query: str, no_retry: bool = False, original_title:
             }
             # Store in cache before returning
             if not no_cache:
-                cache[qkey] = {
+                put_ebay_cache_entry(qkey, {
                     'ts': time.time(),
                     'sold_count': 0,
                     'avg': 0.0,
                     'median': 0.0,
                     'status': 'NO_SOLD_COMPS'
-                }
-                save_ebay_cache(cache)
+                })
             return result
         
         # Extract size from original title if filter-like (for size matching)
@@ -1663,7 +2064,7 @@ def search_ebay_sold_browse(query: str, no_retry: bool = False, original_title:
             }
             # Store in cache before returning (full payload)
             if not no_cache:
-                cache[qkey] = {
+                put_ebay_cache_entry(qkey, {
                     'ts': time.time(),
                     'sold_count': sold_count,
                     'avg': avg_price,
@@ -1678,8 +2079,7 @@ def search_ebay_sold_browse(query: str, no_retry: bool = False, original_title:
                     'sample_items': sample_items[:3],
                     'last_sold_date': last_sold_date,
                     'status': 'OK' if status == 'SUCCESS' else status
-                }
-                save_ebay_cache(cache)
+                })
             return result
         else:
             # No prices extracted - treat as no sold comps
@@ -1697,7 +2097,7 @@ def search_ebay_sold_browse(query: str, no_retry: bool = False, original_title:
             }
             # Store in cache before returning
             if not no_cache:
-                cache[qkey] = {
+                put_ebay_cache_entry(qkey, {
                     'ts': time.time(),
                     'sold_count': 0,
                     'avg': 0.0,
@@ -1709,8 +2109,7 @@ def search_ebay_sold_browse(query: str, no_retry: bool = False, original_title:
                     'sample_items': [],
                     'last_sold_date': None,
                     'status': 'NO_SOLD_COMPS'
-                }
-                save_ebay_cache(cache)
+                })
             return result
             
     except (json.JSONDecodeError, KeyError, TypeError) as e:
@@ -1720,14 +2119,13 @@ def search_ebay_sold_browse(query: str, no_retry: bool = False, original_title:
         result = _ret_api_error(f"parse error: {e}")
         # Save API_FAIL to cache
         if not no_cache:
-            cache[qkey] = {
+            put_ebay_cache_entry(qkey, {
                 'ts': time.time(),
                 'sold_count': 0,
                 'avg': 0.0,
                 'median': 0.0,
                 'status': 'API_FAIL'
-            }
-            save_ebay_cache(cache)
+            })
         return result
 
 def search_ebay_sold(query: str, no_retry: bool = False, original_title: Optional[str] = None, no_cache: bool = False) -> Dict[str, Any]:
@@ -1755,6 +2153,11 @@ def evaluate_deal(net_profit: float, net_roi: float, trimmed_count: int, min_net
     status is 'PASS', 'FAIL', or 'SKIP'
     fail_reason is None for PASS, otherwise a short code with measured vs required values.
     """
+    # Most deals either clear every threshold or miss on profit/ROI; settle the all-clear case
+    # without building the failure list
+    if net_profit >= min_net_profit and net_roi >= min_net_roi and trimmed_count >= min_sold_comps:
+        return ('PASS', None)
+    
     fails = []
     if net_profit < min_net_profit:
         fails.append(f"FAIL_MIN_NET_PROFIT ({net_profit:.2f} < {min_net_profit:.2f})")
@@ -1763,9 +2166,9 @@ def evaluate_deal(net_profit: float, net_roi: float, trimmed_count: int, min_net
     if trimmed_count < min_sold_comps:
         fails.append(f"FAIL_MIN_COMPS ({trimmed_count} < {min_sold_comps})")
     
-    if fails:
-        return ('FAIL', "; ".join(fails))
-    return ('PASS', None)
+    # NaN metrics fail the fast-path comparisons without failing any check above;
+    # they pass, as they did before the fast path
+    return ('FAIL', "; ".join(fails)) if fails else ('PASS', None)
 
 def calculate_metrics(buy_price: float, expected_sale_price: float, trimmed_count: int, min_profit: Optional[float] = None, min_roi: Optional[float] = None, min_sold_comps: Optional[int] = None, ebay_fee_pct: float = EBAY_FEE_PCT, payment_fee_pct: float = PAYMENT_FEE_PCT, shipping_flat: float = SHIPPING_FLAT) -> Dict:
     """Calculate arbitrage metrics using expected sale price (median) and determine PASS/FAIL."""
@@ -1778,13 +2181,17 @@ def calculate_metrics(buy_price: float, expected_sale_price: float, trimmed_coun
     gross_profit = expected_sale_price - buy_price
     fees = expected_sale_price * (ebay_fee_pct + payment_fee_pct)
     net_profit = gross_profit - fees - shipping_flat
-    net_roi = net_profit / buy_price if buy_price > 0 else 0
     
     # Legacy calculations (kept for backward compatibility)
     ebay_fees = expected_sale_price * EBAY_FEE_RATE
     net_sale = expected_sale_price - ebay_fees - SHIPPING_BUFFER - MISC_BUFFER
     profit = net_sale - buy_price
-    roi = profit / buy_price if buy_price > 0 else 0
+    
+    if buy_price > 0:
+        net_roi = net_profit / buy_price
+        roi = profit / buy_price
+    else:
+        net_roi = roi = 0
     
     # Evaluate deal against thresholds
     status, fail_reason = evaluate_deal(net_profit, net_roi, trimmed_count, effective_min_profit, effective_min_roi, effective_min_sold_comps)
@@ -1800,13 +2207,77 @@ def calculate_metrics(buy_price: float, expected_sale_price: float, trimmed_coun
         'roi': roi,  # Legacy
         'passed': passed,
         'fail_reason': fail_reason,
-        'status': 'passed' if status == 'PASS' else 'failed'  # 'passed' or 'failed'
+        'status': 'passed' if passed else 'failed'  # 'passed' or 'failed'
     }
 
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
 
+def _base_result(title: str, buy_price: float, url: Optional[str], category: Optional[str], source_category: str, mode: str, fee_settings: Dict, status: str, reason: str, fail_reason: Optional[str], **fields) -> Dict:
+    """
+    Build a non-passing scan result. Status-specific eBay fields are passed as keyword
+    arguments (usually one of the *_EBAY_FIELDS templates).
+    """
+    result = {
+        'title': title,
+        'buy_price': buy_price,
+        'url': url,
+        'category': category,
+        'source_category': source_category
+    }
+    result.update(fields)
+    result['passed'] = False
+    result['status'] = status
+    result['reason'] = reason
+    result['fail_reason'] = fail_reason
+    result['mode'] = mode
+    result['fee_settings'] = fee_settings
+    return result
+
+def _low_confidence_ebay_fields(ebay_result: Dict) -> Dict:
+    """eBay fields for a LOW_CONFIDENCE_COMPS result (comps found, but too few after trimming)."""
+    return {
+        'ebay_sold_count': ebay_result.get('sold_count', 0),
+        'ebay_avg_sold_price': ebay_result.get('avg_price', 0.0),
+        'ebay_median_sold_price': ebay_result.get('median_price', 0.0),
+        'ebay_trimmed_count': ebay_result.get('trimmed_count', 0),
+        'ebay_expected_sale_price': ebay_result.get('expected_sale_price', 0.0),
+        'ebay_min_price': ebay_result.get('min_price'),
+        'ebay_max_price': ebay_result.get('max_price'),
+        'ebay_p25_price': ebay_result.get('p25_price'),
+        'ebay_p75_price': ebay_result.get('p75_price'),
+        'ebay_sample_items': ebay_result.get('sample_items', []),
+        'ebay_last_sold_date': ebay_result.get('last_sold_date'),
+        'confidence_reason': ebay_result.get('confidence_reason'),
+        'net_sale': 0,
+        'profit': 0,
+        'roi': 0
+    }
+
+def render_passed_results(passed_results: List[Dict], buy_label: str = 'Buy Price', skip_missing: bool = False) -> str:
+    """
+    Render the "PASSED" results section as one string (written with a single stdout write).
+    Lists every item by Net ROI, highest first.
+    skip_missing omits avg price / sold count / URL lines when those fields are empty (upload mode).
+    """
+    ordered = sorted(passed_results, key=_net_roi_key, reverse=True)
+    lines = [f"✓ PASSED ({len(passed_results)} items):", RULE_DASH]
+    append = lines.append
+    for result in ordered:
+        append(f"Title: {result['title']}")
+        append(f"  {buy_label}: ${result['buy_price']:.2f}")
+        if not skip_missing or result.get('ebay_avg_sold_price'):
+            append(f"  Avg Sold Price: ${result['ebay_avg_sold_price']:.2f}")
+        append(f"  Net Profit: ${result.get('net_profit', 0):.2f}")
+        append(f"  Net ROI: {result.get('net_roi', 0):.2%}")
+        if not skip_missing or result.get('ebay_sold_count') is not None:
+            append(f"  Sold Count: {result['ebay_sold_count']}")
+        if not skip_missing or result.get('url'):
+            append(f"  URL: {result['url']}")
+        append("")
+    return "\n".join(lines) + "\n"
+
 def process_woot_mode(category: str = 'Tools', limit: int = 10, resume: bool = False, stream: bool = False, brands: Optional[str] = None, mode: str = 'conservative', ebay_fee_pct: float = EBAY_FEE_PCT, payment_fee_pct: float = PAYMENT_FEE_PCT, shipping_flat: float = SHIPPING_FLAT, no_cache: bool = False) -> List[Dict]:
     """
     Process Woot deals (default mode). Returns list of result dictionaries.
@@ -1814,7 +2285,7 @@ def process_woot_mode(category: str = 'Tools', limit: int = 10, resume: bool = F
     Args:
         category: Woot category to fetch (single category or comma-separated list, e.g. "Tools,Electronics")
         limit: Max items to fetch
-        resume: If True, only process items from deals.json where status='pending' and ebay_* is None
+        resume: If True, only process saved deals where status='pending' and ebay_* is None
         stream: If True, stream results live
         brands: Comma-separated list of brands to filter (case-insensitive)
         mode: Scan mode ('conservative', 'active', or 'highticket')
@@ -1831,22 +2302,19 @@ def process_woot_mode(category: str = 'Tools', limit: int = 10, resume: bool = F
     brand_list = None
     if brands:
         brand_list = [b.strip().lower() for b in brands.split(',') if b.strip()]
+        brand_set, brand_phrases = split_brand_filter(brand_list)
     
     # Determine thresholds based on mode (using net profit/ROI)
-    if mode == 'active':
-        scan_min_net_profit = 10.0
-        scan_min_net_roi = 0.20
-        scan_min_sold_comps = 8
-    elif mode == 'highticket':
-        scan_min_net_profit = 12.0
-        scan_min_net_roi = 0.10
-        scan_min_sold_comps = 6
-    else:  # conservative (default)
-        scan_min_net_profit = MIN_PROFIT
-        scan_min_net_roi = MIN_ROI
-        scan_min_sold_comps = 12
-    
-    print("=" * 80)
+    scan_min_net_profit, scan_min_net_roi, scan_min_sold_comps = MODE_THRESHOLDS.get(mode, MODE_THRESHOLDS['conservative'])
+    
+    # Fee settings recorded on each result (one dict shared by all results of this run)
+    fee_settings = {
+        'ebay_fee_pct': ebay_fee_pct,
+        'payment_fee_pct': payment_fee_pct,
+        'shipping_flat': shipping_flat
+    }
+    
+    print(RULE_EQ)
     print("Woot → eBay Sold Arbitrage Checker")
     if no_cache:
         print("[CACHE] bypassed (no-cache enabled)")
@@ -1856,27 +2324,21 @@ def process_woot_mode(category: str = 'Tools', limit: int = 10, resume: bool = F
     if brand_list:
         print(f"Brand filter: {', '.join(brand_list)}")
     print(f"Fee settings: ebay_fee_pct={ebay_fee_pct:.4f}, payment_fee_pct={payment_fee_pct:.4f}, shipping_flat=${shipping_flat:.2f}")
-    print("=" * 80)
+    print(RULE_EQ)
     print()
     
-    # Resume mode: load pending items from deals.json
+    # Resume mode: load pending items from the deals database
     if resume:
         existing_deals = load_deals_from_file()
-        pending_items = []
-        for deal in existing_deals:
-            if deal.get('status') == 'pending' and deal.get('ebay_sold_count') is None:
-                # Convert deal dict back to format that can be processed
-                pending_items.append({
-                    'title': deal.get('title'),
-                    'sale_price': deal.get('buy_price'),
-                    'url': deal.get('url'),
-                    'category': deal.get('category'),
-                    'condition': None  # May not be in saved deals
-                })
+        # Saved deal rows are processed as-is (see the resume branch of the main loop)
+        pending_items = [
+            deal for deal in existing_deals
+            if deal.get('status') == 'pending' and deal.get('ebay_sold_count') is None
+        ]
         if not pending_items:
-            print("No pending items found in deals.json")
+            print("No pending items found in saved deals")
             return []
-        print(f"Resume mode: Processing {len(pending_items)} pending items from deals.json")
+        print(f"Resume mode: Processing {len(pending_items)} pending items from saved deals")
         print()
         woot_items = pending_items
         fetched_count = len(woot_items)
@@ -1913,6 +2375,8 @@ def process_woot_mode(category: str = 'Tools', limit: int = 10, resume: bool = F
                 parsed_item = parse_woot_item(item)
                 if not parsed_item:
                     continue
+                # Keep the parsed form on the raw item so the main loop doesn't parse it again
+                item['_parsed'] = parsed_item
                 
                 title = parsed_item['title']
                 sale_price = parsed_item['sale_price']
@@ -1931,7 +2395,7 @@ def process_woot_mode(category: str = 'Tools', limit: int = 10, resume: bool = F
                 
                 # Apply brand filter if specified
                 if brand_list:
-                    if not any(brand in title_lower for brand in brand_list):
+                    if not title_matches_brand(title_lower, brand_set, brand_phrases):
                         pre_skipped_brand += 1
                         continue
                 
@@ -1951,7 +2415,6 @@ def process_woot_mode(category: str = 'Tools', limit: int = 10, resume: bool = F
                 # Check low confidence skip
                 confidence_info = build_query_confidence(title)
                 query_confidence = confidence_info['confidence']
-                LOW_CONFIDENCE_PRICE_THRESHOLD = 30.0
                 if query_confidence == "low" and sale_price < LOW_CONFIDENCE_PRICE_THRESHOLD:
                     pre_skipped_low_confidence += 1
                     continue
@@ -1991,8 +2454,16 @@ def process_woot_mode(category: str = 'Tools', limit: int = 10, resume: bool = F
             if is_multi_category:
                 print(f"Fetching Woot deals from {len(categories)} categories: {', '.join(categories)}...")
                 all_fetched_items = []
-                for cat in categories:
-                    items = fetch_woot_deals(category=cat, limit=limit)
+                # Fetch all categories concurrently; map() keeps results in category order
+                fetch_logs = {cat: [] for cat in categories}
+                with ThreadPoolExecutor(max_workers=len(categories)) as executor:
+                    fetched = list(executor.map(
+                        lambda cat: fetch_woot_deals(category=cat, limit=limit, log_lines=fetch_logs[cat]),
+                        categories
+                    ))
+                for cat, items in zip(categories, fetched):
+                    for line in fetch_logs[cat]:
+                        print(line)
                     if items:
                         # Attach source_category to each item
                         for item in items:
@@ -2016,6 +2487,7 @@ def process_woot_mode(category: str = 'Tools', limit: int = 10, resume: bool = F
                     parsed_item = parse_woot_item(item)
                     if not parsed_item:
                         continue
+                    item['_parsed'] = parsed_item
                     
                     url = parsed_item.get('url')
                     title = parsed_item.get('title', '').strip().lower()
@@ -2074,11 +2546,7 @@ def process_woot_mode(category: str = 'Tools', limit: int = 10, resume: bool = F
     skipped_keyword_count = 0
     skipped_brand_count = 0
     analyzed_count = 0
-    ebay_ok_count = 0
-    ebay_no_sold_comps_count = 0
-    ebay_throttled_count = 0
-    ebay_budget_exhausted_count = 0
-    ebay_api_fail_count = 0
+    ebay_status_counts = Counter()  # eBay lookup outcomes by status
     failed_criteria_count = 0
     passed_count = 0
     cache_hit_count = 0
@@ -2094,406 +2562,237 @@ def process_woot_mode(category: str = 'Tools', limit: int = 10, resume: bool = F
     results = []
     analyzed_index = 0
     
-    # Print stream header if in stream mode
+    # Print stream header if in stream mode; result rows go through stream_rows, which
+    # writes them in chunks and is flushed on throttle/budget stops and when the loop ends
+    stream_rows = None
     if stream:
+        stream_rows = StreamRowBuffer()
         print("  Title" + " " * 54 + "| Buy      | Net Profit | Net ROI | Comps | Status | Reason")
         print("-" * 100)
     
-    # Process each Woot item
-    for idx, item in enumerate(woot_items, 1):
-        # In resume mode, items are already parsed
-        if resume:
-            title = item['title']
-            sale_price = item['sale_price']
-            url = item['url']
-            item_category = item.get('category')
-            condition = item.get('condition')
-            source_category = item.get('source_category', 'Unknown')
-        else:
-            # Parse Woot item
-            parsed_item = parse_woot_item(item)
-            if not parsed_item:
-                log_debug(f"Skipping malformed item {idx}")
+    try:
+        # Process each Woot item
+        for idx, item in enumerate(woot_items, 1):
+            # In resume mode, items are saved deal rows (already parsed)
+            if resume:
+                title = item.get('title')
+                sale_price = item.get('buy_price')
+                url = item.get('url')
+                item_category = item.get('category')
+                condition = None  # Not stored in saved deals
+                source_category = item.get('source_category', 'Unknown')
+            else:
+                # Parse Woot item (reuse the pre-filter/de-dup parse when available)
+                parsed_item = item.get('_parsed') or parse_woot_item(item)
+                if not parsed_item:
+                    log_debug(f"Skipping malformed item {idx}")
+                    continue
+                
+                title = parsed_item['title']
+                sale_price = parsed_item['sale_price']
+                url = parsed_item['url']
+                item_category = parsed_item.get('category')
+                condition = parsed_item.get('condition')
+                source_category = item.get('source_category', 'Unknown')  # Extract source_category from raw item
+            
+            # Filter out non-flippable items
+            filter_term = find_non_flippable_term(title, condition, item_category)
+            if filter_term:
+                log_debug(f"Filtered out non-flippable: {title[:50]}")
+                filtered_nonflippable_count += 1
+                skip_reason = f"SKIP_NONFLIPPABLE (keyword={filter_term})"
+                results.append(_base_result(
+                    title, sale_price, url, item_category, source_category, mode, fee_settings,
+                    'skipped', 'SKIP_NONFLIPPABLE', skip_reason
+                ))
                 continue
             
-            title = parsed_item['title']
-            sale_price = parsed_item['sale_price']
-            url = parsed_item['url']
-            item_category = parsed_item.get('category')
-            condition = parsed_item.get('condition')
-            source_category = item.get('source_category', 'Unknown')  # Extract source_category from raw item
-        
-        # Filter out non-flippable items
-        if is_non_flippable(title, condition, item_category):
-            log_debug(f"Filtered out non-flippable: {title[:50]}")
-            filtered_nonflippable_count += 1
-            # Find matching keyword for reason
+            # Filter out low ASP items (buy_price < $20)
+            if sale_price < 20.00:
+                log_debug(f"Skipped low ASP item (<$20): {title}")
+                skipped_low_asp_count += 1
+                skip_reason = f"SKIP_LOW_ASP (${sale_price:.2f} < $20.00)"
+                results.append(_base_result(
+                    title, sale_price, url, item_category, source_category, mode, fee_settings,
+                    'skipped', 'SKIP_LOW_ASP', skip_reason
+                ))
+                continue
+            
+            # Filter out non-arbitrage categories (keyword denylist)
             title_lower = title.lower()
-            condition_lower = (condition or '').lower()
-            category_lower = (item_category or '').lower()
-            combined_text = f"{title_lower} {condition_lower} {category_lower}"
-            filter_term = None
-            for term in ['refurbished', 'refurb', 'open box', 'open-box', 'parts only', 'for parts', 'parts/repair', 'broken', 'damaged', 'not working', 'accessories only', 'accessory', 'bundle', 'lot of', 'multi pack', 'pack of', 'set of']:
-                if term in combined_text:
-                    filter_term = term
-                    break
-            skip_reason = f"SKIP_NONFLIPPABLE (keyword={filter_term or 'matched'})"
-            results.append({
-                'title': title,
-                'buy_price': sale_price,
-                'url': url,
-                'category': item_category,
-                'source_category': source_category,
-                'passed': False,
-                'status': 'skipped',
-                'reason': 'SKIP_NONFLIPPABLE',
-                'fail_reason': skip_reason,
-                'mode': mode,
-                'fee_settings': {
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                }
-            })
-            continue
-        
-        # Filter out low ASP items (buy_price < $20)
-        if sale_price < 20.00:
-            log_debug(f"Skipped low ASP item (<$20): {title}")
-            skipped_low_asp_count += 1
-            skip_reason = f"SKIP_LOW_ASP (${sale_price:.2f} < $20.00)"
-            results.append({
-                'title': title,
-                'buy_price': sale_price,
-                'url': url,
-                'category': item_category,
-                'source_category': source_category,
-                'passed': False,
-                'status': 'skipped',
-                'reason': 'SKIP_LOW_ASP',
-                'fail_reason': skip_reason,
-                'mode': mode,
-                'fee_settings': {
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                }
-            })
-            continue
-        
-        # Filter out non-arbitrage categories (keyword denylist)
-        title_lower = title.lower()
-        if any(keyword in title_lower for keyword in DENYLIST_KEYWORDS):
-            log_debug(f"Skipped keyword denylist: {title}")
-            skipped_keyword_count += 1
-            # Find matching keyword
-            matched_keyword = next((kw for kw in DENYLIST_KEYWORDS if kw in title_lower), 'matched')
-            skip_reason = f"SKIP_DENYLIST_KEYWORD (keyword={matched_keyword})"
-            results.append({
+            if any(keyword in title_lower for keyword in DENYLIST_KEYWORDS):
+                log_debug(f"Skipped keyword denylist: {title}")
+                skipped_keyword_count += 1
+                # Find matching keyword
+                matched_keyword = next((kw for kw in DENYLIST_KEYWORDS if kw in title_lower), 'matched')
+                skip_reason = f"SKIP_DENYLIST_KEYWORD (keyword={matched_keyword})"
+                results.append(_base_result(
+                    title, sale_price, url, item_category, source_category, mode, fee_settings,
+                    'skipped', 'SKIP_DENYLIST_KEYWORD', skip_reason
+                ))
+                continue
+            
+            # Apply brand filter if specified
+            if brand_list:
+                if not title_matches_brand(title_lower, brand_set, brand_phrases):
+                    log_debug(f"Skipped brand filter: {title}")
+                    skipped_brand_count += 1
+                    skip_reason = f"SKIP_BRAND_FILTER (brand list={','.join(brand_list)})"
+                    results.append(_base_result(
+                        title, sale_price, url, item_category, source_category, mode, fee_settings,
+                        'skipped', 'SKIP_BRAND_FILTER', skip_reason
+                    ))
+                    continue
+            
+            # Build query confidence score
+            confidence_info = build_query_confidence(title)
+            query_confidence = confidence_info['confidence']
+            confidence_reasons = confidence_info['reasons']
+            normalized_query = confidence_info['query']
+            
+            # Print confidence info (suppress in stream mode to reduce noise)
+            if not stream:
+                reasons_str = ", ".join(confidence_reasons) if confidence_reasons else "none"
+                print(f" [CONF] {query_confidence} ({reasons_str}) query='{normalized_query[:50]}'")
+            
+            # Skip LOW confidence items only if buy_price < 30
+            if query_confidence == "low" and sale_price < LOW_CONFIDENCE_PRICE_THRESHOLD:
+                skip_reason = f"SKIP_LOW_CONFIDENCE (confidence=low, price=${sale_price:.2f} < ${LOW_CONFIDENCE_PRICE_THRESHOLD:.2f})"
+                results.append(_base_result(
+                    title, sale_price, url, item_category, source_category, mode, fee_settings,
+                    'skipped', 'SKIP_LOW_CONFIDENCE', skip_reason,
+                    confidence=query_confidence, confidence_reasons=confidence_reasons, **EMPTY_EBAY_FIELDS
+                ))
+                if stream:
+                    stream_rows.add(f"✗ {title[:60]:<60} | ${sale_price:>7.2f} | SKIPPED (low confidence)")
+                else:
+                    print(f" → Skipped (low confidence + low price)")
+                continue
+            
+            # Size check for filters: if filter-like but no size, mark as NEEDS_SIZE
+            if is_filter_like(title):
+                woot_size = extract_filter_size(title)
+                if woot_size is None:
+                    results.append(_base_result(
+                        title, sale_price, url, item_category, source_category, mode, fee_settings,
+                        'failed', 'NEEDS_SIZE', 'Filter product requires size specification',
+                        confidence_reason=None, **EMPTY_EBAY_FIELDS
+                    ))
+                    if stream:
+                        stream_rows.add(f"✗ {title[:60]:<60} | ${sale_price:>7.2f} | FAIL (needs size)")
+                    else:
+                        print(f" → FAIL: Needs size specification")
+                    continue
+            
+            # Item passed all filters - analyze it
+            analyzed_count += 1
+            analyzed_index += 1
+            # Progress label, printed together with the lookup outcome (one line per item)
+            item_label = None if stream else f"[{analyzed_index}] {title[:60]}... | ${sale_price:.2f}"
+            
+            # Search eBay sold listings using API (pass original title for size matching)
+            # Saved rows carry the query they were searched with; older rows fall back to cleaning the title
+            search_query = (resume and item.get('ebay_query')) or clean_title_for_ebay(title)
+            ebay_result = search_ebay_sold(search_query, original_title=title, no_cache=no_cache)
+            
+            # Handle different statuses
+            ebay_status = ebay_result['status']
+            ebay_status_counts[ebay_status] += 1
+            if ebay_status == 'SUCCESS':
+                # Continue to metrics calculation below
+                pass
+            elif ebay_status == 'NO_SOLD_COMPS':
+                results.append(_base_result(
+                    title, sale_price, url, item_category, source_category, mode, fee_settings,
+                    'failed', 'NO_SOLD_COMPS', 'No sold comps found (valid search)',
+                    ebay_query=search_query, ebay_sample_items=[], **NO_COMPS_EBAY_FIELDS
+                ))
+                if stream:
+                    stream_rows.add(f"✗ {title[:60]:<60} | ${sale_price:>7.2f} | NO_SOLD_COMPS")
+                else:
+                    print(f"{item_label} → No sold comps found (valid search)")
+                continue
+            elif ebay_status == 'EBAY_THROTTLED':
+                results.append(_base_result(
+                    title, sale_price, url, item_category, source_category, mode, fee_settings,
+                    'pending', 'EBAY_THROTTLED', 'eBay throttled; try again in a few minutes',
+                    ebay_query=search_query, **EMPTY_EBAY_FIELDS
+                ))
+                if stream:
+                    stream_rows.add(f"✗ {title[:60]:<60} | ${sale_price:>7.2f} | THROTTLED (stopping)")
+                    stream_rows.flush()
+                else:
+                    print(f"{item_label} → eBay throttled; stopping scan early (cooldown). Run again later.")
+                # Break immediately - do not process remaining items
+                break
+            elif ebay_status == 'BUDGET_EXHAUSTED':
+                results.append(_base_result(
+                    title, sale_price, url, item_category, source_category, mode, fee_settings,
+                    'pending', 'BUDGET_EXHAUSTED', 'eBay budget exhausted; run again later',
+                    ebay_query=search_query, **EMPTY_EBAY_FIELDS
+                ))
+                if stream:
+                    stream_rows.add(f"✗ {title[:60]:<60} | ${sale_price:>7.2f} | BUDGET_EXHAUSTED")
+                    stream_rows.flush()
+                else:
+                    print(f"{item_label} → eBay budget exhausted; run again later")
+                continue
+            elif ebay_status == 'API_FAIL':
+                results.append(_base_result(
+                    title, sale_price, url, item_category, source_category, mode, fee_settings,
+                    'failed', 'API_FAIL', 'eBay API lookup failed',
+                    ebay_query=search_query, ebay_sample_items=[], **NO_COMPS_EBAY_FIELDS
+                ))
+                if stream:
+                    stream_rows.add(f"✗ {title[:60]:<60} | ${sale_price:>7.2f} | API_FAIL")
+                else:
+                    print(f"{item_label} → FAIL: eBay API lookup failed")
+                continue
+            
+            # Check for LOW_CONFIDENCE_COMPS status
+            if ebay_status == 'LOW_CONFIDENCE_COMPS':
+                confidence_reason = ebay_result.get('confidence_reason', 'Low confidence comps')
+                results.append(_base_result(
+                    title, sale_price, url, item_category, source_category, mode, fee_settings,
+                    'failed', 'LOW_CONFIDENCE_COMPS', confidence_reason,
+                    ebay_query=search_query, **_low_confidence_ebay_fields(ebay_result)
+                ))
+                if stream:
+                    stream_rows.add(f"✗ {title[:60]:<60} | ${sale_price:>7.2f} | LOW_CONFIDENCE_COMPS")
+                else:
+                    print(f"{item_label} → FAIL: {confidence_reason}")
+                continue
+            
+            # SUCCESS status - proceed with metrics calculation
+            sold_count = ebay_result['sold_count']
+            avg_price = ebay_result.get('avg_price', 0.0)
+            median_price = ebay_result.get('median_price', 0.0)
+            expected_sale_price = ebay_result.get('expected_sale_price', median_price)
+            trimmed_count = ebay_result.get('trimmed_count', sold_count)
+            
+            if not stream:
+                print(f"{item_label} → eBay: {trimmed_count} trimmed from {sold_count} @ ${expected_sale_price:.2f} expected")
+            
+            # Calculate metrics using expected_sale_price (median)
+            metrics = calculate_metrics(sale_price, expected_sale_price, trimmed_count, min_profit=scan_min_net_profit, min_roi=scan_min_net_roi, min_sold_comps=scan_min_sold_comps, ebay_fee_pct=ebay_fee_pct, payment_fee_pct=payment_fee_pct, shipping_flat=shipping_flat)
+            passed = metrics['passed']
+            fail_reason = metrics.get('fail_reason')
+            net_profit = metrics['net_profit']
+            net_roi = metrics['net_roi']
+            
+            result = {
                 'title': title,
                 'buy_price': sale_price,
                 'url': url,
                 'category': item_category,
                 'source_category': source_category,
-                'passed': False,
-                'status': 'skipped',
-                'reason': 'SKIP_DENYLIST_KEYWORD',
-                'fail_reason': skip_reason,
-                'mode': mode,
-                'fee_settings': {
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                }
-            })
-            continue
-        
-        # Apply brand filter if specified
-        if brand_list:
-            if not any(brand in title_lower for brand in brand_list):
-                log_debug(f"Skipped brand filter: {title}")
-                skipped_brand_count += 1
-                skip_reason = f"SKIP_BRAND_FILTER (brand list={','.join(brand_list)})"
-                results.append({
-                    'title': title,
-                    'buy_price': sale_price,
-                    'url': url,
-                    'category': item_category,
-                    'source_category': source_category,
-                    'passed': False,
-                    'status': 'skipped',
-                    'reason': 'SKIP_BRAND_FILTER',
-                    'fail_reason': skip_reason,
-                    'mode': mode,
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                })
-                continue
-        
-        # Build query confidence score
-        confidence_info = build_query_confidence(title)
-        query_confidence = confidence_info['confidence']
-        confidence_reasons = confidence_info['reasons']
-        normalized_query = confidence_info['query']
-        
-        # Print confidence info (suppress in stream mode to reduce noise)
-        if not stream:
-            reasons_str = ", ".join(confidence_reasons) if confidence_reasons else "none"
-            print(f" [CONF] {query_confidence} ({reasons_str}) query='{normalized_query[:50]}'")
-        
-        # Skip LOW confidence items only if buy_price < 30
-        LOW_CONFIDENCE_PRICE_THRESHOLD = 30.0
-        if query_confidence == "low" and sale_price < LOW_CONFIDENCE_PRICE_THRESHOLD:
-            skip_reason = f"SKIP_LOW_CONFIDENCE (confidence=low, price=${sale_price:.2f} < ${LOW_CONFIDENCE_PRICE_THRESHOLD:.2f})"
-            results.append({
-                'title': title,
-                'buy_price': sale_price,
-                'url': url,
-                'category': item_category,
-                'source_category': source_category,
-                'confidence': query_confidence,
-                'confidence_reasons': confidence_reasons,
-                'ebay_sold_count': None,
-                'ebay_avg_sold_price': None,
-                'ebay_median_sold_price': None,
-                'ebay_trimmed_count': None,
-                'ebay_expected_sale_price': None,
-                'ebay_min_price': None,
-                'ebay_max_price': None,
-                'ebay_p25_price': None,
-                'ebay_p75_price': None,
-                'ebay_sample_items': None,
-                'ebay_last_sold_date': None,
-                'net_sale': 0,
-                'profit': 0,
-                'roi': 0,
-                'passed': False,
-                'status': 'skipped',
-                'reason': 'SKIP_LOW_CONFIDENCE',
-                'fail_reason': skip_reason,
-                'mode': mode,
-                'fee_settings': {
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                }
-            })
-            if stream:
-                print(f"✗ {title[:60]:<60} | ${sale_price:>7.2f} | SKIPPED (low confidence)")
-            else:
-                print(f" → Skipped (low confidence + low price)")
-            continue
-        
-        # Size check for filters: if filter-like but no size, mark as NEEDS_SIZE
-        if is_filter_like(title):
-            woot_size = extract_filter_size(title)
-            if woot_size is None:
-                results.append({
-                    'title': title,
-                    'buy_price': sale_price,
-                    'url': url,
-                    'category': item_category,
-                    'source_category': source_category,
-                    'ebay_sold_count': None,
-                    'ebay_avg_sold_price': None,
-                    'ebay_median_sold_price': None,
-                    'ebay_trimmed_count': None,
-                    'ebay_expected_sale_price': None,
-                    'ebay_min_price': None,
-                    'ebay_max_price': None,
-                    'ebay_p25_price': None,
-                    'ebay_p75_price': None,
-                    'ebay_sample_items': None,
-                    'ebay_last_sold_date': None,
-                    'confidence_reason': None,
-                    'net_sale': 0,
-                    'profit': 0,
-                    'roi': 0,
-                    'passed': False,
-                    'status': 'failed',
-                    'reason': 'NEEDS_SIZE',
-                    'fail_reason': 'Filter product requires size specification',
-                    'mode': mode,
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                })
-                if stream:
-                    print(f"✗ {title[:60]:<60} | ${sale_price:>7.2f} | FAIL (needs size)")
-                else:
-                    print(f" → FAIL: Needs size specification")
-                continue
-        
-        # Item passed all filters - analyze it
-        analyzed_count += 1
-        analyzed_index += 1
-        if not stream:
-            print(f"[{analyzed_index}] {title[:60]}... | ${sale_price:.2f}", end='')
-        
-        # Search eBay sold listings using API (pass original title for size matching)
-        # Use normalized query from confidence_info for consistency
-        search_query = clean_title_for_ebay(title)
-        ebay_result = search_ebay_sold(search_query, original_title=title, no_cache=no_cache)
-        
-        # Handle different statuses
-        if ebay_result['status'] == 'SUCCESS':
-            ebay_ok_count += 1
-            # Continue to metrics calculation below
-        elif ebay_result['status'] == 'NO_SOLD_COMPS':
-            ebay_no_sold_comps_count += 1
-            results.append({
-                'title': title,
-                'buy_price': sale_price,
-                'url': url,
-                'category': item_category,
-                'source_category': source_category,
-                'ebay_sold_count': 0,
-                'ebay_avg_sold_price': 0,
-                'ebay_median_sold_price': 0,
-                'ebay_min_price': None,
-                'ebay_max_price': None,
-                'ebay_p25_price': None,
-                'ebay_p75_price': None,
-                'ebay_sample_items': [],
-                'ebay_last_sold_date': None,
-                'net_sale': 0,
-                'profit': 0,
-                'roi': 0,
-                'passed': False,
-                'status': 'failed',
-                'reason': 'NO_SOLD_COMPS',
-                'fail_reason': 'No sold comps found (valid search)',
-                'mode': mode,
-                'fee_settings': {
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                }
-            })
-            if stream:
-                print(f"✗ {title[:60]:<60} | ${sale_price:>7.2f} | NO_SOLD_COMPS")
-            else:
-                print(f" → No sold comps found (valid search)")
-            continue
-        elif ebay_result['status'] == 'EBAY_THROTTLED':
-            ebay_throttled_count += 1
-            results.append({
-                'title': title,
-                'buy_price': sale_price,
-                'url': url,
-                'category': item_category,
-                'source_category': source_category,
-                'ebay_sold_count': None,
-                'ebay_avg_sold_price': None,
-                'ebay_median_sold_price': None,
-                'ebay_min_price': None,
-                'ebay_max_price': None,
-                'ebay_p25_price': None,
-                'ebay_p75_price': None,
-                'ebay_sample_items': None,
-                'ebay_last_sold_date': None,
-                'net_sale': 0,
-                'profit': 0,
-                'roi': 0,
-                'passed': False,
-                'status': 'pending',
-                'reason': 'EBAY_THROTTLED',
-                'fail_reason': 'eBay throttled; try again in a few minutes',
-                'mode': mode,
-                'fee_settings': {
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                }
-            })
-            if stream:
-                print(f"✗ {title[:60]:<60} | ${sale_price:>7.2f} | THROTTLED (stopping)")
-            else:
-                print(f" → eBay throttled; stopping scan early (cooldown). Run again later.")
-            # Break immediately - do not process remaining items
-            break
-        elif ebay_result['status'] == 'BUDGET_EXHAUSTED':
-            ebay_budget_exhausted_count += 1
-            results.append({
-                'title': title,
-                'buy_price': sale_price,
-                'url': url,
-                'category': item_category,
-                'source_category': source_category,
-                'ebay_sold_count': None,
-                'ebay_avg_sold_price': None,
-                'ebay_median_sold_price': None,
-                'ebay_min_price': None,
-                'ebay_max_price': None,
-                'ebay_p25_price': None,
-                'ebay_p75_price': None,
-                'ebay_sample_items': None,
-                'ebay_last_sold_date': None,
-                'net_sale': 0,
-                'profit': 0,
-                'roi': 0,
-                'passed': False,
-                'status': 'pending',
-                'reason': 'BUDGET_EXHAUSTED',
-                'fail_reason': 'eBay budget exhausted; run again later',
-                'mode': mode,
-                'fee_settings': {
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                }
-            })
-            if stream:
-                print(f"✗ {title[:60]:<60} | ${sale_price:>7.2f} | BUDGET_EXHAUSTED")
-            else:
-                print(f" → eBay budget exhausted; run again later")
-            continue
-        elif ebay_result['status'] == 'API_FAIL':
-            ebay_api_fail_count += 1
-            results.append({
-                'title': title,
-                'buy_price': sale_price,
-                'url': url,
-                'category': item_category,
-                'source_category': source_category,
-                'ebay_sold_count': 0,
-                'ebay_avg_sold_price': 0,
-                'ebay_median_sold_price': 0,
-                'ebay_min_price': None,
-                'ebay_max_price': None,
-                'ebay_p25_price': None,
-                'ebay_p75_price': None,
-                'ebay_sample_items': [],
-                'ebay_last_sold_date': None,
-                'net_sale': 0,
-                'profit': 0,
-                'roi': 0,
-                'passed': False,
-                'status': 'failed',
-                'reason': 'API_FAIL',
-                'fail_reason': 'eBay API lookup failed',
-                'mode': mode
-            })
-            if stream:
-                print(f"✗ {title[:60]:<60} | ${sale_price:>7.2f} | API_FAIL")
-            else:
-                print(f" → FAIL: eBay API lookup failed")
-            continue
-        
-        # Check for LOW_CONFIDENCE_COMPS status
-        if ebay_result['status'] == 'LOW_CONFIDENCE_COMPS':
-            results.append({
-                'title': title,
-                'buy_price': sale_price,
-                'url': url,
-                'category': item_category,
-                'source_category': source_category,
-                'ebay_sold_count': ebay_result.get('sold_count', 0),
-                'ebay_avg_sold_price': ebay_result.get('avg_price', 0.0),
-                'ebay_median_sold_price': ebay_result.get('median_price', 0.0),
-                'ebay_trimmed_count': ebay_result.get('trimmed_count', 0),
-                'ebay_expected_sale_price': ebay_result.get('expected_sale_price', 0.0),
+                'ebay_query': search_query,
+                'ebay_sold_count': sold_count,
+                'ebay_avg_sold_price': avg_price,
+                'ebay_median_sold_price': median_price,
+                'ebay_trimmed_count': trimmed_count,
+                'ebay_expected_sale_price': expected_sale_price,
+                'sold_count_used': trimmed_count,  # Number of sold comps actually used after trimming
                 'ebay_min_price': ebay_result.get('min_price'),
                 'ebay_max_price': ebay_result.get('max_price'),
                 'ebay_p25_price': ebay_result.get('p25_price'),
@@ -2501,90 +2800,46 @@ def process_woot_mode(category: str = 'Tools', limit: int = 10, resume: bool = F
                 'ebay_sample_items': ebay_result.get('sample_items', []),
                 'ebay_last_sold_date': ebay_result.get('last_sold_date'),
                 'confidence_reason': ebay_result.get('confidence_reason'),
-                'net_sale': 0,
-                'profit': 0,
-                'roi': 0,
-                'passed': False,
-                'status': 'failed',
-                'reason': 'LOW_CONFIDENCE_COMPS',
-                'fail_reason': ebay_result.get('confidence_reason', 'Low confidence comps'),
-                'mode': mode
-            })
-            if stream:
-                print(f"✗ {title[:60]:<60} | ${sale_price:>7.2f} | LOW_CONFIDENCE_COMPS")
-            else:
-                print(f" → FAIL: {ebay_result.get('confidence_reason', 'Low confidence comps')}")
-            continue
-        
-        # SUCCESS status - proceed with metrics calculation
-        sold_count = ebay_result['sold_count']
-        expected_sale_price = ebay_result.get('expected_sale_price', ebay_result.get('median_price', 0.0))
-        trimmed_count = ebay_result.get('trimmed_count', sold_count)
-        
-        if not stream:
-            print(f" → eBay: {trimmed_count} trimmed from {sold_count} @ ${expected_sale_price:.2f} expected")
-        
-        # Calculate metrics using expected_sale_price (median)
-        metrics = calculate_metrics(sale_price, expected_sale_price, trimmed_count, min_profit=scan_min_net_profit, min_roi=scan_min_net_roi, min_sold_comps=scan_min_sold_comps, ebay_fee_pct=ebay_fee_pct, payment_fee_pct=payment_fee_pct, shipping_flat=shipping_flat)
-        
-        result = {
-            'title': title,
-            'buy_price': sale_price,
-            'url': url,
-            'category': item_category,
-            'source_category': source_category,
-            'ebay_sold_count': sold_count,
-            'ebay_avg_sold_price': ebay_result.get('avg_price', 0.0),
-            'ebay_median_sold_price': ebay_result.get('median_price', 0.0),
-            'ebay_trimmed_count': trimmed_count,
-            'ebay_expected_sale_price': expected_sale_price,
-            'sold_count_used': trimmed_count,  # Number of sold comps actually used after trimming
-            'ebay_min_price': ebay_result.get('min_price'),
-            'ebay_max_price': ebay_result.get('max_price'),
-            'ebay_p25_price': ebay_result.get('p25_price'),
-            'ebay_p75_price': ebay_result.get('p75_price'),
-            'ebay_sample_items': ebay_result.get('sample_items', []),
-            'ebay_last_sold_date': ebay_result.get('last_sold_date'),
-            'confidence_reason': ebay_result.get('confidence_reason'),
-            **metrics,
-            'status': metrics.get('status', 'passed' if metrics['passed'] else 'failed'),  # metrics['status'] is 'passed' or 'failed'
-            'reason': metrics.get('fail_reason', None) if not metrics['passed'] else None,
-            'fail_reason': metrics.get('fail_reason', None),
-            'mode': mode,  # Include scan mode in metadata
-            'fee_settings': {
-                'ebay_fee_pct': ebay_fee_pct,
-                'payment_fee_pct': payment_fee_pct,
-                'shipping_flat': shipping_flat
+                **metrics,
+                'status': metrics.get('status', 'passed' if passed else 'failed'),  # metrics['status'] is 'passed' or 'failed'
+                'reason': None if passed else fail_reason,
+                'fail_reason': fail_reason,
+                'mode': mode,  # Include scan mode in metadata
+                'fee_settings': fee_settings
             }
-        }
-        results.append(result)
-        
-        if metrics['passed']:
-            passed_count += 1
-        else:
-            failed_criteria_count += 1
-        
-        # Print result immediately in stream mode
-        if stream:
-            status_symbol = "✓" if metrics['passed'] else "✗"
-            status_text = "PASS" if metrics['passed'] else "FAIL"
-            comps_used = trimmed_count
-            reason = metrics.get('fail_reason', '') or ''
-            reason_display = reason[:25] if reason else ''
-            print(f"{status_symbol} {title[:60]:<60} | ${sale_price:>7.2f} | ${metrics['net_profit']:>10.2f} | {metrics['net_roi']:>7.1%} | comps: {comps_used} | {status_text:<6} | {reason_display}")
-        else:
-            status = "PASS" if metrics['passed'] else "FAIL"
-            reason = metrics.get('fail_reason', '') or ''
-            if reason:
-                print(f" → {status}: Net Profit ${metrics['net_profit']:.2f}, Net ROI {metrics['net_roi']:.2%} | {reason}")
+            results.append(result)
+            
+            if passed:
+                passed_count += 1
             else:
-                print(f" → {status}: Net Profit ${metrics['net_profit']:.2f}, Net ROI {metrics['net_roi']:.2%}")
+                failed_criteria_count += 1
+            
+            # Print result immediately in stream mode
+            if stream:
+                status_symbol = "✓" if passed else "✗"
+                status_text = "PASS" if passed else "FAIL"
+                comps_used = trimmed_count
+                reason_display = fail_reason[:25] if fail_reason else ''
+                stream_rows.add(STREAM_ROW_FORMAT.format(
+                    symbol=status_symbol, title=title[:60], price=sale_price,
+                    profit=net_profit, roi=net_roi, comps=comps_used,
+                    status=status_text, reason=reason_display
+                ))
+            else:
+                status = "PASS" if passed else "FAIL"
+                if fail_reason:
+                    print(f" → {status}: Net Profit ${net_profit:.2f}, Net ROI {net_roi:.2%} | {fail_reason}")
+                else:
+                    print(f" → {status}: Net Profit ${net_profit:.2f}, Net ROI {net_roi:.2%}")
+    finally:
+        if stream_rows is not None:
+            stream_rows.flush()
     
     # Check if any items reached eBay analysis
     if analyzed_count == 0:
-        print("=" * 80)
+        print(RULE_EQ)
         print("RESULTS")
-        print("=" * 80)
+        print(RULE_EQ)
         print()
         print("No items reached eBay analysis. Try raising limit or changing category.")
         print()
@@ -2600,31 +2855,17 @@ def process_woot_mode(category: str = 'Tools', limit: int = 10, resume: bool = F
     
     # Output results (skip detailed output in stream mode since deals were already printed)
     if not stream:
-        print("=" * 80)
+        print(RULE_EQ)
         print("RESULTS")
-        print("=" * 80)
+        print(RULE_EQ)
         print()
         
-        # Separate PASS and FAIL
+        # Only PASS items are listed here; failures are covered by the summary counts
         passed_results = [r for r in results if r['passed']]
-        failed_results = [r for r in results if not r['passed']]
-        
-        # Sort PASS by Net ROI descending
-        passed_results.sort(key=lambda x: x.get('net_roi', 0), reverse=True)
         
-        # Print PASS items
+        # Print PASS items (sorted by Net ROI descending)
         if passed_results:
-            print(f"✓ PASSED ({len(passed_results)} items):")
-            print("-" * 80)
-            for result in passed_results:
-                print(f"Title: {result['title']}")
-                print(f"  Buy Price (Woot): ${result['buy_price']:.2f}")
-                print(f"  Avg Sold Price: ${result['ebay_avg_sold_price']:.2f}")
-                print(f"  Net Profit: ${result.get('net_profit', 0):.2f}")
-                print(f"  Net ROI: {result.get('net_roi', 0):.2%}")
-                print(f"  Sold Count: {result['ebay_sold_count']}")
-                print(f"  URL: {result['url']}")
-                print()
+            sys.stdout.write(render_passed_results(passed_results, buy_label='Buy Price (Woot)'))
         else:
             print("No items passed the arbitrage criteria.")
             print()
@@ -2649,16 +2890,85 @@ def process_woot_mode(category: str = 'Tools', limit: int = 10, resume: bool = F
     print(f"  Cache Hit: {cache_hit_count}")
     print(f"  Cache Miss: {cache_miss_count}")
     print(f"  eBay Calls Made: {ebay_calls_made}")
-    print(f"  eBay OK: {ebay_ok_count}")
-    print(f"  No Sold Comps: {ebay_no_sold_comps_count}")
-    print(f"  eBay Throttled: {ebay_throttled_count}")
-    print(f"  Budget Exhausted: {ebay_budget_exhausted_count}")
-    print(f"  eBay API Failed: {ebay_api_fail_count}")
+    print(f"  eBay OK: {ebay_status_counts['SUCCESS']}")
+    print(f"  No Sold Comps: {ebay_status_counts['NO_SOLD_COMPS']}")
+    print(f"  eBay Throttled: {ebay_status_counts['EBAY_THROTTLED']}")
+    print(f"  Budget Exhausted: {ebay_status_counts['BUDGET_EXHAUSTED']}")
+    print(f"  eBay API Failed: {ebay_status_counts['API_FAIL']}")
     print(f"  Failed Criteria: {failed_criteria_count}")
     print(f"  Passed: {passed_count}")
     
     return results
 
+def _build_csv_column_plan(header: List[str]) -> Dict[str, List[int]]:
+    """
+    Map each upload field to the indices of the CSV columns that can supply it, in alias
+    priority order. Headers are matched after stripping whitespace/BOM and lowercasing;
+    if several headers normalize to the same alias, the last one wins.
+    """
+    columns_by_alias = {}
+    for index, raw_key in enumerate(header):
+        columns_by_alias[raw_key.strip().lstrip("\ufeff").lower()] = index
+    
+    return {
+        field: [columns_by_alias[alias] for alias in aliases if alias in columns_by_alias]
+        for field, aliases in CSV_FIELD_ALIASES.items()
+    }
+
+def _first_csv_value(row: List[str], columns: List[int]) -> Optional[str]:
+    """Return the first non-empty stripped value from the given column indices, or None."""
+    row_len = len(row)
+    for index in columns:
+        if index < row_len:
+            value = row[index].strip()
+            if value:
+                return value
+    return None
+
+def _lookup_workers(default: int = 4) -> int:
+    """Return the eBay lookup pool size from EBAY_LOOKUP_WORKERS (falls back to default)."""
+    raw = os.environ.get('EBAY_LOOKUP_WORKERS')
+    if not raw:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        log_debug(f"Invalid EBAY_LOOKUP_WORKERS={raw!r}; using {default}")
+        return default
+
+def _prefetch_ebay_lookups(items: List[Dict], no_cache: bool = False, workers: int = 4):
+    """
+    Look up eBay sold comps for upload items on worker threads, yielding
+    (ebay_result, captured_output) in item order. Each lookup's printed output is
+    captured so the caller can replay it in order. After a lookup comes back
+    EBAY_THROTTLED or BUDGET_EXHAUSTED, lookups not yet started are skipped and
+    yield (None, '').
+    """
+    stop_event = threading.Event()
+    stdout_proxy = ThreadCapturedStdout(sys.stdout)
+    
+    def lookup(item):
+        if stop_event.is_set():
+            return (None, '')
+        title = item['title']
+        with stdout_proxy.capture() as captured:
+            ebay_result = search_ebay_sold(clean_title_for_ebay(title), original_title=title, no_cache=no_cache)
+        if ebay_result['status'] in ('EBAY_THROTTLED', 'BUDGET_EXHAUSTED'):
+            stop_event.set()
+        return (ebay_result, ''.join(captured))
+    
+    original_stdout = sys.stdout
+    sys.stdout = stdout_proxy
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(lookup, item) for item in items]
+        for future in futures:
+            yield future.result()
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+        sys.stdout = original_stdout
+
 def process_upload_csv_mode(infile: str, mode: str = 'highticket', ebay_fee_pct: float = EBAY_FEE_PCT, payment_fee_pct: float = PAYMENT_FEE_PCT, shipping_flat: float = SHIPPING_FLAT, run_id: Optional[str] = None, no_cache: bool = False) -> List[Dict]:
     """
     Process uploaded CSV file through eBay analysis pipeline.
@@ -2667,71 +2977,47 @@ def process_upload_csv_mode(infile: str, mode: str = 'highticket', ebay_fee_pct:
     # Read and normalize CSV
     items = []
     try:
-        with open(infile, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        # utf-8-sig drops a leading BOM (common in Excel exports) before the header is parsed
+        with open(infile, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f)
+            # Resolve header aliases to column indices once per file instead of once per row
+            column_plan = _build_csv_column_plan(next(reader, []))
+            title_cols = column_plan['title']
+            price_cols = column_plan['price']
+            url_cols = column_plan['url']
+            category_cols = column_plan['category']
+            store_cols = column_plan['store']
+            sku_cols = column_plan['sku']
+            image_cols = column_plan['image_url']
+            
             for row in reader:
-                # Normalize keys: strip whitespace, remove BOM, lowercase
-                def norm_key(k):
-                    return (k or "").strip().lstrip("\ufeff").lower()
-                
-                clean = {norm_key(k): (v.strip() if isinstance(v, str) else v) for k, v in row.items() if k is not None}
-                
                 # Extract title (required)
-                title = None
-                for title_key in ['title', 'name', 'item', 'product', 'item_name']:
-                    if title_key in clean and clean[title_key]:
-                        title = str(clean[title_key]).strip()
-                        break
+                title = _first_csv_value(row, title_cols)
                 
                 if not title:
                     continue
                 
-                # Extract price (required)
+                # Extract price (required): first alias column that parses to a positive price
                 price = None
-                price_field_exists = False
-                for price_key in ['price', 'cost', 'buy_price', 'sale_price', 'purchase_price', 'woot_price']:
-                    if price_key in clean:
-                        price_field_exists = True
-                        price_str = str(clean[price_key]).strip() if clean[price_key] else ""
-                        if price_str:
-                            try:
-                                price = float(price_str.replace('$', '').replace(',', '').strip())
-                                if price > 0:
-                                    break
-                            except (ValueError, TypeError):
-                                pass
+                for price_key in price_cols:
+                    price_str = _first_csv_value(row, (price_key,)) or ""
+                    if price_str:
+                        try:
+                            price = float(price_str.translate(PRICE_STRIP_TABLE).strip())
+                            if price > 0:
+                                break
+                        except (ValueError, TypeError):
+                            pass
                 
-                if not price_field_exists or price is None or price <= 0:
+                if not price_cols or price is None or price <= 0:
                     continue
                 
                 # Extract optional fields
-                url = None
-                for url_key in ['url', 'link', 'source_url', 'woot_url', 'product_url']:
-                    if url_key in clean and clean[url_key]:
-                        url = str(clean[url_key]).strip()
-                        break
-                
-                category = None
-                for cat_key in ['category', 'categories', 'cat']:
-                    if cat_key in clean and clean[cat_key]:
-                        category = str(clean[cat_key]).strip()
-                        break
-                
-                store = None
-                for store_key in ['store', 'merchant', 'seller', 'retailer']:
-                    if store_key in clean and clean[store_key]:
-                        store = str(clean[store_key]).strip()
-                        break
-                
-                sku = None
-                if 'sku' in clean and clean['sku']:
-                    sku = str(clean['sku']).strip()
-                
-                image_url = None
-                for img_key in ['image_url', 'image', 'imageurl', 'img_url', 'picture_url']:
-                    if img_key in clean and clean[img_key]:
-                        image_url = str(clean[img_key]).strip()
-                        break
+                url = _first_csv_value(row, url_cols)
+                category = _first_csv_value(row, category_cols)
+                store = _first_csv_value(row, store_cols)
+                sku = _first_csv_value(row, sku_cols)
+                image_url = _first_csv_value(row, image_cols)
                 
                 items.append({
                     'title': title,
@@ -2751,36 +3037,27 @@ def process_upload_csv_mode(infile: str, mode: str = 'highticket', ebay_fee_pct:
     # Process items through the same analysis pipeline as Woot items
     # (Reuse the core analysis logic from process_woot_mode)
     # Set mode thresholds
-    if mode == 'active':
-        scan_min_net_profit = 10.0
-        scan_min_net_roi = 0.20
-        scan_min_sold_comps = 8
-    elif mode == 'highticket':
-        scan_min_net_profit = 12.0
-        scan_min_net_roi = 0.10
-        scan_min_sold_comps = 6
-    else:  # conservative (default)
-        scan_min_net_profit = MIN_PROFIT
-        scan_min_net_roi = MIN_ROI
-        scan_min_sold_comps = 12
-    
-    print("=" * 80)
+    scan_min_net_profit, scan_min_net_roi, scan_min_sold_comps = MODE_THRESHOLDS.get(mode, MODE_THRESHOLDS['conservative'])
+    
+    # Fee settings recorded on each result (one dict shared by all results of this run)
+    fee_settings = {
+        'ebay_fee_pct': ebay_fee_pct,
+        'payment_fee_pct': payment_fee_pct,
+        'shipping_flat': shipping_flat
+    }
+    
+    print(RULE_EQ)
     print("CSV Upload → eBay Sold Arbitrage Checker")
     if no_cache:
         print("[CACHE] bypassed (no-cache enabled)")
     print(f"Mode: {mode} (min net profit ${scan_min_net_profit:.0f}, min net ROI {scan_min_net_roi:.0%}, min sold comps {scan_min_sold_comps})")
     print(f"CSV file: {infile}")
     print(f"Items loaded: {len(items)}")
-    print("=" * 80)
+    print(RULE_EQ)
     print()
     
     # Initialize counters
     analyzed_count = 0
-    ebay_ok_count = 0
-    ebay_no_sold_comps_count = 0
-    ebay_throttled_count = 0
-    ebay_budget_exhausted_count = 0
-    ebay_api_fail_count = 0
     failed_criteria_count = 0
     passed_count = 0
     
@@ -2794,270 +3071,138 @@ def process_upload_csv_mode(infile: str, mode: str = 'highticket', ebay_fee_pct:
     analyzed_index = 0
     accepted_rows = len(items)  # All items that passed title/price validation
     
-    # Process each item (lenient: attempt eBay analysis for all accepted items)
-    for idx, item in enumerate(items, 1):
-        title = item['title']
-        sale_price = item['buy_price']
-        url = item.get('url')
-        item_category = item.get('category')
-        source_category = item.get('source_category', 'Upload')
-        
-        # For upload path: Always attempt eBay analysis (no pre-filtering)
-        # Use title directly as query (light cleanup)
-        analyzed_count += 1
-        analyzed_index += 1
-        print(f"[{analyzed_index}] {title[:60]}... | ${sale_price:.2f}", end='')
-        
-        # Search eBay (use cleaned title directly, no confidence gate)
-        search_query = clean_title_for_ebay(title)
-        ebay_result = search_ebay_sold(search_query, original_title=title, no_cache=no_cache)
-        
-        # Handle eBay results (same logic as process_woot_mode)
-        if ebay_result['status'] == 'SUCCESS':
-            ebay_ok_count += 1
-            sold_count = ebay_result['sold_count']
-            expected_sale_price = ebay_result.get('expected_sale_price', ebay_result.get('median_price', 0.0))
-            trimmed_count = ebay_result.get('trimmed_count', sold_count)
-            
-            print(f" → eBay: {trimmed_count} trimmed from {sold_count} @ ${expected_sale_price:.2f} expected")
-            
-            # Calculate metrics
-            metrics = calculate_metrics(sale_price, expected_sale_price, trimmed_count, min_profit=scan_min_net_profit, min_roi=scan_min_net_roi, min_sold_comps=scan_min_sold_comps, ebay_fee_pct=ebay_fee_pct, payment_fee_pct=payment_fee_pct, shipping_flat=shipping_flat)
+    # eBay lookups run on a small thread pool (pacing and budget are still enforced
+    # inside search_ebay_sold); results are consumed here in item order, and closing()
+    # stops any remaining lookups and restores stdout even if the loop raises
+    lookups = _prefetch_ebay_lookups(items, no_cache=no_cache, workers=_lookup_workers())
+    with contextlib.closing(lookups):
+        # Process each item (lenient: attempt eBay analysis for all accepted items)
+        for idx, item in enumerate(items, 1):
+            # Search eBay (use cleaned title directly, no confidence gate)
+            ebay_result, lookup_output = next(lookups)
+            if ebay_result is None:
+                # Lookups stopped after a throttle/budget result
+                break
             
-            result = {
-                'title': title,
-                'buy_price': sale_price,
-                'url': url,
-                'category': item_category,
-                'source_category': source_category,
-                'ebay_sold_count': sold_count,
-                'ebay_avg_sold_price': ebay_result.get('avg_price', 0.0),
-                'ebay_median_sold_price': ebay_result.get('median_price', 0.0),
-                'ebay_trimmed_count': trimmed_count,
-                'ebay_expected_sale_price': expected_sale_price,
-                'sold_count_used': trimmed_count,
-                'ebay_min_price': ebay_result.get('min_price'),
-                'ebay_max_price': ebay_result.get('max_price'),
-                'ebay_p25_price': ebay_result.get('p25_price'),
-                'ebay_p75_price': ebay_result.get('p75_price'),
-                'ebay_sample_items': ebay_result.get('sample_items', []),
-                'ebay_last_sold_date': ebay_result.get('last_sold_date'),
-                'confidence_reason': ebay_result.get('confidence_reason'),
-                **metrics,
-                'status': metrics.get('status', 'passed' if metrics['passed'] else 'failed'),
-                'reason': metrics.get('fail_reason', None) if not metrics['passed'] else None,
-                'fail_reason': metrics.get('fail_reason', None),
-                'mode': mode,
-                'fee_settings': {
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                }
-            }
-            results.append(result)
+            title = item['title']
+            sale_price = item['buy_price']
+            url = item.get('url')
+            item_category = item.get('category')
+            source_category = item.get('source_category', 'Upload')
             
-            if metrics['passed']:
-                passed_count += 1
-            else:
-                failed_criteria_count += 1
+            # For upload path: Always attempt eBay analysis (no pre-filtering)
+            # Use title directly as query (light cleanup)
+            analyzed_count += 1
+            analyzed_index += 1
+            sys.stdout.write(lookup_output)
+            item_label = f"[{analyzed_index}] {title[:60]}... | ${sale_price:.2f}"
             
-            status = "PASS" if metrics['passed'] else "FAIL"
-            reason = metrics.get('fail_reason', '') or ''
-            if reason:
-                print(f" → {status}: Net Profit ${metrics['net_profit']:.2f}, Net ROI {metrics['net_roi']:.2%} | {reason}")
-            else:
-                print(f" → {status}: Net Profit ${metrics['net_profit']:.2f}, Net ROI {metrics['net_roi']:.2%}")
-        elif ebay_result['status'] == 'NO_SOLD_COMPS':
-            ebay_no_sold_comps_count += 1
-            results.append({
-                'title': title,
-                'buy_price': sale_price,
-                'url': url,
-                'category': item_category,
-                'source_category': source_category,
-                'ebay_sold_count': 0,
-                'ebay_avg_sold_price': 0,
-                'ebay_median_sold_price': 0,
-                'ebay_min_price': None,
-                'ebay_max_price': None,
-                'ebay_p25_price': None,
-                'ebay_p75_price': None,
-                'ebay_sample_items': [],
-                'ebay_last_sold_date': None,
-                'net_sale': 0,
-                'profit': 0,
-                'roi': 0,
-                'passed': False,
-                'status': 'failed',
-                'reason': 'NO_SOLD_COMPS',
-                'fail_reason': 'No sold comps found (valid search)',
-                'mode': mode,
-                'fee_settings': {
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                }
-            })
-            print(f" → No sold comps found (valid search)")
-        elif ebay_result['status'] == 'EBAY_THROTTLED':
-            ebay_throttled_count += 1
-            results.append({
-                'title': title,
-                'buy_price': sale_price,
-                'url': url,
-                'category': item_category,
-                'source_category': source_category,
-                'ebay_sold_count': None,
-                'ebay_avg_sold_price': None,
-                'ebay_median_sold_price': None,
-                'ebay_min_price': None,
-                'ebay_max_price': None,
-                'ebay_p25_price': None,
-                'ebay_p75_price': None,
-                'ebay_sample_items': None,
-                'ebay_last_sold_date': None,
-                'net_sale': 0,
-                'profit': 0,
-                'roi': 0,
-                'passed': False,
-                'status': 'pending',
-                'reason': 'EBAY_THROTTLED',
-                'fail_reason': 'eBay throttled; try again in a few minutes',
-                'mode': mode,
-                'fee_settings': {
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                }
-            })
-            print(f" → eBay throttled; stopping scan early (cooldown). Run again later.")
-            break
-        elif ebay_result['status'] == 'BUDGET_EXHAUSTED':
-            ebay_budget_exhausted_count += 1
-            results.append({
-                'title': title,
-                'buy_price': sale_price,
-                'url': url,
-                'category': item_category,
-                'source_category': source_category,
-                'ebay_sold_count': None,
-                'ebay_avg_sold_price': None,
-                'ebay_median_sold_price': None,
-                'ebay_min_price': None,
-                'ebay_max_price': None,
-                'ebay_p25_price': None,
-                'ebay_p75_price': None,
-                'ebay_sample_items': None,
-                'ebay_last_sold_date': None,
-                'net_sale': 0,
-                'profit': 0,
-                'roi': 0,
-                'passed': False,
-                'status': 'pending',
-                'reason': 'BUDGET_EXHAUSTED',
-                'fail_reason': 'eBay budget exhausted; run again later',
-                'mode': mode,
-                'fee_settings': {
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                }
-            })
-            print(f" → eBay budget exhausted; run again later")
-            break
-        elif ebay_result['status'] == 'API_FAIL':
-            ebay_api_fail_count += 1
-            results.append({
-                'title': title,
-                'buy_price': sale_price,
-                'url': url,
-                'category': item_category,
-                'source_category': source_category,
-                'ebay_sold_count': 0,
-                'ebay_avg_sold_price': 0,
-                'ebay_median_sold_price': 0,
-                'ebay_min_price': None,
-                'ebay_max_price': None,
-                'ebay_p25_price': None,
-                'ebay_p75_price': None,
-                'ebay_sample_items': [],
-                'ebay_last_sold_date': None,
-                'net_sale': 0,
-                'profit': 0,
-                'roi': 0,
-                'passed': False,
-                'status': 'failed',
-                'reason': 'API_FAIL',
-                'fail_reason': 'eBay API lookup failed',
-                'mode': mode,
-                'fee_settings': {
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                }
-            })
-            print(f" → FAIL: eBay API lookup failed")
-        elif ebay_result['status'] == 'LOW_CONFIDENCE_COMPS':
-            results.append({
-                'title': title,
-                'buy_price': sale_price,
-                'url': url,
-                'category': item_category,
-                'source_category': source_category,
-                'ebay_sold_count': ebay_result.get('sold_count', 0),
-                'ebay_avg_sold_price': ebay_result.get('avg_price', 0.0),
-                'ebay_median_sold_price': ebay_result.get('median_price', 0.0),
-                'ebay_trimmed_count': ebay_result.get('trimmed_count', 0),
-                'ebay_expected_sale_price': ebay_result.get('expected_sale_price', 0.0),
-                'ebay_min_price': ebay_result.get('min_price'),
-                'ebay_max_price': ebay_result.get('max_price'),
-                'ebay_p25_price': ebay_result.get('p25_price'),
-                'ebay_p75_price': ebay_result.get('p75_price'),
-                'ebay_sample_items': ebay_result.get('sample_items', []),
-                'ebay_last_sold_date': ebay_result.get('last_sold_date'),
-                'confidence_reason': ebay_result.get('confidence_reason'),
-                'net_sale': 0,
-                'profit': 0,
-                'roi': 0,
-                'passed': False,
-                'status': 'failed',
-                'reason': 'LOW_CONFIDENCE_COMPS',
-                'fail_reason': ebay_result.get('confidence_reason', 'Low confidence comps'),
-                'mode': mode,
-                'fee_settings': {
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
+            # Handle eBay results (same logic as process_woot_mode)
+            ebay_status = ebay_result['status']
+            if ebay_status == 'SUCCESS':
+                sold_count = ebay_result['sold_count']
+                avg_price = ebay_result.get('avg_price', 0.0)
+                median_price = ebay_result.get('median_price', 0.0)
+                expected_sale_price = ebay_result.get('expected_sale_price', median_price)
+                trimmed_count = ebay_result.get('trimmed_count', sold_count)
+                
+                print(f"{item_label} → eBay: {trimmed_count} trimmed from {sold_count} @ ${expected_sale_price:.2f} expected")
+                
+                # Calculate metrics
+                metrics = calculate_metrics(sale_price, expected_sale_price, trimmed_count, min_profit=scan_min_net_profit, min_roi=scan_min_net_roi, min_sold_comps=scan_min_sold_comps, ebay_fee_pct=ebay_fee_pct, payment_fee_pct=payment_fee_pct, shipping_flat=shipping_flat)
+                passed = metrics['passed']
+                fail_reason = metrics.get('fail_reason')
+                net_profit = metrics['net_profit']
+                net_roi = metrics['net_roi']
+                
+                result = {
+                    'title': title,
+                    'buy_price': sale_price,
+                    'url': url,
+                    'category': item_category,
+                    'source_category': source_category,
+                    'ebay_sold_count': sold_count,
+                    'ebay_avg_sold_price': avg_price,
+                    'ebay_median_sold_price': median_price,
+                    'ebay_trimmed_count': trimmed_count,
+                    'ebay_expected_sale_price': expected_sale_price,
+                    'sold_count_used': trimmed_count,
+                    'ebay_min_price': ebay_result.get('min_price'),
+                    'ebay_max_price': ebay_result.get('max_price'),
+                    'ebay_p25_price': ebay_result.get('p25_price'),
+                    'ebay_p75_price': ebay_result.get('p75_price'),
+                    'ebay_sample_items': ebay_result.get('sample_items', []),
+                    'ebay_last_sold_date': ebay_result.get('last_sold_date'),
+                    'confidence_reason': ebay_result.get('confidence_reason'),
+                    **metrics,
+                    'status': metrics.get('status', 'passed' if passed else 'failed'),
+                    'reason': None if passed else fail_reason,
+                    'fail_reason': fail_reason,
+                    'mode': mode,
+                    'fee_settings': fee_settings
                 }
-            })
-            print(f" → FAIL: {ebay_result.get('confidence_reason', 'Low confidence comps')}")
+                results.append(result)
+                
+                if passed:
+                    passed_count += 1
+                else:
+                    failed_criteria_count += 1
+                
+                status = "PASS" if passed else "FAIL"
+                if fail_reason:
+                    print(f" → {status}: Net Profit ${net_profit:.2f}, Net ROI {net_roi:.2%} | {fail_reason}")
+                else:
+                    print(f" → {status}: Net Profit ${net_profit:.2f}, Net ROI {net_roi:.2%}")
+            elif ebay_status == 'NO_SOLD_COMPS':
+                results.append(_base_result(
+                    title, sale_price, url, item_category, source_category, mode, fee_settings,
+                    'failed', 'NO_SOLD_COMPS', 'No sold comps found (valid search)',
+                    ebay_sample_items=[], **NO_COMPS_EBAY_FIELDS
+                ))
+                print(f"{item_label} → No sold comps found (valid search)")
+            elif ebay_status == 'EBAY_THROTTLED':
+                results.append(_base_result(
+                    title, sale_price, url, item_category, source_category, mode, fee_settings,
+                    'pending', 'EBAY_THROTTLED', 'eBay throttled; try again in a few minutes',
+                    **EMPTY_EBAY_FIELDS
+                ))
+                print(f"{item_label} → eBay throttled; stopping scan early (cooldown). Run again later.")
+                break
+            elif ebay_status == 'BUDGET_EXHAUSTED':
+                results.append(_base_result(
+                    title, sale_price, url, item_category, source_category, mode, fee_settings,
+                    'pending', 'BUDGET_EXHAUSTED', 'eBay budget exhausted; run again later',
+                    **EMPTY_EBAY_FIELDS
+                ))
+                print(f"{item_label} → eBay budget exhausted; run again later")
+                break
+            elif ebay_status == 'API_FAIL':
+                results.append(_base_result(
+                    title, sale_price, url, item_category, source_category, mode, fee_settings,
+                    'failed', 'API_FAIL', 'eBay API lookup failed',
+                    ebay_sample_items=[], **NO_COMPS_EBAY_FIELDS
+                ))
+                print(f"{item_label} → FAIL: eBay API lookup failed")
+            elif ebay_status == 'LOW_CONFIDENCE_COMPS':
+                confidence_reason = ebay_result.get('confidence_reason', 'Low confidence comps')
+                results.append(_base_result(
+                    title, sale_price, url, item_category, source_category, mode, fee_settings,
+                    'failed', 'LOW_CONFIDENCE_COMPS', confidence_reason,
+                    **_low_confidence_ebay_fields(ebay_result)
+                ))
+                print(f"{item_label} → FAIL: {confidence_reason}")
     
     # Print summary
     print()
-    print("=" * 80)
+    print(RULE_EQ)
     print("RESULTS")
-    print("=" * 80)
+    print(RULE_EQ)
     print()
     
     passed_results = [r for r in results if r.get('passed', False)]
-    failed_results = [r for r in results if not r.get('passed', False)]
-    passed_results.sort(key=lambda x: x.get('net_roi', 0), reverse=True)
     
     if passed_results:
-        print(f"✓ PASSED ({len(passed_results)} items):")
-        print("-" * 80)
-        for result in passed_results:
-            print(f"Title: {result['title']}")
-            print(f"  Buy Price: ${result['buy_price']:.2f}")
-            if result.get('ebay_avg_sold_price'):
-                print(f"  Avg Sold Price: ${result['ebay_avg_sold_price']:.2f}")
-            print(f"  Net Profit: ${result.get('net_profit', 0):.2f}")
-            print(f"  Net ROI: {result.get('net_roi', 0):.2%}")
-            if result.get('ebay_sold_count') is not None:
-                print(f"  Sold Count: {result['ebay_sold_count']}")
-            if result.get('url'):
-                print(f"  URL: {result['url']}")
-            print()
+        sys.stdout.write(render_passed_results(passed_results, buy_label='Buy Price', skip_missing=True))
     else:
         print("No items passed the arbitrage criteria.")
         print()
@@ -3095,23 +3240,70 @@ def process_woot_mode_with_save(category: str = 'Tools', limit: int = 10, resume
     results = process_woot_mode(category=category, limit=limit, resume=resume, stream=stream, brands=brands, mode=mode, ebay_fee_pct=ebay_fee_pct, payment_fee_pct=payment_fee_pct, shipping_flat=shipping_flat, no_cache=no_cache)
     
     # Add scan_mode, source_categories, and run_id to all results before saving
+    # (the values are the same for every result, so build them once and merge)
     categories_list = [c.strip() for c in category.split(',') if c.strip()]
+    run_fields = {
+        'scan_mode': mode,
+        'source_categories': categories_list if len(categories_list) > 1 else categories_list[0] if categories_list else category
+    }
+    if run_id:
+        run_fields['run_id'] = run_id
     for result in results:
-        result['scan_mode'] = mode
-        result['source_categories'] = categories_list if len(categories_list) > 1 else categories_list[0] if categories_list else category
-        if run_id:
-            result['run_id'] = run_id
+        result.update(run_fields)
     
     save_deals_to_file(results)
     
     # Return results count for validation
     return len(results)
 
+def _prefetch_watchlist_items(urls: List[str], workers: int = 4):
+    """
+    Fetch/parse watchlist product pages and look up eBay sold comps on worker threads,
+    yielding (product_data, parse_output, ebay_result, lookup_output) in URL order.
+    ebay_result is None when the page gave no usable title/price. Printed output of
+    the parse and the lookup is captured separately so the caller can replay it in order.
+    """
+    stdout_proxy = ThreadCapturedStdout(sys.stdout)
+    
+    def process(idx, url):
+        with stdout_proxy.capture() as parse_output:
+            product_data = parse_product(url, idx)
+        ebay_result = None
+        lookup_output = []
+        if product_data:
+            title, buy_price, _store, parse_fail_reason = product_data
+            if not parse_fail_reason and title and buy_price > 0:
+                with stdout_proxy.capture() as lookup_output:
+                    ebay_result = search_ebay_sold(clean_title_for_ebay(title))
+        return (product_data, ''.join(parse_output), ebay_result, ''.join(lookup_output))
+    
+    original_stdout = sys.stdout
+    sys.stdout = stdout_proxy
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(process, idx, url) for idx, url in enumerate(urls, 1)]
+        for future in futures:
+            yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        sys.stdout = original_stdout
+
+def _watchlist_fail_result(url: str, title: Optional[str], buy_price: float, store: str, fail_reason: str) -> Dict:
+    """Build a failed watchlist result (no usable eBay data)."""
+    return {
+        'url': url,
+        'title': title,
+        'buy_price': buy_price,
+        'store': store,
+        **WATCHLIST_FAIL_FIELDS,
+        'fail_reason': fail_reason
+    }
+
 def process_watchlist_mode():
     """Process watchlist.txt (legacy mode)."""
-    print("=" * 80)
+    print(RULE_EQ)
     print("Amazon/Walmart → eBay Sold Arbitrage Checker MVP")
-    print("=" * 80)
+    print(RULE_EQ)
     print()
     
     # Read watchlist
@@ -3143,197 +3335,107 @@ def process_watchlist_mode():
     
     results = []
     
-    # Process each URL
-    for idx, url in enumerate(urls, 1):
-        print(f"[{idx}/{len(urls)}] Processing: {url}")
-        print()
-        
-        # Parse product
-        product_data = parse_product(url, idx)
-        if not product_data:
-            results.append({
-                'url': url,
-                'title': None,
-                'buy_price': 0,
-                'store': 'Unknown',
-                'ebay_sold_count': 0,
-                'ebay_avg_sold_price': 0,
-                'net_sale': 0,
-                'profit': 0,
-                'roi': 0,
-                'passed': False,
-                'fail_reason': 'Failed to fetch page or unknown domain'
-            })
-            print(f"  → FAIL: Failed to fetch page or unknown domain\n")
-            continue
-        
-        title, buy_price, store, parse_fail_reason = product_data
-        
-        # Print RAW PARSE line even if parse failed
-        if title and buy_price > 0:
-            print(f"  RAW PARSE: store={store} title=\"{title}\" buy_price={buy_price:.2f}")
-        else:
-            print(f"  RAW PARSE: store={store} title=\"{title or 'N/A'}\" buy_price={buy_price:.2f}")
-            if parse_fail_reason:
-                print(f"  → Parse failed: {parse_fail_reason}")
-        
-        # If blocked/consent or parse failed, add result and continue
-        if parse_fail_reason:
-            results.append({
-                'url': url,
-                'title': title or None,
-                'buy_price': buy_price,
-                'store': store,
-                'ebay_sold_count': 0,
-                'ebay_avg_sold_price': 0,
-                'net_sale': 0,
-                'profit': 0,
-                'roi': 0,
-                'passed': False,
-                'fail_reason': parse_fail_reason
-            })
+    # Page fetches and eBay lookups run on a small thread pool (eBay pacing and budget
+    # are still enforced inside search_ebay_sold); results are consumed here in URL order,
+    # and closing() shuts down the worker pool and restores stdout even if the loop raises
+    prefetched = _prefetch_watchlist_items(urls, workers=_lookup_workers())
+    with contextlib.closing(prefetched):
+        # Process each URL
+        for idx, url in enumerate(urls, 1):
+            product_data, parse_output, ebay_result, lookup_output = next(prefetched)
+            print(f"[{idx}/{len(urls)}] Processing: {url}")
             print()
-            continue
-        
-        # If title and price are present, proceed to eBay search
-        if title and buy_price > 0:
-            # Search eBay
-            search_query = clean_title_for_ebay(title)
-            ebay_result = search_ebay_sold(search_query)
             
-            # Handle different statuses
-            if ebay_result['status'] == 'SUCCESS':
-                # Continue to metrics calculation below
-                pass
-            elif ebay_result['status'] == 'NO_SOLD_COMPS':
-                results.append({
-                    'url': url,
-                    'title': title,
-                    'buy_price': buy_price,
-                    'store': store,
-                    'ebay_sold_count': 0,
-                    'ebay_avg_sold_price': 0,
-                    'net_sale': 0,
-                    'profit': 0,
-                    'roi': 0,
-                    'passed': False,
-                    'fail_reason': 'No sold comps found (valid search)'
-                })
-                print(f"  → No sold comps found (valid search)\n")
+            # Parse product
+            sys.stdout.write(parse_output)
+            if not product_data:
+                results.append(_watchlist_fail_result(url, None, 0, 'Unknown', 'Failed to fetch page or unknown domain'))
+                print(f"  → FAIL: Failed to fetch page or unknown domain\n")
                 continue
-            elif ebay_result['status'] == 'EBAY_THROTTLED':
-                results.append({
-                    'url': url,
-                    'title': title,
-                    'buy_price': buy_price,
-                    'store': store,
-                    'ebay_sold_count': 0,
-                    'ebay_avg_sold_price': 0,
-                    'net_sale': 0,
-                    'profit': 0,
-                    'roi': 0,
-                    'passed': False,
-                    'fail_reason': 'eBay throttled; try again in a few minutes'
-                })
-                print(f"  → eBay throttled; try again in a few minutes\n")
-                continue
-            elif ebay_result['status'] == 'BUDGET_EXHAUSTED':
-                results.append({
-                    'url': url,
-                    'title': title,
-                    'buy_price': buy_price,
-                    'store': store,
-                    'ebay_sold_count': 0,
-                    'ebay_avg_sold_price': 0,
-                    'net_sale': 0,
-                    'profit': 0,
-                    'roi': 0,
-                    'passed': False,
-                    'fail_reason': 'eBay budget exhausted; run again later'
-                })
-                print(f"  → eBay budget exhausted; run again later\n")
+            
+            title, buy_price, store, parse_fail_reason = product_data
+            
+            # Print RAW PARSE line even if parse failed
+            if title and buy_price > 0:
+                print(f"  RAW PARSE: store={store} title=\"{title}\" buy_price={buy_price:.2f}")
+            else:
+                print(f"  RAW PARSE: store={store} title=\"{title or 'N/A'}\" buy_price={buy_price:.2f}")
+                if parse_fail_reason:
+                    print(f"  → Parse failed: {parse_fail_reason}")
+            
+            # If blocked/consent or parse failed, add result and continue
+            if parse_fail_reason:
+                results.append(_watchlist_fail_result(url, title or None, buy_price, store, parse_fail_reason))
+                print()
                 continue
-            elif ebay_result['status'] == 'API_FAIL':
-                results.append({
+            
+            # If title and price are present, proceed to eBay search
+            if title and buy_price > 0:
+                # Search eBay (already looked up on a worker; replay its output)
+                sys.stdout.write(lookup_output)
+                
+                # Handle different statuses
+                ebay_status = ebay_result['status']
+                fail_reason = STATUS_FAIL_REASONS.get(ebay_status)
+                if fail_reason is not None:
+                    results.append(_watchlist_fail_result(url, title, buy_price, store, fail_reason))
+                    print(f"  → {'FAIL: ' if ebay_status == 'API_FAIL' else ''}{fail_reason}\n")
+                    continue
+                
+                # SUCCESS status - proceed with metrics calculation
+                sold_count = ebay_result['sold_count']
+                avg_sold_price = ebay_result['avg_price']
+                median_sold_price = ebay_result['median_price']
+                
+                print(f"  → eBay: {sold_count} sold items, avg price: ${avg_sold_price:.2f}")
+                
+                # Calculate metrics (watchlist mode - use avg for backward compatibility, or expected_sale_price if available)
+                expected_price = ebay_result.get('expected_sale_price', avg_sold_price)
+                trimmed_count = ebay_result.get('trimmed_count', sold_count)
+                metrics = calculate_metrics(buy_price, expected_price, trimmed_count)
+                
+                result = {
                     'url': url,
                     'title': title,
                     'buy_price': buy_price,
                     'store': store,
-                    'ebay_sold_count': 0,
-                    'ebay_avg_sold_price': 0,
-                    'net_sale': 0,
-                    'profit': 0,
-                    'roi': 0,
-                    'passed': False,
-                    'fail_reason': 'eBay API lookup failed'
-                })
-                print(f"  → FAIL: eBay API lookup failed\n")
-                continue
-            
-            # SUCCESS status - proceed with metrics calculation
-            sold_count = ebay_result['sold_count']
-            avg_sold_price = ebay_result['avg_price']
-            median_sold_price = ebay_result['median_price']
-            
-            print(f"  → eBay: {sold_count} sold items, avg price: ${avg_sold_price:.2f}")
-            
-            # Calculate metrics (watchlist mode - use avg for backward compatibility, or expected_sale_price if available)
-            expected_price = ebay_result.get('expected_sale_price', avg_sold_price)
-            trimmed_count = ebay_result.get('trimmed_count', sold_count)
-            metrics = calculate_metrics(buy_price, expected_price, trimmed_count)
-            
-            result = {
-                'url': url,
-                'title': title,
-                'buy_price': buy_price,
-                'store': store,
-                'ebay_sold_count': sold_count,
-                'ebay_avg_sold_price': avg_sold_price,
-                **metrics
-            }
-            results.append(result)
+                    'ebay_sold_count': sold_count,
+                    'ebay_avg_sold_price': avg_sold_price,
+                    **metrics
+                }
+                results.append(result)
+                
+                status = "PASS" if metrics['passed'] else "FAIL"
+                print(f"  → {status}: Net Profit ${metrics['net_profit']:.2f}, Net ROI {metrics['net_roi']:.2%}")
+                if metrics['fail_reason']:
+                    print(f"    Reason: {metrics['fail_reason']}")
+            else:
+                # Title or price missing
+                results.append(_watchlist_fail_result(url, title or None, buy_price, store, parse_fail_reason or 'Title or price missing'))
+                print(f"  → FAIL: Title or price missing\n")
             
-            status = "PASS" if metrics['passed'] else "FAIL"
-            print(f"  → {status}: Net Profit ${metrics['net_profit']:.2f}, Net ROI {metrics['net_roi']:.2%}")
-            if metrics['fail_reason']:
-                print(f"    Reason: {metrics['fail_reason']}")
-        else:
-            # Title or price missing
-            results.append({
-                'url': url,
-                'title': title or None,
-                'buy_price': buy_price,
-                'store': store,
-                'ebay_sold_count': 0,
-                'ebay_avg_sold_price': 0,
-                'net_sale': 0,
-                'profit': 0,
-                'roi': 0,
-                'passed': False,
-                'fail_reason': parse_fail_reason or 'Title or price missing'
-            })
-            print(f"  → FAIL: Title or price missing\n")
-        
-        print()
+            print()
     
     # Sort results: PASS items by ROI descending, then FAIL items
-    passed_results = [r for r in results if r['passed']]
-    failed_results = [r for r in results if not r['passed']]
+    passed_results = []
+    failed_results = []
+    for r in results:
+        (passed_results if r['passed'] else failed_results).append(r)
     
-    passed_results.sort(key=lambda x: x.get('net_roi', 0), reverse=True)
-    failed_results.sort(key=lambda x: x.get('net_roi', 0), reverse=True)
+    passed_results.sort(key=_net_roi_key, reverse=True)
+    failed_results.sort(key=_net_roi_key, reverse=True)
     
     sorted_results = passed_results + failed_results
     
     # Print summary
-    print("=" * 80)
+    print(RULE_EQ)
     print("RESULTS SUMMARY")
-    print("=" * 80)
+    print(RULE_EQ)
     print()
     
     if passed_results:
         print(f"✓ PASSED ({len(passed_results)} items):")
-        print("-" * 80)
+        print(RULE_DASH)
         for result in passed_results:
             print(f"Title: {result['title'][:70]}")
             print(f"  Buy: ${result['buy_price']:.2f} @ {result['store']} | URL: {result['url']}")
@@ -3343,7 +3445,7 @@ def process_watchlist_mode():
     
     if failed_results:
         print(f"✗ FAILED ({len(failed_results)} items):")
-        print("-" * 80)
+        print(RULE_DASH)
         for result in failed_results:
             print(f"Title: {result['title'] or 'N/A'}")
             print(f"  Buy: ${result['buy_price']:.2f} @ {result['store']} | URL: {result['url']}")
@@ -3353,158 +3455,304 @@ def process_watchlist_mode():
             print(f"  Reason: {result['fail_reason']}")
             print()
 
-def save_deals_to_file(results: List[Dict], output_file: str = 'data/deals.json', merge: bool = True):
+def _import_legacy_deals(conn: sqlite3.Connection, legacy_file: str):
+    """Copy deals from the old JSON deals file into a freshly created deals database."""
+    try:
+        with open(legacy_file, 'rb') as f:
+            data = json_loads(f.read())
+    except FileNotFoundError:
+        return
+    except (json.JSONDecodeError, ValueError, IOError) as e:
+        print(f"ERROR reading {legacy_file}: {e}")
+        return
+    
+    # Handle both old format (direct list) and wrapped format (dict with version)
+    if isinstance(data, dict):
+        if data.get('version', 0) != CACHE_VERSION:
+            print(f"WARNING: {legacy_file} version ({data.get('version', 0)}) != current ({CACHE_VERSION}). Not imported.")
+            return
+        data = data.get('deals', [])
+    if not isinstance(data, list):
+        print(f"ERROR: Invalid format in {legacy_file}")
+        return
+    
+    now = time.time()
+    conn.executemany(
+        'INSERT INTO deals (url, run_id, deal, updated_at) VALUES (?, ?, ?, ?) '
+        'ON CONFLICT(url) DO UPDATE SET run_id = excluded.run_id, deal = excluded.deal, updated_at = excluded.updated_at',
+        ((deal.get('url') or None, deal.get('run_id'), json_dumps(deal), now) for deal in data if isinstance(deal, dict))
+    )
+    print(f"Imported {len(data)} deals from {legacy_file}")
+
+def _open_deals_db(db_file: str) -> sqlite3.Connection:
     """
-    Save scan results to JSON file.
-    If merge=True, update existing deals by matching on url and merge new results.
-    Includes cache version to invalidate old results.
+    Open the deals database, creating it on first use (importing a legacy JSON deals
+    file with the same base name, e.g. data/deals.json, if there is one).
+    Deals are stored one row per url (url-less deals get their own rows); the row id
+    keeps the order deals were first saved in. run_id is copied into its own indexed
+    column so per-run views don't have to decode every deal.
     """
-    os.makedirs('data', exist_ok=True)
-    
-    # Add cache version metadata to results (for validation)
-    # Store as a wrapper dict to maintain backward compatibility
-    output_data = {
-        'version': CACHE_VERSION,
-        'deals': results
-    }
+    db_dir = os.path.dirname(db_file)
+    if db_dir:
+        os.makedirs(db_dir, exist_ok=True)
+    conn = sqlite3.connect(db_file, timeout=30)
+    conn.execute('PRAGMA journal_mode=WAL')
+    with conn:
+        conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+        conn.execute('CREATE TABLE IF NOT EXISTS deals (id INTEGER PRIMARY KEY, url TEXT UNIQUE, run_id TEXT, deal BLOB NOT NULL, updated_at REAL NOT NULL)')
+        if 'run_id' not in {column[1] for column in conn.execute('PRAGMA table_info(deals)')}:
+            # Databases created before the run_id column: add it and fill it from the saved deals
+            conn.execute('ALTER TABLE deals ADD COLUMN run_id TEXT')
+            conn.executemany('UPDATE deals SET run_id = ? WHERE id = ?', [
+                (json_loads(deal).get('run_id'), row_id) for row_id, deal in conn.execute('SELECT id, deal FROM deals').fetchall()
+            ])
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_deals_run_id ON deals (run_id)')
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'version'").fetchone() is None:
+            # New database: stamp it with the current version and bring over any legacy file
+            conn.execute("INSERT INTO meta (key, value) VALUES ('version', ?)", (str(CACHE_VERSION),))
+            _import_legacy_deals(conn, os.path.splitext(db_file)[0] + '.json')
+    return conn
+
+def _deals_db_version(conn: sqlite3.Connection) -> int:
+    """Cache version the deals database was written with."""
+    row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+    return int(row[0]) if row else 0
+
+def save_deals_to_file(results: List[Dict], output_file: str = DEALS_DB_FILE, merge: bool = True):
+    """
+    Save scan results to the deals database.
+    If merge=True, update existing deals by matching on url (fields of the new result
+    are merged into the saved deal) and add new ones; only the saved rows for the urls
+    in results are read and rewritten. Deals without a url can't be matched, so each
+    save replaces the previously saved url-less deals.
+    Saved deals are tagged with the cache version to invalidate old results.
+    """
+    try:
+        conn = _open_deals_db(output_file)
+    except sqlite3.Error as e:
+        print(f"Error saving results to {output_file}: {e}")
+        return
     
-    if merge and os.path.exists(output_file):
-        # Load existing deals (will return empty list if version mismatch)
-        existing_deals = load_deals_from_file(output_file)
-        if existing_deals:
-            # Create lookup by url
-            existing_by_url = {deal.get('url'): deal for deal in existing_deals if deal.get('url')}
+    try:
+        with conn:
+            if _deals_db_version(conn) != CACHE_VERSION:
+                # Results from an older version are discarded (same as load_deals_from_file)
+                conn.execute('DELETE FROM deals')
+                conn.execute("UPDATE meta SET value = ? WHERE key = 'version'", (str(CACHE_VERSION),))
+            if merge:
+                conn.execute('DELETE FROM deals WHERE url IS NULL')
+            else:
+                conn.execute('DELETE FROM deals')
+            
+            # Load the saved deals for the incoming urls (in chunks, to stay under the SQL variable limit)
+            merged_by_url = {}
+            if merge:
+                urls = list({result['url'] for result in results if result.get('url')})
+                for start in range(0, len(urls), 500):
+                    chunk = urls[start:start + 500]
+                    placeholders = ','.join('?' * len(chunk))
+                    for url, deal in conn.execute(f'SELECT url, deal FROM deals WHERE url IN ({placeholders})', chunk):
+                        merged_by_url[url] = json_loads(deal)
             
             # Update or add results
+            touched = {}
+            urlless = []
             for result in results:
                 url = result.get('url')
-                if url and url in existing_by_url:
+                if not url:
+                    urlless.append(result)
+                elif url in merged_by_url:
                     # Update existing deal with new data
-                    existing_by_url[url].update(result)
+                    merged_by_url[url].update(result)
+                    touched[url] = merged_by_url[url]
                 else:
                     # Add new deal
-                    existing_by_url[url] = result
+                    merged_by_url[url] = result
+                    touched[url] = result
             
-            # Convert back to list and update output_data
-            results = list(existing_by_url.values())
-            output_data['deals'] = results
-    
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2)
-        log_debug(f"Saved {len(results)} results to {output_file} (version {CACHE_VERSION})")
-    except IOError as e:
+            now = time.time()
+            conn.executemany(
+                'INSERT INTO deals (url, run_id, deal, updated_at) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(url) DO UPDATE SET run_id = excluded.run_id, deal = excluded.deal, updated_at = excluded.updated_at',
+                [(url, deal.get('run_id'), json_dumps(deal), now) for url, deal in touched.items()]
+            )
+            conn.executemany(
+                'INSERT INTO deals (url, run_id, deal, updated_at) VALUES (NULL, ?, ?, ?)',
+                [(deal.get('run_id'), json_dumps(deal), now) for deal in urlless]
+            )
+            saved_count = conn.execute('SELECT COUNT(*) FROM deals').fetchone()[0]
+        log_debug(f"Saved {saved_count} results to {output_file} (version {CACHE_VERSION})")
+    except sqlite3.Error as e:
         print(f"Error saving results to {output_file}: {e}")
+    finally:
+        conn.close()
 
-def load_deals_from_file(input_file: str = 'data/deals.json') -> List[Dict]:
+def load_deals_from_file(input_file: str = DEALS_DB_FILE, run_id: Optional[str] = None) -> List[Dict]:
     """
-    Load scan results from JSON file.
+    Load scan results from the deals database, in the order they were first saved.
+    If run_id is given, only deals from that run are loaded (filtered by the run_id index).
     Validates cache version and returns empty list if version mismatch.
     """
-    if not os.path.exists(input_file):
+    if not os.path.exists(input_file) and not os.path.exists(os.path.splitext(input_file)[0] + '.json'):
         print(f"No deals file found at {input_file}")
         return []
     
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Handle both old format (direct list) and new format (dict with version)
-        deals = []
-        if isinstance(data, list):
-            # Old format - return as-is (backward compatibility)
-            deals = data
-            print(f"Loaded {len(deals)} deals from {input_file} (legacy format)")
-        elif isinstance(data, dict):
-            file_version = data.get('version', 0)
-            if file_version != CACHE_VERSION:
-                print(f"WARNING: {input_file} version ({file_version}) != current ({CACHE_VERSION}). Cache invalidated.")
+        conn = _open_deals_db(input_file)
+        try:
+            db_version = _deals_db_version(conn)
+            if db_version != CACHE_VERSION:
+                print(f"WARNING: {input_file} version ({db_version}) != current ({CACHE_VERSION}). Cache invalidated.")
                 print("Please run 'scan' again to regenerate results with current logic.")
                 return []
-            deals = data.get('deals', [])
-            print(f"Loaded {len(deals)} deals from {input_file}")
-        else:
-            print(f"ERROR: Invalid format in {input_file}")
-            return []
-        
-        if len(deals) == 0:
-            print(f"0 deals in file")
-        return deals
-    except (json.JSONDecodeError, IOError) as e:
+            if run_id:
+                rows = conn.execute('SELECT deal FROM deals WHERE run_id = ? ORDER BY id', (run_id,))
+            else:
+                rows = conn.execute('SELECT deal FROM deals ORDER BY id')
+            deals = [json_loads(deal) for (deal,) in rows]
+        finally:
+            conn.close()
+    except (sqlite3.Error, json.JSONDecodeError, ValueError) as e:
         print(f"ERROR reading {input_file}: {e}")
         return []
+    
+    if run_id:
+        print(f"Loaded {len(deals)} deals from {input_file} (run_id={run_id})")
+    else:
+        print(f"Loaded {len(deals)} deals from {input_file}")
+    if len(deals) == 0:
+        print(f"0 deals in file")
+    return deals
 
-def _export_deals_to_csv(deals: List[Dict], csv_path: str) -> int:
-    """Export deals to CSV file. Returns number of rows written (including header)."""
-    import csv
+def count_deals_by_status(input_file: str = DEALS_DB_FILE) -> Optional[Counter]:
+    """
+    Count every saved deal by status in one query, without decoding the deals in Python.
+    Legacy deals with no status but passed=true count as 'passed'. Returns None when
+    load_deals_from_file would find nothing to load (missing file, version mismatch, read error).
+    """
+    if not os.path.exists(input_file):
+        return None
+    try:
+        conn = _open_deals_db(input_file)
+        try:
+            if _deals_db_version(conn) != CACHE_VERSION:
+                return None
+            rows = conn.execute(
+                "SELECT json_extract(deal, '$.status'), json_extract(deal, '$.passed'), COUNT(*) "
+                "FROM (SELECT CAST(deal AS TEXT) AS deal FROM deals) GROUP BY 1, 2"
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        log_debug(f"Error counting deals in {input_file}: {e}")
+        return None
     
+    counts = Counter()
+    for status, passed, count in rows:
+        counts['passed' if status == 'passed' or (status is None and passed) else status] += count
+    return counts
+
+# CSV export headers (rows are tuples in this column order)
+CSV_EXPORT_FIELDS = (
+    'title', 'woot_price', 'expected_sale', 'net_profit', 'net_roi', 'comps',
+    'status', 'reason', 'woot_url', 'category', 'mode',
+    'ebay_fee_pct', 'payment_fee_pct', 'shipping_flat'
+)
+# Header line as csv.writer writes it (default \r\n line terminator), for header-only exports
+CSV_EXPORT_HEADER_LINE = ','.join(CSV_EXPORT_FIELDS) + '\r\n'
+
+def _export_deals_to_csv(deals: Iterable[Dict], csv_path: str, chunk_size: int = 1000) -> int:
+    """
+    Export deals to CSV file. Returns number of rows written (including header).
+    Rows are written chunk_size at a time through a 1 MiB file buffer; an empty
+    export is written as the header line alone.
+    """
     # Create output directory if needed
     output_dir = os.path.dirname(csv_path)
     if output_dir and not os.path.exists(output_dir):
         os.makedirs(output_dir, exist_ok=True)
     
-    # CSV headers
-    fieldnames = [
-        'title', 'woot_price', 'expected_sale', 'net_profit', 'net_roi', 'comps', 
-        'status', 'reason', 'woot_url', 'category', 'mode',
-        'ebay_fee_pct', 'payment_fee_pct', 'shipping_flat'
-    ]
+    deals = iter(deals)
+    first_deal = next(deals, None)
+    if first_deal is None:
+        with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+            csvfile.write(CSV_EXPORT_HEADER_LINE)
+        return 1
     
     rows_written = 0
-    with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+    with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_EXPORT_FIELDS)
         rows_written += 1
         
-        for deal in deals:
-            # Extract fee settings
-            fee_settings = _extract_fee_settings(deal)
+        # Row-loop helpers bound to locals (the batch list is cleared, never replaced)
+        batch = []
+        append = batch.append
+        extract_fee_settings = _extract_fee_settings
+        for deal in itertools.chain((first_deal,), deals):
+            get = deal.get
+            # Extract fee settings (empty fee columns if the deal has none)
+            fee_settings = extract_fee_settings(deal)
+            if fee_settings:
+                fee_get = fee_settings.get
+                ebay_fee_pct = fee_get('ebay_fee_pct', '')
+                payment_fee_pct = fee_get('payment_fee_pct', '')
+                shipping_flat = fee_get('shipping_flat', '')
+            else:
+                ebay_fee_pct = payment_fee_pct = shipping_flat = ''
             
             # Get expected sale price
-            expected_sale = deal.get('ebay_expected_sale_price')
+            expected_sale = get('ebay_expected_sale_price')
             if expected_sale is None or expected_sale <= 0:
-                expected_sale = deal.get('ebay_avg_sold_price')
+                expected_sale = get('ebay_avg_sold_price')
             
             # Get comps count
-            comps = deal.get('sold_count_used') or deal.get('ebay_trimmed_count')
+            comps = get('sold_count_used') or get('ebay_trimmed_count')
             
             # Get scan mode
-            scan_mode = deal.get('scan_mode') or deal.get('mode', '')
+            scan_mode = get('scan_mode') or get('mode', '')
             
             # Get reason/fail_reason
-            reason = deal.get('fail_reason') or deal.get('reason', '')
+            reason = get('fail_reason') or get('reason', '')
             
-            row = {
-                'title': deal.get('title', ''),
-                'woot_price': deal.get('buy_price', ''),
-                'expected_sale': expected_sale if expected_sale is not None else '',
-                'net_profit': deal.get('net_profit', ''),
-                'net_roi': deal.get('net_roi', ''),
-                'comps': comps if comps is not None else '',
-                'status': deal.get('status', ''),
-                'reason': reason,
-                'woot_url': deal.get('url', ''),
-                'category': deal.get('source_category', ''),
-                'mode': scan_mode,
-                'ebay_fee_pct': fee_settings.get('ebay_fee_pct', '') if fee_settings else '',
-                'payment_fee_pct': fee_settings.get('payment_fee_pct', '') if fee_settings else '',
-                'shipping_flat': fee_settings.get('shipping_flat', '') if fee_settings else ''
-            }
-            writer.writerow(row)
-            rows_written += 1
+            # csv.writer writes None as an empty field
+            append((
+                get('title', ''),
+                get('buy_price', ''),
+                expected_sale,
+                get('net_profit', ''),
+                get('net_roi', ''),
+                comps,
+                get('status', ''),
+                reason,
+                get('url', ''),
+                get('source_category', ''),
+                scan_mode,
+                ebay_fee_pct,
+                payment_fee_pct,
+                shipping_flat
+            ))
+            if len(batch) >= chunk_size:
+                writer.writerows(batch)
+                rows_written += len(batch)
+                batch.clear()
+        
+        writer.writerows(batch)
+        rows_written += len(batch)
     
     return rows_written
 
 def _extract_fee_settings(deal: Dict) -> Optional[Dict]:
     """Extract fee_settings from a deal. Returns dict with ebay_fee_pct, payment_fee_pct, shipping_flat or None."""
+    get = deal.get
     # Prefer nested fee_settings object
-    fee_settings = deal.get('fee_settings')
+    fee_settings = get('fee_settings')
     if fee_settings and isinstance(fee_settings, dict):
         return fee_settings
     # Fallback to flat fields for backward compatibility
-    ebay_fee_pct = deal.get('ebay_fee_pct')
-    payment_fee_pct = deal.get('payment_fee_pct')
-    shipping_flat = deal.get('shipping_flat')
+    ebay_fee_pct = get('ebay_fee_pct')
+    payment_fee_pct = get('payment_fee_pct')
+    shipping_flat = get('shipping_flat')
     if ebay_fee_pct is not None and payment_fee_pct is not None and shipping_flat is not None:
         return {
             'ebay_fee_pct': ebay_fee_pct,
@@ -3513,70 +3761,65 @@ def _extract_fee_settings(deal: Dict) -> Optional[Dict]:
         }
     return None
 
-def _get_mode_thresholds(mode: str) -> Tuple[float, float, int]:
-    """
-    Get mode thresholds (min_net_profit, min_net_roi, min_sold_comps) for a given mode.
-    Matches the logic used in process_woot_mode.
-    """
-    if mode == 'active':
-        return (10.0, 0.20, 8)
-    elif mode == 'highticket':
-        return (12.0, 0.10, 6)
-    else:  # conservative (default)
-        return (MIN_PROFIT, MIN_ROI, 12)
-
-def _is_near_miss(deal: Dict, near_profit: float, near_roi: float, near_comps: int) -> bool:
+# Threshold failure tokens in a fail_reason (FAIL_MIN_NET_PROFIT, FAIL_MIN_NET_ROI, FAIL_MIN_COMPS)
+FAIL_MIN_RE = re.compile(r'FAIL_MIN_(NET_PROFIT|NET_ROI|COMPS)')
+
+def _find_near_misses(deals: List[Dict], near_profit: float, near_roi: float, near_comps: int) -> List[Dict]:
     """
-    Check if a failed deal is a near-miss based on thresholds.
-    Returns True if deal failed but is within near-miss thresholds.
+    Return the failed deals that are near-misses based on thresholds, in order.
+    A deal is a near-miss if it failed but is within near-miss thresholds.
     Checks reason field for failure type AND validates numeric closeness.
     """
-    # Only check failed deals
-    status = deal.get('status')
-    if status != 'failed':
-        return False
-    
-    # Get reason field - normalize to string (may be string or list)
-    fail_reason = deal.get('fail_reason') or deal.get('reason', '')
-    if isinstance(fail_reason, list):
-        fail_reason = ' '.join(str(r) for r in fail_reason)
-    fail_reason = str(fail_reason)
-    
-    # Get numeric values (handle missing fields safely)
-    net_profit = deal.get('net_profit')
-    net_roi = deal.get('net_roi')
-    # Handle various field name variations for comps
-    comps = deal.get('sold_count_used') or deal.get('ebay_trimmed_count') or deal.get('comps') or deal.get('sold_comps')
-    
-    # Get mode thresholds from the deal's scan_mode
-    scan_mode = deal.get('scan_mode') or deal.get('mode', 'conservative')
-    min_net_profit, min_net_roi, min_comps = _get_mode_thresholds(scan_mode)
-    
-    # Check if ANY of these are true:
-    # A) reason contains "FAIL_MIN_NET_PROFIT" AND (min_profit - net_profit) <= near_profit
-    if 'FAIL_MIN_NET_PROFIT' in fail_reason:
-        if net_profit is not None and net_profit < min_net_profit:
-            if (min_net_profit - net_profit) <= near_profit:
-                return True
-    
-    # B) reason contains "FAIL_MIN_NET_ROI" AND (min_roi - net_roi) <= near_roi
-    if 'FAIL_MIN_NET_ROI' in fail_reason:
-        if net_roi is not None and net_roi < min_net_roi:
-            if (min_net_roi - net_roi) <= near_roi:
-                return True
-    
-    # C) reason contains "FAIL_MIN_COMPS" AND (min_comps - comps) <= near_comps
-    if 'FAIL_MIN_COMPS' in fail_reason:
-        if comps is not None and comps < min_comps:
-            if (min_comps - comps) <= near_comps:
-                return True
-    
-    return False
+    default_thresholds = MODE_THRESHOLDS['conservative']
+    near_misses = []
+    for deal in deals:
+        get = deal.get
+        # Only check failed deals
+        if get('status') != 'failed':
+            continue
+        
+        # Get reason field - normalize to string (may be string or list)
+        fail_reason = get('fail_reason') or get('reason', '')
+        if isinstance(fail_reason, list):
+            fail_reason = ' '.join(str(r) for r in fail_reason)
+        fail_reason = str(fail_reason)
+        
+        # Find which thresholds were missed in one scan; most failures (no comps,
+        # API errors, low confidence) aren't threshold misses at all
+        missed = set(FAIL_MIN_RE.findall(fail_reason))
+        if not missed:
+            continue
+        
+        # Get numeric values (handle missing fields safely)
+        net_profit = get('net_profit')
+        net_roi = get('net_roi')
+        # Handle various field name variations for comps
+        comps = get('sold_count_used') or get('ebay_trimmed_count') or get('comps') or get('sold_comps')
+        
+        # Get mode thresholds from the deal's scan_mode (unknown modes use conservative, as in scans)
+        scan_mode = get('scan_mode') or get('mode', 'conservative')
+        min_net_profit, min_net_roi, min_comps = MODE_THRESHOLDS.get(scan_mode, default_thresholds)
+        
+        # Near-miss if ANY of these are true:
+        # A) reason contains "FAIL_MIN_NET_PROFIT" AND (min_profit - net_profit) <= near_profit
+        # B) reason contains "FAIL_MIN_NET_ROI" AND (min_roi - net_roi) <= near_roi
+        # C) reason contains "FAIL_MIN_COMPS" AND (min_comps - comps) <= near_comps
+        if ('NET_PROFIT' in missed and net_profit is not None and net_profit < min_net_profit
+                and (min_net_profit - net_profit) <= near_profit):
+            near_misses.append(deal)
+        elif ('NET_ROI' in missed and net_roi is not None and net_roi < min_net_roi
+                and (min_net_roi - net_roi) <= near_roi):
+            near_misses.append(deal)
+        elif ('COMPS' in missed and comps is not None and comps < min_comps
+                and (min_comps - comps) <= near_comps):
+            near_misses.append(deal)
+    return near_misses
 
 def _recalculate_deal_metrics(deal: Dict, fee_settings: Dict) -> Tuple[float, float]:
     """Recalculate net_profit and net_roi for a deal using given fee settings."""
-    buy_price = deal.get('buy_price', 0)
-    expected_sale = deal.get('ebay_expected_sale_price') or deal.get('ebay_avg_sold_price', 0)
+    get = deal.get
+    buy_price = get('buy_price', 0)
+    expected_sale = get('ebay_expected_sale_price') or get('ebay_avg_sold_price', 0)
     
     if expected_sale <= 0 or buy_price <= 0:
         return (0.0, 0.0)
@@ -3588,57 +3831,152 @@ def _recalculate_deal_metrics(deal: Dict, fee_settings: Dict) -> Tuple[float, fl
     
     return (net_profit, net_roi)
 
-def view_deals(top: int = 20, only_status: Optional[str] = None, show_failed: bool = False, show_throttled: bool = False, raw: bool = False, show_all: bool = False, mode_filter: Optional[str] = None, category_filter: Optional[str] = None, run_id_filter: Optional[str] = None, ebay_fee_pct: float = EBAY_FEE_PCT, payment_fee_pct: float = PAYMENT_FEE_PCT, shipping_flat: float = SHIPPING_FLAT, export_csv: Optional[str] = None, near_miss: bool = False, near_profit: float = 5.0, near_roi: float = 0.02, near_comps: int = 2, recalc: bool = True, quiet: bool = False):
-    """View saved deals from JSON file. Shows PASSED, FAILED, and PENDING sections."""
-    deals = load_deals_from_file()
-    if not deals:
-        if os.path.exists('data/deals.json'):
-            print("File exists but contains no deals.")
-        sys.exit(1)
-        return
-    
-    # Determine effective fee settings from deals
-    effective_fee_settings = None
+def _deals_display_metrics(deals: List[Dict], cli_fee_settings: Dict, recalc: bool) -> List[Tuple[Dict, str, float, float]]:
+    """
+    Resolve fee settings and net metrics for a list of deals in one pass.
+    Returns (effective_fees, fee_source, net_profit, net_roi) per deal, in order.
+    Metrics are recalculated if recalc is set or the deal has no fee settings of its own
+    (CLI defaults are used then); otherwise the saved values are shown.
+    """
+    metrics = []
+    append = metrics.append
+    for deal in deals:
+        deal_fee_settings = _extract_fee_settings(deal)
+        if deal_fee_settings:
+            # Use fee settings from record
+            effective_fees = deal_fee_settings
+            fee_source = "from record"
+        else:
+            # Use CLI defaults
+            effective_fees = cli_fee_settings
+            fee_source = "from CLI defaults"
+        
+        if recalc or not deal_fee_settings:
+            net_profit, net_roi = _recalculate_deal_metrics(deal, effective_fees)
+        else:
+            net_profit = deal.get('net_profit', 0)
+            net_roi = deal.get('net_roi', 0)
+        append((effective_fees, fee_source, net_profit, net_roi))
+    return metrics
+
+def _profit_roi_sort_key(deal: Dict) -> Tuple[float, float]:
+    """Sort key for ranking saved deals: net_profit, then net_roi (missing values count as 0)."""
+    get = deal.get
+    return (get('net_profit', 0), get('net_roi', 0))
+
+def _saved_net_roi_sort_key(deal: Dict) -> float:
+    """Sort key for ranking saved deals by net_roi (missing values count as 0)."""
+    return deal.get('net_roi', 0)
+
+def _passed_deal_filter(mode_filter: Optional[str] = None, category_filter: Optional[str] = None) -> Optional[Callable[[Dict], bool]]:
+    """
+    Build the PASSED-deal predicate for the given view filters, or None if no filter is set.
+    The category filter is lowercased once here rather than per deal.
+    """
+    if not mode_filter and not category_filter:
+        return None
+    category_filter_lower = category_filter.lower() if category_filter else None
     
-    # Separate deals into PASSED, FAILED, PENDING, SKIPPED
+    def keep(deal: Dict) -> bool:
+        if mode_filter and deal.get('scan_mode') != mode_filter and deal.get('mode') != mode_filter:
+            return False
+        if category_filter_lower:
+            source_categories = deal.get('source_categories', [])
+            if isinstance(source_categories, str):
+                source_categories = [source_categories]
+            elif not isinstance(source_categories, list):
+                source_categories = []
+            # Check if category_filter matches any category in source_categories (case-insensitive)
+            return any(cat.lower() == category_filter_lower for cat in source_categories if cat)
+        return True
+    return keep
+
+def _bucket_deals_by_status(deals: List[Dict], mode_filter: Optional[str] = None, category_filter: Optional[str] = None) -> Tuple[List[Dict], List[Dict], List[Dict], List[Dict]]:
+    """
+    Separate deals into (passed, failed, pending, skipped) lists in one pass, keeping their order.
+    PASSED deals are filtered by mode and category (if specified) as they are bucketed.
+    """
     passed_deals = []
     failed_deals = []
     pending_deals = []
     skipped_deals = []
+    keep_passed = _passed_deal_filter(mode_filter, category_filter)
     
     for deal in deals:
-        # Filter by run_id if specified
-        if run_id_filter and deal.get('run_id') != run_id_filter:
-            continue
-        
         status = deal.get('status')
         if status == 'pending':
             pending_deals.append(deal)
         elif status == 'skipped':
             skipped_deals.append(deal)
         elif status == 'passed' or (status is None and deal.get('passed', False)):
-            passed_deals.append(deal)
+            if keep_passed is None or keep_passed(deal):
+                passed_deals.append(deal)
         else:
             failed_deals.append(deal)
+    return passed_deals, failed_deals, pending_deals, skipped_deals
+
+def _export_reports(run_id: str, mode_filter: Optional[str], passed_csv: str, nearmiss_csv: str, all_csv: str, near_profit: float = 5.0, near_roi: float = 0.02, near_comps: int = 2):
+    """
+    Write the run-scoped passed / near-miss / all CSVs for report and upload from one load
+    of the run's deals. Each file has the rows `view --export-csv` would write (with --top 0,
+    and --near-miss or --all respectively).
+    """
+    deals = load_deals_from_file(run_id=run_id)
+    if not deals and not os.path.exists(DEALS_DB_FILE):
+        sys.exit(1)
     
-    # Filter PASSED deals by mode, category, and run_id if specified
-    if mode_filter:
-        passed_deals = [d for d in passed_deals if d.get('scan_mode') == mode_filter or d.get('mode') == mode_filter]
-    if category_filter:
-        category_filter_lower = category_filter.lower()
-        filtered_passed = []
-        for d in passed_deals:
-            source_categories = d.get('source_categories', [])
-            if isinstance(source_categories, str):
-                source_categories = [source_categories]
-            elif not isinstance(source_categories, list):
-                source_categories = []
-            # Check if category_filter matches any category in source_categories (case-insensitive)
-            if any(cat.lower() == category_filter_lower for cat in source_categories if cat):
-                filtered_passed.append(d)
-        passed_deals = filtered_passed
+    # PENDING deals are left out, as in view (they are only shown with --show-throttled)
+    passed_deals, failed_deals, _, skipped_deals = _bucket_deals_by_status(deals, mode_filter)
+    
+    # Near-misses come from the FAILED deals in saved order, then are ranked
+    near_miss_deals = _find_near_misses(failed_deals, near_profit, near_roi, near_comps)
+    print(f"Near-miss scanned FAILED={len(failed_deals)}, matched={len(near_miss_deals)}")
+    print()
+    near_miss_deals.sort(key=_profit_roi_sort_key, reverse=True)
+    
+    passed_deals.sort(key=_profit_roi_sort_key, reverse=True)
+    failed_deals.sort(key=_saved_net_roi_sort_key, reverse=True)
+    
+    # The three files are independent (read-only deal lists, distinct paths), so their writes overlap
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(_export_deals_to_csv, passed_deals, passed_csv),
+            executor.submit(_export_deals_to_csv, itertools.chain(passed_deals, near_miss_deals), nearmiss_csv),
+            executor.submit(_export_deals_to_csv, itertools.chain(passed_deals, failed_deals, skipped_deals), all_csv)
+        ]
+        for future in futures:
+            future.result()
+
+def view_deals(top: int = 20, only_status: Optional[str] = None, show_failed: bool = False, show_throttled: bool = False, raw: bool = False, show_all: bool = False, mode_filter: Optional[str] = None, category_filter: Optional[str] = None, run_id_filter: Optional[str] = None, ebay_fee_pct: float = EBAY_FEE_PCT, payment_fee_pct: float = PAYMENT_FEE_PCT, shipping_flat: float = SHIPPING_FLAT, export_csv: Optional[str] = None, near_miss: bool = False, near_profit: float = 5.0, near_roi: float = 0.02, near_comps: int = 2, recalc: bool = True):
+    """View saved deals from the deals database. Shows PASSED, FAILED, and PENDING sections."""
+    # The run_id filter is applied by the query; an empty run just shows empty sections.
+    # Whether there is anything to view, and the "Total in file" line, still cover the
+    # whole file, so with --run-id those come from a separate per-status count
+    deals = load_deals_from_file(run_id=run_id_filter)
+    file_status_counts = count_deals_by_status() if run_id_filter else None
+    if not (file_status_counts if run_id_filter else deals):
+        if os.path.exists(DEALS_DB_FILE):
+            print("File exists but contains no deals.")
+        sys.exit(1)
+        return
+    
+    # CLI args / defaults, shared by every deal that has no fee settings of its own
+    cli_fee_settings = {
+        'ebay_fee_pct': ebay_fee_pct,
+        'payment_fee_pct': payment_fee_pct,
+        'shipping_flat': shipping_flat
+    }
     
-    # Try to get fee settings from the deals that will be displayed (prioritize passed_deals)
+    # Separate deals into PASSED, FAILED, PENDING, SKIPPED
+    passed_deals, failed_deals, pending_deals, skipped_deals = _bucket_deals_by_status(deals, mode_filter, category_filter)
+    # Totals for the "Total in file" line (without --run-id), taken before the sections are filtered for display:
+    # every deal lands in one section unless it is a PASSED deal dropped by --mode/--category
+    total_in_file_passed = len(deals) - len(failed_deals) - len(pending_deals) - len(skipped_deals)
+    total_in_file_pending = len(pending_deals)
+    unfiltered_failed_deals = failed_deals
+    
+    # Print header with effective fee settings: try the deals that will be displayed (prioritize passed_deals)
+    effective_fee_settings = None
     if passed_deals:
         effective_fee_settings = _extract_fee_settings(passed_deals[0])
     elif deals:  # If no passed deals, try any deal with fee_settings
@@ -3650,24 +3988,18 @@ def view_deals(top: int = 20, only_status: Optional[str] = None, show_failed: bo
     
     # Fall back to CLI args / defaults
     if effective_fee_settings is None:
-        effective_fee_settings = {
-            'ebay_fee_pct': ebay_fee_pct,
-            'payment_fee_pct': payment_fee_pct,
-            'shipping_flat': shipping_flat
-        }
+        effective_fee_settings = cli_fee_settings
     
-    # Print header with effective fee settings (unless quiet mode)
-    if not quiet:
-        print("=" * 80)
-        print("View Saved Deals")
-        print(f"Fee settings: ebay_fee_pct={effective_fee_settings['ebay_fee_pct']:.4f}, payment_fee_pct={effective_fee_settings['payment_fee_pct']:.4f}, shipping_flat=${effective_fee_settings['shipping_flat']:.2f}")
-        print("=" * 80)
-        print()
+    print(RULE_EQ)
+    print("View Saved Deals")
+    print(f"Fee settings: ebay_fee_pct={effective_fee_settings['ebay_fee_pct']:.4f}, payment_fee_pct={effective_fee_settings['payment_fee_pct']:.4f}, shipping_flat=${effective_fee_settings['shipping_flat']:.2f}")
+    print(RULE_EQ)
+    print()
     
     # Handle --raw mode: bypass all filters and show first 10 deals
     if raw:
         print(f"[RAW MODE] Showing first 10 deals (no filters):")
-        print("-" * 80)
+        print(RULE_DASH)
         raw_deals = deals[:10]
         for i, deal in enumerate(raw_deals, 1):
             print(f"{i}. {deal.get('title', 'N/A')[:70]}")
@@ -3687,39 +4019,40 @@ def view_deals(top: int = 20, only_status: Optional[str] = None, show_failed: bo
     if near_miss and not show_all:
         # Build near_miss_results from FAILED items only (before they get filtered out)
         failed_count = len(failed_deals)
-        near_miss_deals = [d for d in failed_deals if _is_near_miss(d, near_profit, near_roi, near_comps)]
+        near_miss_deals = _find_near_misses(failed_deals, near_profit, near_roi, near_comps)
         matched_count = len(near_miss_deals)
         # Debug line
         print(f"Near-miss scanned FAILED={failed_count}, matched={matched_count}")
         print()
         # Sort near-miss results by net_profit desc then net_roi desc
-        near_miss_deals.sort(key=lambda x: (x.get('net_profit', 0), x.get('net_roi', 0)), reverse=True)
+        near_miss_deals.sort(key=_profit_roi_sort_key, reverse=True)
         # When near_miss=True, ignore show_failed default (treat it as True internally for this mode)
         # This means we don't clear failed_deals later
     
-    # Sort PASSED deals by net_profit descending, then net_roi if net_profit equal
-    passed_deals.sort(key=lambda x: (x.get('net_profit', 0), x.get('net_roi', 0)), reverse=True)
-    failed_deals.sort(key=lambda x: x.get('net_roi', 0), reverse=True)
     pending_deals.sort(key=lambda x: x.get('buy_price', 0), reverse=True)
     
     # Store original counts before limiting
     total_passed = len(passed_deals)
     
-    # Limit to top N for PASSED section
+    # Rank PASSED deals by net_profit descending, then net_roi if net_profit equal,
+    # selecting only the top N when limited (nlargest keeps sort order, ties included)
     if top > 0:
-        passed_deals = passed_deals[:top]
+        passed_deals = heapq.nlargest(top, passed_deals, key=_profit_roi_sort_key)
+    else:
+        passed_deals.sort(key=_profit_roi_sort_key, reverse=True)
     
     # Filter sections based on flags
+    only_status_lower = only_status.lower() if only_status else None
     if only_status:
-        if only_status.lower() == 'passed':
+        if only_status_lower == 'passed':
             failed_deals = []
             pending_deals = []
             show_all = False  # Override --all when only_status=passed
-        elif only_status.lower() == 'failed':
+        elif only_status_lower == 'failed':
             passed_deals = []
             pending_deals = []
             show_all = False
-        elif only_status.lower() == 'pending':
+        elif only_status_lower == 'pending':
             passed_deals = []
             failed_deals = []
             show_all = False
@@ -3732,57 +4065,44 @@ def view_deals(top: int = 20, only_status: Optional[str] = None, show_failed: bo
         failed_deals = []
         pending_deals = []
     
-    # Limit FAILED section only if showing all
+    # Which optional sections are shown (and exported), now that --only-status has been applied
+    show_near_miss_section = near_miss and not show_all
+    show_failed_section = show_all or show_failed or only_status_lower == 'failed'
+    show_pending_section = show_throttled or only_status_lower == 'pending'
+    
+    # Rank FAILED deals by net_roi descending; limit the section only if showing all
     if show_all and top > 0:
-        failed_deals = failed_deals[:top]
+        failed_deals = heapq.nlargest(top, failed_deals, key=_saved_net_roi_sort_key)
+    else:
+        failed_deals.sort(key=_saved_net_roi_sort_key, reverse=True)
     
     # Print PASSED section (always show if available, but skip "No PASS deals found" if near_miss is active)
-    if passed_deals and not quiet:
-        print(f"✓ PASSED ({len(passed_deals)} items):")
-        print("-" * 80)
-        for deal in passed_deals:
-            title = deal.get('title', 'N/A')
-            buy_price = deal.get('buy_price', 0)
+    if passed_deals:
+        # Each section is rendered into one string and written once
+        lines = []
+        append = lines.append
+        append(f"✓ PASSED ({len(passed_deals)} items):")
+        append(RULE_DASH)
+        for deal, (effective_fees, fee_source, net_profit, net_roi) in zip(passed_deals, _deals_display_metrics(passed_deals, cli_fee_settings, recalc)):
+            get = deal.get
             # Use expected_sale_price if available, otherwise use avg_sold_price as proxy
-            expected_sale = deal.get('ebay_expected_sale_price')
+            expected_sale = get('ebay_expected_sale_price')
             if expected_sale is None or expected_sale <= 0:
-                expected_sale = deal.get('ebay_avg_sold_price', 0)
-            url = deal.get('url', 'N/A')
+                expected_sale = get('ebay_avg_sold_price', 0)
             
             # Get scan_mode and source_category for display
-            scan_mode = deal.get('scan_mode') or deal.get('mode', 'N/A')
-            source_category = deal.get('source_category', 'Unknown')
-            
-            # Determine fee settings for this deal
-            deal_fee_settings = _extract_fee_settings(deal)
-            if deal_fee_settings:
-                # Use fee settings from record
-                effective_fees = deal_fee_settings
-                fee_source = "from record"
-            else:
-                # Use CLI defaults
-                effective_fees = {
-                    'ebay_fee_pct': ebay_fee_pct,
-                    'payment_fee_pct': payment_fee_pct,
-                    'shipping_flat': shipping_flat
-                }
-                fee_source = "from CLI defaults"
-            
-            # Get net profit metrics (recalculate if requested or if using CLI defaults)
-            if recalc or not deal_fee_settings:
-                net_profit, net_roi = _recalculate_deal_metrics(deal, effective_fees)
-            else:
-                net_profit = deal.get('net_profit', 0)
-                net_roi = deal.get('net_roi', 0)
-            
-            comps_used = deal.get('sold_count_used') or deal.get('ebay_trimmed_count', 0)
-            print(f"Title: {title[:70]}")
-            print(f"  Buy: ${buy_price:.2f} | Expected Sale: ${expected_sale:.2f} | Net Profit: ${net_profit:.2f} | Net ROI: {net_roi:.2%} | Comps: {comps_used}")
-            print(f"  Mode: {scan_mode} | Category: {source_category}")
-            print(f"  Fees: ({fee_source}) ebay={effective_fees['ebay_fee_pct']:.4f}, payment={effective_fees['payment_fee_pct']:.4f}, shipping=${effective_fees['shipping_flat']:.2f}")
-            print(f"  URL: {url}")
-            print()
-    elif not show_all and not only_status and not near_miss and not quiet:
+            scan_mode = get('scan_mode') or get('mode', 'N/A')
+            comps_used = get('sold_count_used') or get('ebay_trimmed_count', 0)
+            # One entry per deal (ending in its blank separator line)
+            append(
+                f"Title: {get('title', 'N/A')[:70]}\n"
+                f"  Buy: ${get('buy_price', 0):.2f} | Expected Sale: ${expected_sale:.2f} | Net Profit: ${net_profit:.2f} | Net ROI: {net_roi:.2%} | Comps: {comps_used}\n"
+                f"  Mode: {scan_mode} | Category: {get('source_category', 'Unknown')}\n"
+                f"  Fees: ({fee_source}) ebay={effective_fees['ebay_fee_pct']:.4f}, payment={effective_fees['payment_fee_pct']:.4f}, shipping=${effective_fees['shipping_flat']:.2f}\n"
+                f"  URL: {get('url', 'N/A')}\n"
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
+    elif not show_all and not only_status and not near_miss:
         # No PASS deals and not showing all and not near_miss - show helpful message
         print("No PASS deals found. Try --all or run scan with --mode active.")
         print()
@@ -3791,85 +4111,84 @@ def view_deals(top: int = 20, only_status: Optional[str] = None, show_failed: bo
             return
     
     # Print NEAR-MISS section (only if --near-miss is ON and --all is NOT)
-    if near_miss and not show_all and not quiet:
+    if show_near_miss_section:
         if near_miss_deals:
-            print(f"≈ NEAR-MISS ({len(near_miss_deals)} items):")
-            print("-" * 80)
-            for deal in near_miss_deals:
-                # Determine fee settings for this deal
-                deal_fee_settings = _extract_fee_settings(deal)
-                if deal_fee_settings:
-                    effective_fees = deal_fee_settings
-                    fee_source = "from record"
-                else:
-                    effective_fees = {
-                        'ebay_fee_pct': ebay_fee_pct,
-                        'payment_fee_pct': payment_fee_pct,
-                        'shipping_flat': shipping_flat
-                    }
-                    fee_source = "from CLI defaults"
-                
-                # Recalculate metrics if requested
-                if recalc or not deal_fee_settings:
-                    net_profit, net_roi = _recalculate_deal_metrics(deal, effective_fees)
-                else:
-                    net_profit = deal.get('net_profit', 0)
-                    net_roi = deal.get('net_roi', 0)
-                
-                print(f"Title: {deal.get('title', 'N/A')[:70]}")
-                print(f"  Buy: ${deal.get('buy_price', 0):.2f} | URL: {deal.get('url', 'N/A')}")
-                fail_reason = deal.get('fail_reason') or deal.get('reason', 'Unknown')
-                print(f"  Reason: {fail_reason}")
-                comps_used = deal.get('sold_count_used') or deal.get('ebay_trimmed_count') or deal.get('comps') or deal.get('sold_comps') or 0
-                print(f"  Net Profit: ${net_profit:.2f} | Net ROI: {net_roi:.2%} | Comps: {comps_used}")
-                print(f"  Fees: ({fee_source}) ebay={effective_fees['ebay_fee_pct']:.4f}, payment={effective_fees['payment_fee_pct']:.4f}, shipping=${effective_fees['shipping_flat']:.2f}")
-                print()
-        elif not export_csv and not quiet:
+            lines = []
+            append = lines.append
+            append(f"≈ NEAR-MISS ({len(near_miss_deals)} items):")
+            append(RULE_DASH)
+            for deal, (effective_fees, fee_source, net_profit, net_roi) in zip(near_miss_deals, _deals_display_metrics(near_miss_deals, cli_fee_settings, recalc)):
+                get = deal.get
+                fail_reason = get('fail_reason') or get('reason', 'Unknown')
+                comps_used = get('sold_count_used') or get('ebay_trimmed_count') or get('comps') or get('sold_comps') or 0
+                append(
+                    f"Title: {get('title', 'N/A')[:70]}\n"
+                    f"  Buy: ${get('buy_price', 0):.2f} | URL: {get('url', 'N/A')}\n"
+                    f"  Reason: {fail_reason}\n"
+                    f"  Net Profit: ${net_profit:.2f} | Net ROI: {net_roi:.2%} | Comps: {comps_used}\n"
+                    f"  Fees: ({fee_source}) ebay={effective_fees['ebay_fee_pct']:.4f}, payment={effective_fees['payment_fee_pct']:.4f}, shipping=${effective_fees['shipping_flat']:.2f}\n"
+                )
+            sys.stdout.write("\n".join(lines) + "\n")
+        elif not export_csv:
             # Only print this message if we're not exporting (to avoid clutter when exporting empty CSV)
             print("≈ NEAR-MISS (0 items):")
-            print("-" * 80)
+            print(RULE_DASH)
             print("No near-miss items found.")
             print()
     
     # Print FAILED section (only if --all is specified or explicitly requested)
-    if failed_deals and (show_all or show_failed or (only_status and only_status.lower() == 'failed')) and not quiet:
-        print(f"✗ FAILED ({len(failed_deals)} items):")
-        print("-" * 80)
+    if failed_deals and show_failed_section:
+        lines = []
+        append = lines.append
+        append(f"✗ FAILED ({len(failed_deals)} items):")
+        append(RULE_DASH)
         for deal in failed_deals:
-            print(f"Title: {deal.get('title', 'N/A')[:70]}")
-            print(f"  Buy: ${deal.get('buy_price', 0):.2f} | URL: {deal.get('url', 'N/A')}")
-            fail_reason = deal.get('fail_reason') or deal.get('reason', 'Unknown')
-            print(f"  Reason: {fail_reason}")
-            if deal.get('net_profit') is not None:
-                net_profit = deal.get('net_profit', 0)
-                net_roi = deal.get('net_roi', 0)
-                print(f"  Net Profit: ${net_profit:.2f} | Net ROI: {net_roi:.2%}")
-            print()
+            get = deal.get
+            fail_reason = get('fail_reason') or get('reason', 'Unknown')
+            entry = (
+                f"Title: {get('title', 'N/A')[:70]}\n"
+                f"  Buy: ${get('buy_price', 0):.2f} | URL: {get('url', 'N/A')}\n"
+                f"  Reason: {fail_reason}\n"
+            )
+            net_profit = get('net_profit')
+            if net_profit is not None:
+                entry += f"  Net Profit: ${net_profit:.2f} | Net ROI: {get('net_roi', 0):.2%}\n"
+            append(entry)
+        sys.stdout.write("\n".join(lines) + "\n")
     
     # Print SKIPPED section (only if --all is specified)
-    if skipped_deals and show_all and not quiet:
-        print(f"⊘ SKIPPED ({len(skipped_deals)} items):")
-        print("-" * 80)
+    if skipped_deals and show_all:
+        lines = []
+        append = lines.append
+        append(f"⊘ SKIPPED ({len(skipped_deals)} items):")
+        append(RULE_DASH)
         for deal in skipped_deals:
-            print(f"Title: {deal.get('title', 'N/A')[:70]}")
-            print(f"  Buy: ${deal.get('buy_price', 0):.2f} | URL: {deal.get('url', 'N/A')}")
-            fail_reason = deal.get('fail_reason') or deal.get('reason', 'Unknown')
-            print(f"  Reason: {fail_reason}")
-            print()
+            get = deal.get
+            fail_reason = get('fail_reason') or get('reason', 'Unknown')
+            append(
+                f"Title: {get('title', 'N/A')[:70]}\n"
+                f"  Buy: ${get('buy_price', 0):.2f} | URL: {get('url', 'N/A')}\n"
+                f"  Reason: {fail_reason}\n"
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
     
     # Print PENDING section (only if explicitly requested)
-    if pending_deals and (show_throttled or (only_status and only_status.lower() == 'pending')):
-        print(f"⏳ PENDING ({len(pending_deals)} items):")
-        print("-" * 80)
+    if pending_deals and show_pending_section:
+        lines = []
+        append = lines.append
+        append(f"⏳ PENDING ({len(pending_deals)} items):")
+        append(RULE_DASH)
         for deal in pending_deals:
-            print(f"Title: {deal.get('title', 'N/A')[:70]}")
-            print(f"  Buy: ${deal.get('buy_price', 0):.2f} | URL: {deal.get('url', 'N/A')}")
-            reason = deal.get('reason', 'Unknown')
-            print(f"  Reason: {reason}")
-            print()
+            get = deal.get
+            append(
+                f"Title: {get('title', 'N/A')[:70]}\n"
+                f"  Buy: ${get('buy_price', 0):.2f} | URL: {get('url', 'N/A')}\n"
+                f"  Reason: {get('reason', 'Unknown')}\n"
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
     
     # Print summary if nothing shown (but not if near_miss is active, as it has its own display)
-    if not passed_deals and not failed_deals and not pending_deals and not (near_miss and not show_all) and not quiet:
+    if not passed_deals and not failed_deals and not pending_deals and not show_near_miss_section:
         print("0 deals after filters")
         print()
         # Show active filters
@@ -3887,39 +4206,331 @@ def view_deals(top: int = 20, only_status: Optional[str] = None, show_failed: bo
         if filters:
             print(f"Active filters: {', '.join(filters)}")
             print()
-        # Count all deals by status from original list
-        total_passed = sum(1 for d in deals if d.get('status') == 'passed' or (d.get('status') is None and d.get('passed', False)))
-        total_failed = sum(1 for d in deals if d.get('status') == 'failed')
-        total_pending = sum(1 for d in deals if d.get('status') == 'pending')
-        print(f"Total in file: PASSED={total_passed}, FAILED={total_failed}, PENDING={total_pending}")
+        if file_status_counts is not None:
+            total_in_file_passed = file_status_counts['passed']
+            total_failed = file_status_counts['failed']
+            total_in_file_pending = file_status_counts['pending']
+        else:
+            # FAILED counts only status='failed' rows (the section also holds rows without a usable status)
+            total_failed = sum(1 for d in unfiltered_failed_deals if d.get('status') == 'failed')
+        print(f"Total in file: PASSED={total_in_file_passed}, FAILED={total_failed}, PENDING={total_in_file_pending}")
         print()
         print("Tip: Use --show-failed or --show-throttled to see more, or --raw to bypass filters")
         print()
     
     # Export to CSV if requested (raw mode handles export before return above)
     if export_csv:
-        # Collect all deals that are being displayed (same logic as print sections above)
-        deals_to_export = []
+        # Collect the sections being displayed (same logic as print sections above);
+        # they are streamed to the writer rather than copied into one list
+        export_sections = []
         if passed_deals:
-            deals_to_export.extend(passed_deals)
+            export_sections.append(passed_deals)
         # Include near-miss deals if --near-miss is ON and --all is NOT (even if empty list)
-        if near_miss and not show_all:
-            deals_to_export.extend(near_miss_deals)
-        if failed_deals and (show_all or show_failed or (only_status and only_status.lower() == 'failed')):
-            deals_to_export.extend(failed_deals)
+        if show_near_miss_section:
+            export_sections.append(near_miss_deals)
+        if failed_deals and show_failed_section:
+            export_sections.append(failed_deals)
         if skipped_deals and show_all:
-            deals_to_export.extend(skipped_deals)
-        if pending_deals and (show_throttled or (only_status and only_status.lower() == 'pending')):
-            deals_to_export.extend(pending_deals)
+            export_sections.append(skipped_deals)
+        if pending_deals and show_pending_section:
+            export_sections.append(pending_deals)
         
         # Always write CSV (even with 0 rows) when --export-csv is provided
-        rows_written = _export_deals_to_csv(deals_to_export, export_csv)
-        if not quiet:
-            print(f"Exported {rows_written - 1} rows to {export_csv}")  # Subtract 1 for header
-            print()
+        rows_written = _export_deals_to_csv(itertools.chain.from_iterable(export_sections), export_csv)
+        print(f"Exported {rows_written - 1} rows to {export_csv}")  # Subtract 1 for header
+        print()
+
+def _run_scan_command(args: argparse.Namespace):
+    """Run the scan subcommand: scan Woot deals and save the results."""
+    arg_values = vars(args)
+    resume_flag = arg_values.get('resume', False)
+    stream_flag = arg_values.get('stream', False)
+    brands_str = arg_values.get('brands', None)
+    # args.mode refers to --mode option in scan subcommand
+    mode_str = arg_values.get('mode', 'conservative')
+    ebay_fee_pct = arg_values.get('ebay_fee_pct', EBAY_FEE_PCT)
+    payment_fee_pct = arg_values.get('payment_fee_pct', PAYMENT_FEE_PCT)
+    shipping_flat = arg_values.get('shipping_flat', SHIPPING_FLAT)
+    no_cache_flag = arg_values.get('no_cache', False)
+    process_woot_mode_with_save(category=args.category, limit=args.limit, resume=resume_flag, stream=stream_flag, brands=brands_str, mode=mode_str, ebay_fee_pct=ebay_fee_pct, payment_fee_pct=payment_fee_pct, shipping_flat=shipping_flat, no_cache=no_cache_flag)
+
+def _run_view_command(args: argparse.Namespace):
+    """Run the view subcommand: show (and optionally export) saved deals."""
+    arg_values = vars(args)
+    ebay_fee_pct = arg_values.get('ebay_fee_pct', EBAY_FEE_PCT)
+    payment_fee_pct = arg_values.get('payment_fee_pct', PAYMENT_FEE_PCT)
+    shipping_flat = arg_values.get('shipping_flat', SHIPPING_FLAT)
+    view_deals(top=args.top, only_status=args.only_status, 
+               show_failed=args.show_failed, show_throttled=args.show_throttled,
+               raw=arg_values.get('raw', False), show_all=arg_values.get('all', False),
+               mode_filter=arg_values.get('mode', None), category_filter=arg_values.get('category', None),
+               run_id_filter=arg_values.get('run_id', None),
+               ebay_fee_pct=ebay_fee_pct, payment_fee_pct=payment_fee_pct, shipping_flat=shipping_flat,
+               export_csv=arg_values.get('export_csv', None),
+               near_miss=arg_values.get('near_miss', False),
+               near_profit=arg_values.get('near_profit', 5.0),
+               near_roi=arg_values.get('near_roi', 0.02),
+               near_comps=arg_values.get('near_comps', 2),
+               recalc=arg_values.get('recalc', True))
+
+def _run_upload_command(args: argparse.Namespace):
+    """Run the upload subcommand: analyze a CSV of items and export run-scoped CSVs."""
+    arg_values = vars(args)
+    mode_str = arg_values.get('mode', 'highticket')
+    infile = arg_values.get('infile', None)
+    ebay_fee_pct = arg_values.get('ebay_fee_pct', EBAY_FEE_PCT)
+    payment_fee_pct = arg_values.get('payment_fee_pct', PAYMENT_FEE_PCT)
+    shipping_flat = arg_values.get('shipping_flat', SHIPPING_FLAT)
+    outdir = arg_values.get('outdir', 'data/reports')
+    allow_empty = arg_values.get('allow_empty', False)
+    no_cache = arg_values.get('no_cache', False)
+    
+    if not infile:
+        print("ERROR: --infile is required")
+        sys.exit(1)
+    
+    if not os.path.exists(infile):
+        print(f"ERROR: CSV file not found: {infile}")
+        sys.exit(1)
+    
+    # Create output directory
+    os.makedirs(outdir, exist_ok=True)
+    
+    # Generate run_id and date stamp
+    now = datetime.now()
+    run_id = now.strftime('%Y-%m-%d_%H%M%S')
+    date_stamp = now.strftime('%Y-%m-%d')
+    
+    # Run analysis
+    analyzed_count = process_upload_csv_with_save(
+        infile=infile,
+        mode=mode_str,
+        ebay_fee_pct=ebay_fee_pct,
+        payment_fee_pct=payment_fee_pct,
+        shipping_flat=shipping_flat,
+        run_id=run_id,
+        no_cache=no_cache
+    )
+    print()
+    
+    # Check if analyzed 0 items
+    if analyzed_count == 0:
+        if not allow_empty:
+            sys.stdout.write(EMPTY_WARN_UPLOAD + EMPTY_WARN_EXIT)
+            sys.exit(1)
+        else:
+            sys.stdout.write(EMPTY_WARN_UPLOAD + EMPTY_WARN_CONTINUE)
+    
+    # Export CSVs
+    print("Exporting CSVs (run-scoped)...")
+    
+    passed_csv = os.path.join(outdir, f"passed-{date_stamp}.csv")
+    nearmiss_csv = os.path.join(outdir, f"nearmiss-{date_stamp}.csv")
+    all_csv = os.path.join(outdir, f"all-{date_stamp}.csv")
+    _export_reports(run_id, mode_str, passed_csv, nearmiss_csv, all_csv)
+    # Export results and summary are written in one go
+    sys.stdout.write("\n".join([
+        f"✓ Exported passed deals to: {passed_csv}",
+        f"✓ Exported near-miss deals to: {nearmiss_csv}",
+        f"✓ Exported all deals to: {all_csv}",
+        "",
+        RULE_EQ,
+        "Analysis complete!",
+        f"Run ID: {run_id}",
+        f"Items analyzed: {analyzed_count}",
+        f"Output directory: {outdir}",
+        RULE_EQ
+    ]) + "\n")
+
+def _run_report_command(args: argparse.Namespace):
+    """Run the report subcommand: scan, then export run-scoped CSVs."""
+    arg_values = vars(args)
+    mode_str = arg_values.get('mode', 'highticket')
+    category_str = arg_values.get('category', 'Tools')
+    limit_int = arg_values.get('limit', 120)
+    brands_str = arg_values.get('brands', None)
+    stream_flag = arg_values.get('stream', False)
+    ebay_fee_pct = arg_values.get('ebay_fee_pct', EBAY_FEE_PCT)
+    payment_fee_pct = arg_values.get('payment_fee_pct', PAYMENT_FEE_PCT)
+    shipping_flat = arg_values.get('shipping_flat', SHIPPING_FLAT)
+    outdir = arg_values.get('outdir', 'data/reports')
+    allow_empty = arg_values.get('allow_empty', False)
+    
+    # Create output directory
+    os.makedirs(outdir, exist_ok=True)
+    
+    # Generate run_id and date stamp
+    now = datetime.now()
+    run_id = now.strftime('%Y-%m-%d_%H%M%S')
+    date_stamp = now.strftime('%Y-%m-%d')
+    
+    # Banner is built up and written in one go
+    banner = [
+        RULE_EQ,
+        f"Daily Report Generation - {date_stamp}",
+        f"Run ID: {run_id}",
+        f"Mode: {mode_str} | Category: {category_str} | Limit: {limit_int}"
+    ]
+    if brands_str:
+        banner.append(f"Brands: {brands_str}")
+    banner.append(f"Fee settings: ebay_fee_pct={ebay_fee_pct:.4f}, payment_fee_pct={payment_fee_pct:.4f}, shipping_flat=${shipping_flat:.2f}")
+    no_cache_flag = arg_values.get('no_cache', False)
+    if no_cache_flag:
+        banner.append("[CACHE] bypassed (no-cache enabled)")
+    banner.append(RULE_EQ)
+    banner.append("")
+    sys.stdout.write("\n".join(banner) + "\n")
+    
+    # Step 1: Run scan
+    print("Step 1: Running scan...")
+    analyzed_count = process_woot_mode_with_save(
+        category=category_str,
+        limit=limit_int,
+        resume=False,
+        stream=stream_flag,
+        brands=brands_str,
+        mode=mode_str,
+        ebay_fee_pct=ebay_fee_pct,
+        payment_fee_pct=payment_fee_pct,
+        shipping_flat=shipping_flat,
+        run_id=run_id,
+        no_cache=arg_values.get('no_cache', False)
+    )
+    print()
+    
+    # Check if scan analyzed 0 items
+    if analyzed_count == 0:
+        if not allow_empty:
+            sys.stdout.write(EMPTY_WARN_REPORT + EMPTY_WARN_EXIT)
+            sys.exit(1)
+        else:
+            sys.stdout.write(EMPTY_WARN_REPORT + EMPTY_WARN_CONTINUE)
+    
+    # Step 2: Export CSVs
+    print("Step 2: Exporting CSVs (run-scoped)...")
+    
+    # Export passed / nearmiss / all CSVs from one load of this run's deals
+    passed_csv = os.path.join(outdir, f"passed-{date_stamp}.csv")
+    nearmiss_csv = os.path.join(outdir, f"nearmiss-{date_stamp}.csv")
+    all_csv = os.path.join(outdir, f"all-{date_stamp}.csv")
+    _export_reports(run_id, mode_str, passed_csv, nearmiss_csv, all_csv)
+    # Export results and summary are written in one go
+    sys.stdout.write("\n".join([
+        f"✓ Exported passed deals to: {passed_csv}",
+        f"✓ Exported near-miss deals to: {nearmiss_csv}",
+        f"✓ Exported all deals to: {all_csv}",
+        "",
+        RULE_EQ,
+        "Report generation complete!",
+        f"Run ID: {run_id}",
+        f"Items analyzed: {analyzed_count}",
+        f"Output directory: {outdir}",
+        "Files created:",
+        f"  - {passed_csv}",
+        f"  - {nearmiss_csv}",
+        f"  - {all_csv}",
+        RULE_EQ
+    ]) + "\n")
+
+# Subcommand name -> handler; main() falls back to the legacy positional modes
+COMMAND_HANDLERS = {
+    'scan': _run_scan_command,
+    'view': _run_view_command,
+    'upload': _run_upload_command,
+    'report': _run_report_command,
+}
+
+def _run_one_query(query: str, no_retry: bool = False):
+    """Handle --one: run a single eBay query, print its stats and exit."""
+    print(RULE_EQ)
+    print("One-item eBay test")
+    print(RULE_EQ)
+    print()
+    
+    # Print diagnostics
+    print_ebay_diagnostics()
+    
+    # Call with no_retry flag if specified
+    if no_retry:
+        print("[TEST] No-retry mode enabled (will exit immediately on throttle)")
+        print()
+    
+    result = search_ebay_sold(query, no_retry=no_retry)
+    
+    # Check if throttled and exit with non-zero code if in no_retry mode
+    if no_retry and result['status'] == 'EBAY_THROTTLED':
+        print(f"sold_count: {result['sold_count']}")
+        print(f"avg_sold_price: {result['avg_price']:.2f}")
+        print(f"median_sold_price: {result['median_price']:.2f}")
+        sys.exit(1)
+    
+    # Print compact block with all stats
+    print(f"sold_count: {result['sold_count']}")
+    print(f"avg: ${result['avg_price']:.2f}")
+    print(f"median: ${result['median_price']:.2f}")
+    
+    # Print additional stats if available
+    if result.get('p25_price') is not None and result.get('p75_price') is not None:
+        print(f"p25/p75: ${result['p25_price']:.2f} / ${result['p75_price']:.2f}")
+    if result.get('min_price') is not None and result.get('max_price') is not None:
+        print(f"min/max: ${result['min_price']:.2f} / ${result['max_price']:.2f}")
+    if result.get('last_sold_date'):
+        print(f"last_sold_date: {result['last_sold_date']}")
+    
+    # Print sample comps
+    sample_items = result.get('sample_items', [])
+    if sample_items:
+        print(f"sample_comps: {len(sample_items)} items")
+        for idx, item in enumerate(sample_items, 1):
+            title = item.get('title', '')[:60]  # Truncate long titles
+            price = item.get('price', 0.0)
+            print(f"  {idx}. ${price:.2f} - {title}")
+    
+    sys.exit(0)
+
+def _run_ebay_auth_test():
+    """Handle --test-ebay-auth: fetch an OAuth token with the configured credentials and exit."""
+    client_id = os.environ.get('EBAY_CLIENT_ID', '').strip()
+    client_secret = os.environ.get('EBAY_CLIENT_SECRET', '').strip()
+    env = ebay_env()
+    
+    # Determine token URL
+    if env == "SBX":
+        token_url = "https://api.sandbox.ebay.com/identity/v1/oauth2/token"
+    else:
+        token_url = "https://api.ebay.com/identity/v1/oauth2/token"
+    
+    # Print redacted credentials
+    def redact_value(value: str) -> str:
+        """Redact a value: first 6 chars + '...' + last 4 chars."""
+        if not value or len(value) <= 10:
+            return "***" if value else "(empty)"
+        return f"{value[:6]}...{value[-4:]}"
+    
+    print(f"EBAY_CLIENT_ID: {redact_value(client_id)}")
+    print(f"EBAY_CLIENT_SECRET: {redact_value(client_secret)}")
+    print(f"EBAY_ENV: {env}")
+    print(f"Token URL: {token_url}")
+    print()
+    
+    access_token = get_ebay_app_token()
+    if access_token:
+        print("EBAY AUTH OK")
+        sys.exit(0)
+    else:
+        print("EBAY AUTH FAILED")
+        sys.exit(1)
 
 def main():
     """Main execution function."""
+    # Fast path for the one-shot eBay diagnostics in their plain forms (they exit before
+    # any subcommand runs), so building the full parser is skipped; anything else is parsed normally
+    argv = sys.argv[1:]
+    if argv == ['--test-ebay-auth']:
+        _run_ebay_auth_test()
+    if len(argv) in (2, 3) and argv[0] == '--one' and argv[1] and not argv[1].startswith('-') and argv[2:] in ([], ['--no-retry']):
+        _run_one_query(argv[1], no_retry=len(argv) == 3)
+    
     parser = argparse.ArgumentParser(description='Woot → eBay Sold Arbitrage Checker')
     
     # Global arguments (work with any subcommand)
@@ -3950,7 +4561,7 @@ def main():
     scan_parser.add_argument('--limit', type=int, default=10,
                             help='Maximum number of items to scan (default: 10)')
     scan_parser.add_argument('--resume', action='store_true',
-                            help='Resume scan: only process pending items from deals.json')
+                            help='Resume scan: only process pending items from saved deals')
     scan_parser.add_argument('--stream', action='store_true',
                             help='Stream results live as they are evaluated (prints each deal immediately)')
     scan_parser.add_argument('--brands', type=str,
@@ -4054,369 +4665,26 @@ def main():
                               help='Force live eBay API calls, ignore cached results')
     
     args = parser.parse_args()
+    # Parsed options as a dict (defaults included); the legacy modes below read them with .get
+    arg_values = vars(args)
     
     # Handle --one single query test (global flag)
     if args.one:
-        print("=" * 80)
-        print("One-item eBay test")
-        print("=" * 80)
-        print()
-        
-        # Print diagnostics
-        print_ebay_diagnostics()
-        
-        # Call with no_retry flag if specified
-        no_retry = args.no_retry
-        if no_retry:
-            print("[TEST] No-retry mode enabled (will exit immediately on throttle)")
-            print()
-        
-        result = search_ebay_sold(args.one, no_retry=no_retry)
-        
-        # Check if throttled and exit with non-zero code if in no_retry mode
-        if no_retry and result['status'] == 'EBAY_THROTTLED':
-            print(f"sold_count: {result['sold_count']}")
-            print(f"avg_sold_price: {result['avg_price']:.2f}")
-            print(f"median_sold_price: {result['median_price']:.2f}")
-            sys.exit(1)
-        
-        # Print compact block with all stats
-        print(f"sold_count: {result['sold_count']}")
-        print(f"avg: ${result['avg_price']:.2f}")
-        print(f"median: ${result['median_price']:.2f}")
-        
-        # Print additional stats if available
-        if result.get('p25_price') is not None and result.get('p75_price') is not None:
-            print(f"p25/p75: ${result['p25_price']:.2f} / ${result['p75_price']:.2f}")
-        if result.get('min_price') is not None and result.get('max_price') is not None:
-            print(f"min/max: ${result['min_price']:.2f} / ${result['max_price']:.2f}")
-        if result.get('last_sold_date'):
-            print(f"last_sold_date: {result['last_sold_date']}")
-        
-        # Print sample comps
-        sample_items = result.get('sample_items', [])
-        if sample_items:
-            print(f"sample_comps: {len(sample_items)} items")
-            for idx, item in enumerate(sample_items, 1):
-                title = item.get('title', '')[:60]  # Truncate long titles
-                price = item.get('price', 0.0)
-                print(f"  {idx}. ${price:.2f} - {title}")
-        
-        sys.exit(0)
+        _run_one_query(args.one, no_retry=args.no_retry)
     
     # Handle eBay auth test (global flag)
     if args.test_ebay_auth:
-        client_id = os.environ.get('EBAY_CLIENT_ID', '').strip()
-        client_secret = os.environ.get('EBAY_CLIENT_SECRET', '').strip()
-        env = ebay_env()
-        
-        # Determine token URL
-        if env == "SBX":
-            token_url = "https://api.sandbox.ebay.com/identity/v1/oauth2/token"
-        else:
-            token_url = "https://api.ebay.com/identity/v1/oauth2/token"
-        
-        # Print redacted credentials
-        def redact_value(value: str) -> str:
-            """Redact a value: first 6 chars + '...' + last 4 chars."""
-            if not value or len(value) <= 10:
-                return "***" if value else "(empty)"
-            return f"{value[:6]}...{value[-4:]}"
-        
-        print(f"EBAY_CLIENT_ID: {redact_value(client_id)}")
-        print(f"EBAY_CLIENT_SECRET: {redact_value(client_secret)}")
-        print(f"EBAY_ENV: {env}")
-        print(f"Token URL: {token_url}")
-        print()
-        
-        access_token = get_ebay_app_token()
-        if access_token:
-            print("EBAY AUTH OK")
-            sys.exit(0)
-        else:
-            print("EBAY AUTH FAILED")
-            sys.exit(1)
+        _run_ebay_auth_test()
     
     # Handle subcommands or backward compatibility
-    if args.command == 'scan':
-        # New scan command
-        resume_flag = getattr(args, 'resume', False)
-        stream_flag = getattr(args, 'stream', False)
-        brands_str = getattr(args, 'brands', None)
-        # args.mode refers to --mode option in scan subcommand
-        mode_str = getattr(args, 'mode', 'conservative')
-        ebay_fee_pct = getattr(args, 'ebay_fee_pct', EBAY_FEE_PCT)
-        payment_fee_pct = getattr(args, 'payment_fee_pct', PAYMENT_FEE_PCT)
-        shipping_flat = getattr(args, 'shipping_flat', SHIPPING_FLAT)
-        no_cache_flag = getattr(args, 'no_cache', False)
-        process_woot_mode_with_save(category=args.category, limit=args.limit, resume=resume_flag, stream=stream_flag, brands=brands_str, mode=mode_str, ebay_fee_pct=ebay_fee_pct, payment_fee_pct=payment_fee_pct, shipping_flat=shipping_flat, no_cache=no_cache_flag)
-    elif args.command == 'view':
-        # New view command
-        ebay_fee_pct = getattr(args, 'ebay_fee_pct', EBAY_FEE_PCT)
-        payment_fee_pct = getattr(args, 'payment_fee_pct', PAYMENT_FEE_PCT)
-        shipping_flat = getattr(args, 'shipping_flat', SHIPPING_FLAT)
-        view_deals(top=args.top, only_status=args.only_status, 
-                   show_failed=args.show_failed, show_throttled=args.show_throttled,
-                   raw=getattr(args, 'raw', False), show_all=getattr(args, 'all', False),
-                   mode_filter=getattr(args, 'mode', None), category_filter=getattr(args, 'category', None),
-                   run_id_filter=getattr(args, 'run_id', None),
-                   ebay_fee_pct=ebay_fee_pct, payment_fee_pct=payment_fee_pct, shipping_flat=shipping_flat,
-                   export_csv=getattr(args, 'export_csv', None),
-                   near_miss=getattr(args, 'near_miss', False),
-                   near_profit=getattr(args, 'near_profit', 5.0),
-                   near_roi=getattr(args, 'near_roi', 0.02),
-                   near_comps=getattr(args, 'near_comps', 2),
-                   recalc=getattr(args, 'recalc', True))
-    elif args.command == 'upload':
-        # Upload analyze command: analyze CSV file
-        from datetime import datetime
-        
-        mode_str = getattr(args, 'mode', 'highticket')
-        infile = getattr(args, 'infile', None)
-        ebay_fee_pct = getattr(args, 'ebay_fee_pct', EBAY_FEE_PCT)
-        payment_fee_pct = getattr(args, 'payment_fee_pct', PAYMENT_FEE_PCT)
-        shipping_flat = getattr(args, 'shipping_flat', SHIPPING_FLAT)
-        outdir = getattr(args, 'outdir', 'data/reports')
-        allow_empty = getattr(args, 'allow_empty', False)
-        no_cache = getattr(args, 'no_cache', False)
-        
-        if not infile:
-            print("ERROR: --infile is required")
-            sys.exit(1)
-        
-        if not os.path.exists(infile):
-            print(f"ERROR: CSV file not found: {infile}")
-            sys.exit(1)
-        
-        # Create output directory
-        os.makedirs(outdir, exist_ok=True)
-        
-        # Generate run_id and date stamp
-        now = datetime.now()
-        run_id = now.strftime('%Y-%m-%d_%H%M%S')
-        date_stamp = now.strftime('%Y-%m-%d')
-        
-        # Run analysis
-        analyzed_count = process_upload_csv_with_save(
-            infile=infile,
-            mode=mode_str,
-            ebay_fee_pct=ebay_fee_pct,
-            payment_fee_pct=payment_fee_pct,
-            shipping_flat=shipping_flat,
-            run_id=run_id,
-            no_cache=no_cache
-        )
-        print()
-        
-        # Check if analyzed 0 items
-        if analyzed_count == 0:
-            print("=" * 80)
-            print("⚠️  WARNING: Analysis processed 0 items!")
-            print("=" * 80)
-            print()
-            if not allow_empty:
-                print("Exiting with error code. Use --allow-empty to generate report anyway.")
-                print("=" * 80)
-                sys.exit(1)
-            else:
-                print("Continuing because --allow-empty flag was set.")
-                print("=" * 80)
-                print()
-        
-        # Export CSVs
-        print("Exporting CSVs (run-scoped)...")
-        
-        passed_csv = os.path.join(outdir, f"passed-{date_stamp}.csv")
-        view_deals(
-            top=0,
-            mode_filter=mode_str,
-            run_id_filter=run_id,
-            ebay_fee_pct=ebay_fee_pct,
-            payment_fee_pct=payment_fee_pct,
-            shipping_flat=shipping_flat,
-            export_csv=passed_csv,
-            recalc=True,
-            quiet=True
-        )
-        print(f"✓ Exported passed deals to: {passed_csv}")
-        
-        nearmiss_csv = os.path.join(outdir, f"nearmiss-{date_stamp}.csv")
-        view_deals(
-            top=0,
-            mode_filter=mode_str,
-            run_id_filter=run_id,
-            ebay_fee_pct=ebay_fee_pct,
-            payment_fee_pct=payment_fee_pct,
-            shipping_flat=shipping_flat,
-            export_csv=nearmiss_csv,
-            near_miss=True,
-            recalc=True,
-            quiet=True
-        )
-        print(f"✓ Exported near-miss deals to: {nearmiss_csv}")
-        
-        all_csv = os.path.join(outdir, f"all-{date_stamp}.csv")
-        view_deals(
-            top=0,
-            mode_filter=mode_str,
-            run_id_filter=run_id,
-            ebay_fee_pct=ebay_fee_pct,
-            payment_fee_pct=payment_fee_pct,
-            shipping_flat=shipping_flat,
-            export_csv=all_csv,
-            show_all=True,
-            recalc=True,
-            quiet=True
-        )
-        print(f"✓ Exported all deals to: {all_csv}")
-        
-        print()
-        print("=" * 80)
-        print("Analysis complete!")
-        print(f"Run ID: {run_id}")
-        print(f"Items analyzed: {analyzed_count}")
-        print(f"Output directory: {outdir}")
-        print("=" * 80)
-    elif args.command == 'report':
-        # Report command: run scan then export CSVs
-        from datetime import datetime
-        
-        mode_str = getattr(args, 'mode', 'highticket')
-        category_str = getattr(args, 'category', 'Tools')
-        limit_int = getattr(args, 'limit', 120)
-        brands_str = getattr(args, 'brands', None)
-        stream_flag = getattr(args, 'stream', False)
-        ebay_fee_pct = getattr(args, 'ebay_fee_pct', EBAY_FEE_PCT)
-        payment_fee_pct = getattr(args, 'payment_fee_pct', PAYMENT_FEE_PCT)
-        shipping_flat = getattr(args, 'shipping_flat', SHIPPING_FLAT)
-        outdir = getattr(args, 'outdir', 'data/reports')
-        allow_empty = getattr(args, 'allow_empty', False)
-        
-        # Create output directory
-        os.makedirs(outdir, exist_ok=True)
-        
-        # Generate run_id and date stamp
-        now = datetime.now()
-        run_id = now.strftime('%Y-%m-%d_%H%M%S')
-        date_stamp = now.strftime('%Y-%m-%d')
-        
-        print("=" * 80)
-        print(f"Daily Report Generation - {date_stamp}")
-        print(f"Run ID: {run_id}")
-        print(f"Mode: {mode_str} | Category: {category_str} | Limit: {limit_int}")
-        if brands_str:
-            print(f"Brands: {brands_str}")
-        print(f"Fee settings: ebay_fee_pct={ebay_fee_pct:.4f}, payment_fee_pct={payment_fee_pct:.4f}, shipping_flat=${shipping_flat:.2f}")
-        no_cache_flag = getattr(args, 'no_cache', False)
-        if no_cache_flag:
-            print("[CACHE] bypassed (no-cache enabled)")
-        print("=" * 80)
-        print()
-        
-        # Step 1: Run scan
-        print("Step 1: Running scan...")
-        analyzed_count = process_woot_mode_with_save(
-            category=category_str,
-            limit=limit_int,
-            resume=False,
-            stream=stream_flag,
-            brands=brands_str,
-            mode=mode_str,
-            ebay_fee_pct=ebay_fee_pct,
-            payment_fee_pct=payment_fee_pct,
-            shipping_flat=shipping_flat,
-            run_id=run_id,
-            no_cache=getattr(args, 'no_cache', False)
-        )
-        print()
-        
-        # Check if scan analyzed 0 items
-        if analyzed_count == 0:
-            print("=" * 80)
-            print("⚠️  WARNING: Scan analyzed 0 items!")
-            print("=" * 80)
-            print()
-            print("The report may contain data from previous runs, not from this scan.")
-            print("This usually means:")
-            print("  - The Woot feed returned no items matching your filters")
-            print("  - All items were filtered out (denylist, brand filter, etc.)")
-            print("  - The feed is empty or unavailable")
-            print()
-            if not allow_empty:
-                print("Exiting with error code. Use --allow-empty to generate report anyway.")
-                print("=" * 80)
-                sys.exit(1)
-            else:
-                print("Continuing because --allow-empty flag was set.")
-                print("=" * 80)
-                print()
-        
-        # Step 2: Export CSVs
-        print("Step 2: Exporting CSVs (run-scoped)...")
-        
-        # Export passed.csv (quiet mode to suppress verbose output)
-        passed_csv = os.path.join(outdir, f"passed-{date_stamp}.csv")
-        view_deals(
-            top=0,  # No limit
-            mode_filter=mode_str,
-            run_id_filter=run_id,
-            ebay_fee_pct=ebay_fee_pct,
-            payment_fee_pct=payment_fee_pct,
-            shipping_flat=shipping_flat,
-            export_csv=passed_csv,
-            recalc=True,
-            quiet=True
-        )
-        print(f"✓ Exported passed deals to: {passed_csv}")
-        
-        # Export nearmiss.csv (quiet mode)
-        nearmiss_csv = os.path.join(outdir, f"nearmiss-{date_stamp}.csv")
-        view_deals(
-            top=0,  # No limit
-            mode_filter=mode_str,
-            run_id_filter=run_id,
-            ebay_fee_pct=ebay_fee_pct,
-            payment_fee_pct=payment_fee_pct,
-            shipping_flat=shipping_flat,
-            export_csv=nearmiss_csv,
-            near_miss=True,
-            recalc=True,
-            quiet=True
-        )
-        print(f"✓ Exported near-miss deals to: {nearmiss_csv}")
-        
-        # Export all.csv (quiet mode)
-        all_csv = os.path.join(outdir, f"all-{date_stamp}.csv")
-        view_deals(
-            top=0,  # No limit
-            mode_filter=mode_str,
-            run_id_filter=run_id,
-            ebay_fee_pct=ebay_fee_pct,
-            payment_fee_pct=payment_fee_pct,
-            shipping_flat=shipping_flat,
-            export_csv=all_csv,
-            show_all=True,
-            recalc=True,
-            quiet=True
-        )
-        print(f"✓ Exported all deals to: {all_csv}")
-        
-        print()
-        print("=" * 80)
-        print("Report generation complete!")
-        print(f"Run ID: {run_id}")
-        print(f"Items analyzed: {analyzed_count}")
-        print(f"Output directory: {outdir}")
-        print(f"Files created:")
-        print(f"  - {passed_csv}")
-        print(f"  - {nearmiss_csv}")
-        print(f"  - {all_csv}")
-        print("=" * 80)
+    handler = COMMAND_HANDLERS.get(args.command)
+    if handler is not None:
+        handler(args)
     elif hasattr(args, 'mode') and args.mode == 'woot':
         # Backward compatibility: map "woot" to scan (positional mode, not --mode option)
-        resume_flag = getattr(args, 'resume', False)
-        stream_flag = getattr(args, 'stream', False)  # Backward compat doesn't have --stream, defaults to False
-        brands_str = getattr(args, 'brands', None)
+        resume_flag = arg_values.get('resume', False)
+        stream_flag = arg_values.get('stream', False)  # Backward compat doesn't have --stream, defaults to False
+        brands_str = arg_values.get('brands', None)
         # For backward compat positional mode, default to conservative mode (--mode option not available)
         mode_str = 'conservative'
         process_woot_mode_with_save(category=args.category, limit=args.limit, resume=resume_flag, stream=stream_flag, brands=brands_str, mode=mode_str, no_cache=False)
@@ -4425,8 +4693,8 @@ def main():
         process_watchlist_mode()
     elif args.command is None and (not hasattr(args, 'mode') or args.mode is None):
         # No command specified - default to scan (backward compatibility)
-        resume_flag = getattr(args, 'resume', False)
-        brands_str = getattr(args, 'brands', None)
+        resume_flag = arg_values.get('resume', False)
+        brands_str = arg_values.get('brands', None)
         # For backward compat, default to conservative mode
         mode_str = 'conservative'
         process_woot_mode_with_save(category=args.category, limit=args.limit, resume=resume_flag, brands=brands_str, mode=mode_str, no_cache=False)